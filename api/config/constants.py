@@ -2,6 +2,8 @@
 Configuration constants and settings for the Devpost scraper
 """
 
+import os
+
 # Common Devpost tab patterns
 COMMON_TABS = {
     'overview': '',
@@ -80,6 +82,119 @@ DEFAULT_HEADERS = {
     'Connection': 'keep-alive',
 }
 
+# Shared HTTP client settings (connection pooling / keep-alive)
+HTTP_POOL_CONNECTIONS = 10   # Number of per-host connection pools to keep
+HTTP_POOL_MAXSIZE = 10       # Max keep-alive connections per host
+HTTP_POOL_BLOCK = False      # Block instead of opening extra connections when a pool is full
+HTTP_TIMEOUT = 10            # Default request timeout in seconds
+
+# Scraped pages are streamed and checked before they reach the parser
+HTTP_MAX_PAGE_BYTES = 5 * 1024 * 1024          # Body size cap for scraped HTML pages
+HTTP_OVERFLOW_POLICY = 'truncate'              # Past the cap: 'truncate' (keep the first bytes) or 'abort'
+HTML_CONTENT_TYPES = ['text/html', 'application/xhtml+xml']  # Anything else is rejected unread
+
+# Per-host rate limits: host pattern -> (requests per second, burst size)
+# Rates are ceilings; the limiter backs off on 429 / Retry-After / X-RateLimit-* and recovers on success
+RATE_LIMITS = {
+    'devpost.com': (2.0, 4),
+    '*.devpost.com': (2.0, 4),
+    'api.github.com': (0.5, 2),
+    'default': (4.0, 8)
+}
+RATE_LIMIT_MIN_RATE = 0.1    # Never back off below this many requests per second
+HTTP_MAX_RETRIES = 2         # Retries for a 429 response after honouring Retry-After
+
+# Persistent on-disk HTTP response cache
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_DIR = os.path.join('hackathon-data', '.http_cache')
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024   # Least recently used entries are evicted past this size
+
+# Freshness per URL class in seconds; stale entries are revalidated with ETag / Last-Modified
+HTTP_CACHE_TTLS = {
+    'devpost_search': 6 * 3600,          # devpost.com/software/search
+    'devpost_project': 30 * 24 * 3600,   # devpost.com/software/<project>
+    'hackathon_page': 24 * 3600,         # <event>.devpost.com/...
+    'github_api': 3600,                  # api.github.com
+    'default': 3600
+}
+
+# HTML parser backend: 'html.parser' (always available), 'lxml' or 'selectolax'
+# Unavailable backends fall back to html.parser; compare them with test/bench_parsers.py
+HTML_PARSER = 'html.parser'
+
+# Async scraping engine
+SCRAPER_MAX_CONCURRENCY_PER_HOST = 4  # Concurrent page fetches allowed per host
+GALLERY_MAX_PAGES = 20                # Project-gallery pages crawled per event
+GALLERY_WINNERS_PARAMS = {'winners': 'true'}  # Gallery query filter for winning submissions only
+PARSE_PROCESSES = None                # Page-parsing worker processes (None = CPU count, 0 = parse in threads)
+DEVPOST_SEARCH_PAGE_SIZE = 24         # Results on a full Devpost search page; shorter pages are the last
+
+# Fields DevpostScraper.extract_structured_data can build
+STRUCTURED_FIELDS = ['title', 'headings', 'links', 'text_content', 'images', 'tables', 'forms']
+
+# rules.json keeps only each tab's text; structured fields (minus text_content, which
+# duplicates the text) go to a gzip-compressed sidecar when RULES_SAVE_STRUCTURED is on
+RULES_SAVE_STRUCTURED = True
+RULES_STRUCTURED_FIELDS = ['title', 'headings', 'links', 'images', 'tables', 'forms']
+RULES_STRUCTURED_FILE = 'rules_structured.json.gz'
+
+# Per-event manifest of saved winner projects (URL, file, content hash, ETag, scraped_at)
+EVENT_MANIFEST_FILE = 'manifest.json'
+
+# Crawl journal: per-event / per-URL progress of past-hackathon crawls, so an
+# interrupted crawl resumes where it stopped
+CRAWL_JOURNAL_FILE = os.path.join('hackathon-data', 'crawl_journal.json')
+
+# Indexed SQLite store of every scraped past-hackathon project
+# (event folders are imported into it on first load)
+CORPUS_DB_FILE = os.path.join('hackathon-data', 'corpus.db')
+
+# Packed, memory-mapped copy of the corpus store's project summaries, rebuilt
+# whenever the store changes; idea generation samples winners from it
+CORPUS_PACK_FILE = os.path.join('hackathon-data', 'corpus.pack')
+IDEA_SAMPLE_SIZE = 100  # Past winners shown to Claude per generation
+
+# Process-wide LRU of decoded rules files, event project lists and pack records,
+# invalidated when the underlying file (or corpus store) changes
+LOAD_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Approximate decoded size kept in memory
+
+# Opt-in compression for the JSON artifacts IdeaGenerator and ClaudeAnalyzer write
+# under hackathon-data: None (plain JSON), 'gzip' or 'zstd' (needs the zstandard
+# package, falls back to gzip). Reads handle every variant regardless of this setting
+STORAGE_CODEC = None
+STORAGE_COMPRESSION_LEVELS = {'gzip': 6, 'zstd': 10}
+
+# Devpost site chrome dropped from project data before it is saved
+CHROME_IMAGE_PREFIXES = [
+    'https://d2dmyh35ffsxbl.cloudfront.net/assets/',        # Devpost logos and UI assets
+    'https://cdn.prod.website-files.com/',                   # Devpost marketing-site artwork
+]
+CHROME_LINK_URLS = [
+    'https://devpost.team', 'https://twitter.com/devpost', 'https://www.facebook.com/devposthacks',
+    'https://www.linkedin.com/company/devpost', 'https://discord.com/invite/HP4BhW3hnp',
+]
+CHROME_TEXT_PATTERNS = [
+    r'Join a hackathon Devpost Participate in our public hackathons .*?Common questions and support documentation',
+    r'Log in Sign up ',
+    r'Log in or sign up for Devpost to join the conversation\..*$',
+    r'Devpost About Careers Contact Help Hackathons Browse hackathons .*$',
+]
+
+# Background pre-warmer: keeps the default past hackathons scraped and fresh
+PREWARM_ENABLED = True
+PREWARM_INTERVAL = 30 * 60            # Seconds between passes over the default hackathons
+PREWARM_REFRESH_AFTER = 7 * 24 * 3600  # Refresh an event whose manifest is older than this
+PREWARM_IDLE_SECONDS = 60             # Hold off this long after an interactive request
+PREWARM_POLL_SECONDS = 5              # How often to re-check for idle budget
+
+# GitHub search backend (set GITHUB_TOKEN in the environment for authenticated search and GraphQL batching)
+GITHUB_API_BASE = 'https://api.github.com'
+GITHUB_GRAPHQL_BATCH_SIZE = 5   # Strategy queries sent per GraphQL request
+
+# Permanent store of Devpost project URL -> submission date / full description
+# (both are fixed once a project is submitted, so entries never expire)
+PROJECT_DETAILS_STORE = os.path.join('hackathon-data', 'project_details.json')
+
 # Navigation selectors for tab detection
 NAV_SELECTORS = [
     'nav a', '.nav a', '.navigation a', '.menu a',
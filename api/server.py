@@ -7,15 +7,30 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
+from contextlib import asynccontextmanager
 import asyncio
 import json
+from api.config.constants import PREWARM_ENABLED
 from api.services.idea_generator import IdeaGenerator
+from api.services.corpus_prewarmer import get_corpus_prewarmer
 from api.services.similarity_reports import HackathonFraudDetector
+from api.services.github_search import get_github_search
+from api.utils.http_client import get_http_client
+from api.utils.load_cache import get_load_cache
+from api.utils.storage import read_json
 from api.config.settings import CLAUDE_API_KEY, GEMINI_API_KEY
 import anthropic
 import google.generativeai as genai
 
-app = FastAPI(title="Blueprint API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep the default past hackathons scraped in the background
+    if PREWARM_ENABLED:
+        get_corpus_prewarmer().start()
+    yield
+    get_corpus_prewarmer().stop()
+
+app = FastAPI(title="Blueprint API", lifespan=lifespan)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -29,10 +44,12 @@ app.add_middleware(
 class GenerateRequest(BaseModel):
     hackathon_url: str
     past_hackathons: Optional[List[str]] = None
+    refresh_past: bool = False  # Re-check cached past hackathons for new or changed winners
 
-async def generate_ideas_stream(hackathon_url: str, past_hackathons: Optional[List[str]] = None):
+async def generate_ideas_stream(hackathon_url: str, past_hackathons: Optional[List[str]] = None, refresh_past: bool = False):
     """Stream progress updates while generating ideas"""
-    
+    get_corpus_prewarmer().note_interactive()
+
     try:
         # Send initial status
         yield f"data: {json.dumps({'status': 'Initializing...', 'progress': 'Setting up generator'})}\n\n"
@@ -41,7 +58,8 @@ async def generate_ideas_stream(hackathon_url: str, past_hackathons: Optional[Li
         # Create generator
         generator = IdeaGenerator(
             new_hackathon_url=hackathon_url,
-            past_hackathon_urls=past_hackathons
+            past_hackathon_urls=past_hackathons,
+            refresh=refresh_past
         )
         
         yield f"data: {json.dumps({'status': 'Setting up Claude AI...', 'progress': 'Configuring AI'})}\n\n"
@@ -75,26 +93,24 @@ async def generate_ideas_stream(hackathon_url: str, past_hackathons: Optional[Li
         yield f"data: {json.dumps({'status': 'Scraping past hackathon winners...', 'progress': f'Analyzing {len(generator.past_hackathon_urls)} hackathons'})}\n\n"
         await asyncio.sleep(0.1)
         
-        # Scrape past hackathons
-        winners_data = []
+        # Scrape past hackathons (cached ones are only checked, not loaded)
         for i, url in enumerate(generator.past_hackathon_urls, 1):
             yield f"data: {json.dumps({'status': f'Scraping hackathon {i}/{len(generator.past_hackathon_urls)}', 'progress': f'Analyzing {url}'})}\n\n"
             await asyncio.sleep(0.1)
             
-            winners = generator.scrape_past_hackathon_winners(url)
-            if winners:
-                winners_data.append(winners)
+            # Run off the event loop so SSE updates keep flowing while winners are fetched concurrently
+            await asyncio.to_thread(generator.ensure_past_hackathon, url)
         
         yield f"data: {json.dumps({'status': 'Generating ideas with Claude AI...', 'progress': 'Synthesizing winning patterns'})}\n\n"
         await asyncio.sleep(0.1)
         
         # Generate ideas
         try:
-            print(f"[DEBUG] Calling Claude with {len(winners_data)} hackathons of data")
+            print(f"[DEBUG] Calling Claude with {len(generator.past_events)} hackathons of data")
             print(f"[DEBUG] Rules data size: {len(str(rules_data))} chars")
-            print(f"[DEBUG] Winners data size: {len(str(winners_data))} chars")
             
-            ideas = generator.generate_ideas_with_claude(rules_data, winners_data)
+            # Winners are sampled from the packed corpus inside
+            ideas = generator.generate_ideas_with_claude(rules_data)
             print(f"[DEBUG] Claude returned {len(ideas) if ideas else 0} characters")
             
             if not ideas or len(ideas) < 100:
@@ -132,7 +148,7 @@ async def generate_ideas(request: GenerateRequest):
     """Generate hackathon ideas endpoint"""
     print(f"[API] Received request: {request.hackathon_url}")
     return StreamingResponse(
-        generate_ideas_stream(request.hackathon_url, request.past_hackathons),
+        generate_ideas_stream(request.hackathon_url, request.past_hackathons, request.refresh_past),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -145,6 +161,20 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "ok", "message": "Blueprint API is running"}
 
+@app.get("/stats")
+async def get_stats():
+    """Outbound HTTP statistics (connection reuse, rate limiting, disk cache, body limits, GitHub quota), pre-warmer and load cache"""
+    client = get_http_client()
+    return {
+        "http": client.get_stats(),
+        "rate_limits": client.get_rate_limit_stats(),
+        "cache": client.get_cache_stats(),
+        "body_limits": client.get_body_limit_stats(),
+        "github": get_github_search().get_stats(),
+        "prewarmer": get_corpus_prewarmer().get_stats(),
+        "load_cache": get_load_cache().get_stats()
+    }
+
 @app.get("/ideas/{file_path:path}")
 async def get_ideas(file_path: str):
     """Parse and return ideas from the generated file"""
@@ -239,13 +269,11 @@ async def generate_breakdown(request: dict):
         # Get hackathon schedule if available
         schedule_text = ""
         if hackathon_folder and os.path.exists(hackathon_folder):
-            rules_file = os.path.join(hackathon_folder, "rules.json")
-            if os.path.exists(rules_file):
-                with open(rules_file, 'r', encoding='utf-8') as f:
-                    rules_data = json.load(f)
-                    schedule_data = rules_data.get('rules_data', {}).get('schedule', {})
-                    if schedule_data:
-                        schedule_text = schedule_data.get('text', '')
+            rules_data = read_json(os.path.join(hackathon_folder, "rules.json"))
+            if rules_data:
+                schedule_data = rules_data.get('rules_data', {}).get('schedule', {})
+                if schedule_data:
+                    schedule_text = schedule_data.get('text', '')
 
         # Configure Gemini
         genai.configure(api_key=GEMINI_API_KEY)
@@ -351,6 +379,8 @@ class SimilarityRequest(BaseModel):
 
 async def check_similarity_stream(devpost_url: str):
     """Stream similarity check results as they are found"""
+    get_corpus_prewarmer().note_interactive()
+
     try:
         from api.services.devpost_scraper import DevpostScraper
 
@@ -431,11 +461,14 @@ async def check_similarity_stream(devpost_url: str):
         top_strategies = strategies[:min(4, len(strategies))]
 
         # Devpost search FIRST - more relevant for hackathon projects
-        for i, strategy in enumerate(top_strategies, 1):
+        # All strategies are fetched concurrently, then streamed in strategy order
+        yield f"data: {json.dumps({'status': f'Searching Devpost', 'progress': f'Running {len(top_strategies)} strategies concurrently'})}\n\n"
+        devpost_results = await asyncio.to_thread(detector.search_devpost_many, top_strategies, 1)
+
+        for i, (strategy, results) in enumerate(zip(top_strategies, devpost_results), 1):
             yield f"data: {json.dumps({'status': f'Searching Devpost', 'progress': f'Strategy {i}/{len(top_strategies)}: {strategy["query"]}'})}\n\n"
             await asyncio.sleep(0.1)
 
-            results = detector.search_devpost(strategy, max_pages=1)
             for result in results:
                 # Normalize URL for comparison
                 normalized_url = result['url'].lower().strip().rstrip('/').split('?')[0].split('#')[0]
@@ -444,17 +477,17 @@ async def check_similarity_stream(devpost_url: str):
                     seen_urls.add(normalized_url)
                     devpost_count += 1
                     all_projects.append(result)
-                    yield f"data: {json.dumps({'project': result, 'source_progress': f'Devpost: {devpost_count}'})}\n\n"
+                    yield f"data: {json.dumps({'project': result.to_dict(), 'source_progress': f'Devpost: {devpost_count}'})}\n\n"
                     await asyncio.sleep(0.05)
 
-            await asyncio.sleep(0.5)
-
         # GitHub search SECOND - supplementary results
-        for i, strategy in enumerate(top_strategies, 1):
+        # Strategies are searched together (one GraphQL request when GITHUB_TOKEN is set)
+        github_results = await asyncio.to_thread(detector.search_github_many, top_strategies, 3)  # Reduced from 5 to 3
+
+        for i, (strategy, results) in enumerate(zip(top_strategies, github_results), 1):
             yield f"data: {json.dumps({'status': f'Searching GitHub', 'progress': f'Strategy {i}/{len(top_strategies)}: {strategy["query"]}'})}\n\n"
             await asyncio.sleep(0.1)
 
-            results = detector.search_github(strategy, max_results=3)  # Reduced from 5 to 3
             for result in results:
                 # Normalize URL for comparison
                 normalized_url = result['url'].lower().strip().rstrip('/').split('?')[0].split('#')[0]
@@ -463,11 +496,9 @@ async def check_similarity_stream(devpost_url: str):
                     seen_urls.add(normalized_url)
                     github_count += 1
                     all_projects.append(result)
-                    yield f"data: {json.dumps({'project': result, 'source_progress': f'GitHub: {github_count}'})}\n\n"
+                    yield f"data: {json.dumps({'project': result.to_dict(), 'source_progress': f'GitHub: {github_count}'})}\n\n"
                     await asyncio.sleep(0.05)
 
-            await asyncio.sleep(0.5)
-
         # all_projects already has duplicates removed via seen_urls tracking above
         unique_projects = all_projects
 
@@ -490,7 +521,7 @@ async def check_similarity_stream(devpost_url: str):
                     proj['ai_reasoning'] = ai_analysis['project_scores'][i]['reasoning']
 
                     # Stream the updated project with similarity score
-                    yield f"data: {json.dumps({'project_update': proj, 'analysis_progress': f'{i+1}/{len(projects_to_analyze)}'})}\n\n"
+                    yield f"data: {json.dumps({'project_update': proj.to_dict(), 'analysis_progress': f'{i+1}/{len(projects_to_analyze)}'})}\n\n"
                     await asyncio.sleep(0.05)
 
             yield f"data: {json.dumps({'status': 'Complete', 'result': {'fraud_risk': ai_analysis.get('fraud_risk'), 'originality_score': ai_analysis.get('originality_score'), 'total_projects': len(unique_projects), 'submission_date': submission_date, 'project_name': project_name}})}\n\n"
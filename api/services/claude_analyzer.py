@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Dict, List, Any
 import anthropic
 from api.utils.data_utils import create_summary_data, create_master_data, create_readable_summary
+from api.utils.storage import read_json, resolve_codec, stored_path, write_json
 
 
 class ClaudeAnalyzer:
@@ -51,8 +52,7 @@ class ClaudeAnalyzer:
         
         # Save summary
         summary_file = os.path.join(self.analysis_dir, "event_summary.json")
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        write_json(summary_file, summary_data, codec=resolve_codec())
         
         # Create human-readable summary
         summary_text = create_readable_summary(summary_data, self.scraper.event_name)
@@ -70,18 +70,16 @@ class ClaudeAnalyzer:
         
         # Save master data file
         master_file = os.path.join(self.analysis_dir, "master_data.json")
-        with open(master_file, 'w', encoding='utf-8') as f:
-            json.dump(master_data, f, indent=2, ensure_ascii=False)
+        write_json(master_file, master_data, codec=resolve_codec())
         
         # Create individual section files for focused analysis
         for section_name, section_data in master_data["sections"].items():
             section_file = os.path.join(self.analysis_dir, f"{section_name}_analysis.json")
-            with open(section_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "section": section_name,
-                    "data": section_data,
-                    "analysis_notes": self.get_analysis_notes(section_name)
-                }, f, indent=2, ensure_ascii=False)
+            write_json(section_file, {
+                "section": section_name,
+                "data": section_data,
+                "analysis_notes": self.get_analysis_notes(section_name)
+            }, codec=resolve_codec())
     
     def get_analysis_notes(self, section_name: str) -> str:
         """Get analysis notes for each section"""
@@ -308,12 +306,11 @@ Generated on: {datetime.now().isoformat()}
         """Perform comprehensive analysis using Claude"""
         # Load master data
         master_data_file = os.path.join(self.analysis_dir, "master_data.json")
-        if not os.path.exists(master_data_file):
+        if not stored_path(master_data_file):
             print("❌ Master data file not found")
             return {}
         
-        with open(master_data_file, 'r', encoding='utf-8') as f:
-            master_data = json.load(f)
+        master_data = read_json(master_data_file)
         
         # Load the comprehensive analysis prompt
         prompt_file = os.path.join(self.analysis_dir, "prompt_comprehensive_analysis.txt")
@@ -384,12 +381,11 @@ DETAILED DATA:
         """Analyze winning projects specifically"""
         # Load winning projects data
         winning_projects_file = os.path.join(self.scraper.output_dir, "winning_projects", "all_winning_projects.json")
-        if not os.path.exists(winning_projects_file):
+        if not stored_path(winning_projects_file):
             print("❌ No winning projects data found")
             return {}
         
-        with open(winning_projects_file, 'r', encoding='utf-8') as f:
-            winning_projects = json.load(f)
+        winning_projects = read_json(winning_projects_file)
         
         prompt = """
 # Winning Projects Deep Dive Analysis
@@ -445,12 +441,11 @@ WINNING PROJECTS DATA:
         """Perform trend analysis using Claude"""
         # Load summary data
         summary_file = os.path.join(self.analysis_dir, "event_summary.json")
-        if not os.path.exists(summary_file):
+        if not stored_path(summary_file):
             print("❌ Event summary not found")
             return {}
         
-        with open(summary_file, 'r', encoding='utf-8') as f:
-            summary_data = json.load(f)
+        summary_data = read_json(summary_file)
         
         prompt = """
 # Hackathon Trend Analysis
@@ -505,12 +500,11 @@ HACKATHON SUMMARY DATA:
         """Perform comparative analysis using Claude"""
         # Load master data for comparison
         master_data_file = os.path.join(self.analysis_dir, "master_data.json")
-        if not os.path.exists(master_data_file):
+        if not stored_path(master_data_file):
             print("❌ Master data file not found")
             return {}
         
-        with open(master_data_file, 'r', encoding='utf-8') as f:
-            master_data = json.load(f)
+        master_data = read_json(master_data_file)
         
         prompt = """
 # Comparative Hackathon Analysis
@@ -565,12 +559,11 @@ HACKATHON DATA FOR COMPARISON:
         """Generate creative hackathon ideas based on the data"""
         # Load master data for comprehensive analysis
         master_data_file = os.path.join(self.analysis_dir, "master_data.json")
-        if not os.path.exists(master_data_file):
+        if not stored_path(master_data_file):
             print("[ERROR] Master data file not found")
             return {}
         
-        with open(master_data_file, 'r', encoding='utf-8') as f:
-            master_data = json.load(f)
+        master_data = read_json(master_data_file)
         
         prompt = f"""
 # Creative Hackathon Ideas Based on {self.scraper.event_name.replace('_', ' ').title()}
@@ -639,8 +632,7 @@ DETAILED DATA:
         """Save analysis result to files"""
         # Save as JSON
         analysis_file = os.path.join(self.analysis_dir, f"claude_{analysis_type}_analysis.json")
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis_result, f, indent=2, ensure_ascii=False)
+        write_json(analysis_file, analysis_result, codec=resolve_codec())
         
         # Save as readable text
         analysis_txt_file = os.path.join(self.analysis_dir, f"claude_{analysis_type}_analysis.txt")
@@ -672,8 +664,7 @@ DETAILED DATA:
         # Save combined results
         if all_results:
             combined_file = os.path.join(self.analysis_dir, "all_claude_analyses.json")
-            with open(combined_file, 'w', encoding='utf-8') as f:
-                json.dump(all_results, f, indent=2, ensure_ascii=False)
+            combined_file = write_json(combined_file, all_results, codec=resolve_codec())
             
             print(f"\n[SUCCESS] All analyses completed! Results saved to: {combined_file}")
         
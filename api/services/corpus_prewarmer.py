@@ -0,0 +1,152 @@
+"""
+Background pre-warmer for the default past-hackathon corpus
+
+Runs in a daemon thread next to the API server. Each pass goes through
+IdeaGenerator.get_default_hackathons: missing (or interrupted) events are
+scraped and events whose manifest is older than PREWARM_REFRESH_AFTER are
+refreshed. Before each event it waits until no interactive request has run
+for PREWARM_IDLE_SECONDS and the Devpost rate-limit buckets are idle, so
+it only spends budget that interactive requests aren't using.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List
+
+from api.config.constants import (
+    PREWARM_INTERVAL, PREWARM_REFRESH_AFTER, PREWARM_IDLE_SECONDS, PREWARM_POLL_SECONDS
+)
+from api.services.idea_generator import IdeaGenerator
+from api.utils.event_manifest import EventManifest
+from api.utils.http_client import get_http_client
+
+
+class CorpusPrewarmer:
+    def __init__(self, hackathon_urls: List[str] = None, interval=PREWARM_INTERVAL,
+                 refresh_after=PREWARM_REFRESH_AFTER, idle_seconds=PREWARM_IDLE_SECONDS):
+        self.hackathon_urls = hackathon_urls
+        self.interval = interval
+        self.refresh_after = refresh_after
+        self.idle_seconds = idle_seconds
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._last_interactive = None
+        self.counters = {'passes': 0, 'scraped': 0, 'refreshed': 0, 'fresh': 0, 'errors': 0}
+        self.current = None
+        self.last_pass_at = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='corpus-prewarmer', daemon=True)
+        self._thread.start()
+        print("🔥 Corpus pre-warmer started")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def note_interactive(self):
+        """Called by request handlers: interactive work gets the rate-limit budget first"""
+        with self._lock:
+            self._last_interactive = time.monotonic()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"⚠️ Pre-warm pass failed: {e}")
+                self._count('errors')
+            self._stop.wait(self.interval)
+
+    def run_once(self):
+        """One pass over the default hackathons"""
+        generator = IdeaGenerator(new_hackathon_url='', past_hackathon_urls=self.hackathon_urls)
+        urls = generator.past_hackathon_urls or generator.get_default_hackathons()
+
+        for url in urls:
+            action = self.action_for(generator, url)
+            if action == 'fresh':
+                self._count('fresh')
+                continue
+            if not self._wait_for_idle(url):
+                return
+
+            with self._lock:
+                self.current = url
+            try:
+                print(f"🔥 Pre-warming ({action}): {url}")
+                generator.scrape_past_hackathon_winners(url, refresh=(action == 'refresh'))
+                self._count('scraped' if action == 'scrape' else 'refreshed')
+            except Exception as e:
+                print(f"⚠️ Pre-warm of {url} failed: {e}")
+                self._count('errors')
+            finally:
+                with self._lock:
+                    self.current = None
+
+        with self._lock:
+            self.counters['passes'] += 1
+            self.last_pass_at = datetime.now().isoformat()
+
+    def action_for(self, generator: IdeaGenerator, hackathon_url: str) -> str:
+        """'scrape' a missing or interrupted event, 'refresh' a stale one, or leave a 'fresh' one"""
+        folder = os.path.join(generator.base_data_dir, generator._extract_hackathon_name(hackathon_url))
+        if not os.path.isdir(folder) or generator.journal.is_in_progress(hackathon_url):
+            return 'scrape'
+        manifest = EventManifest.load(folder)
+        if manifest is None:
+            # Folder scraped before manifests existed: backfill one from the saved
+            # files (dated by their mtimes) instead of re-crawling the whole event
+            manifest = EventManifest.from_folder(folder, hackathon_url)
+            if not manifest.projects:
+                return 'scrape'
+            manifest.save(touch=False)
+        updated_at = manifest.updated_at
+        if updated_at is None or datetime.now() - updated_at > timedelta(seconds=self.refresh_after):
+            return 'refresh'
+        return 'fresh'
+
+    def _wait_for_idle(self, hackathon_url: str) -> bool:
+        """Block until the budget is idle; False if the pre-warmer was stopped meanwhile"""
+        limiter = get_http_client().limiter
+        while not self._stop.is_set():
+            with self._lock:
+                last = self._last_interactive
+            quiet = last is None or time.monotonic() - last >= self.idle_seconds
+            if quiet and limiter.has_idle_budget(hackathon_url) and limiter.has_idle_budget('https://devpost.com'):
+                return True
+            self._stop.wait(PREWARM_POLL_SECONDS)
+        return False
+
+    def _count(self, counter: str):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.counters)
+            stats['current'] = self.current
+            stats['last_pass_at'] = self.last_pass_at
+        stats['running'] = bool(self._thread and self._thread.is_alive())
+        return stats
+
+
+_prewarmer = None
+_prewarmer_lock = threading.Lock()
+
+
+def get_corpus_prewarmer() -> CorpusPrewarmer:
+    """Return the process-wide corpus pre-warmer"""
+    global _prewarmer
+    if _prewarmer is None:
+        with _prewarmer_lock:
+            if _prewarmer is None:
+                _prewarmer = CorpusPrewarmer()
+    return _prewarmer
@@ -3,29 +3,44 @@ Main Devpost scraper class
 """
 
 import requests
-from bs4 import BeautifulSoup
+import asyncio
+import re
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-import time
 from typing import Dict, List, Any
+from urllib.parse import urlencode, urlparse
 from api.config.constants import (
     COMMON_TABS, TAB_MAPPING, WINNER_INDICATORS,
-    DEFAULT_HEADERS, NAV_SELECTORS, ALTERNATIVE_TABS
+    DEFAULT_HEADERS, NAV_SELECTORS, ALTERNATIVE_TABS,
+    SCRAPER_MAX_CONCURRENCY_PER_HOST, STRUCTURED_FIELDS,
+    HTTP_MAX_PAGE_BYTES, HTML_CONTENT_TYPES, GALLERY_MAX_PAGES, GALLERY_WINNERS_PARAMS
 )
 
 from api.utils.data_utils import extract_main_topics, analyze_technologies
+from api.utils.html_parser import parse_html
+from api.utils.http_client import get_http_client
+from api.utils.parse_pool import get_parse_pool, parse_gallery_page, parse_project_page, reset_parse_pool
+from api.utils.project_extractor import extract_project_data, normalize_page_text
 
 
 class DevpostScraper:
-    def __init__(self, devpost_url):
+    def __init__(self, devpost_url, parser=None):
         self.devpost_url = devpost_url.rstrip('/')
+        self.parser = parser  # HTML parser backend, defaults to HTML_PARSER
         self.base_url = self.devpost_url
         self.headers = DEFAULT_HEADERS
         self.scraped_data = {}
         self.tabs = {}
         self.event_name = ""
 
+        # Documents fetched during this scraper session, keyed by URL (None = fetch failed)
+        self.page_store = {}
+        # ETag / Last-Modified of each successfully fetched page, for manifests
+        self.page_meta = {}
+
         # Extract event name from URL
         self.extract_event_name()
 
@@ -56,9 +71,25 @@ class DevpostScraper:
             self.event_name = "devpost_event"
     
     def get_page_content(self, url):
-        """Fetch page content with error handling"""
+        """Fetch page content with error handling - each URL is fetched once per session"""
+        if url in self.page_store:
+            return self.page_store[url]
+
+        soup = self._fetch_page(url)
+        self.page_store[url] = soup
+        return soup
+
+    def _fetch_page(self, url):
+        content = self.fetch_raw(url)
+        return parse_html(content, self.parser) if content is not None else None
+
+    def fetch_raw(self, url):
+        """Fetch a page's body bytes (None on HTTP errors) without parsing it"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = get_http_client().get(
+                url, headers=self.headers, timeout=10,
+                max_bytes=HTTP_MAX_PAGE_BYTES, content_types=HTML_CONTENT_TYPES
+            )
 
             # Check for 403, 404, and other HTTP errors
             if response.status_code in [403, 404]:
@@ -66,10 +97,38 @@ class DevpostScraper:
                 return None
 
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            self.page_meta[url] = self._validators(response)
+            return response.content
         except requests.RequestException as e:
             print(f"❌ Error fetching {url}: {e}")
             return None
+
+    def _validators(self, response):
+        return {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+
+    def fetch_if_modified(self, url, etag=None, last_modified=None):
+        """Conditionally re-fetch a page, bypassing the disk cache
+
+        Returns None on 304 Not Modified; raises requests.RequestException on errors.
+        """
+        headers = dict(self.headers)
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        response = get_http_client().get(
+            url, headers=headers, timeout=10, use_cache=False,
+            max_bytes=HTTP_MAX_PAGE_BYTES, content_types=HTML_CONTENT_TYPES
+        )
+        self.page_meta[url] = self._validators(response)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+
+        soup = parse_html(response.content, self.parser)
+        self.page_store[url] = soup
+        return soup
     
     def is_valid_page(self, soup):
         """Check if a page is valid (not 404 or redirect)"""
@@ -104,15 +163,14 @@ class DevpostScraper:
             script.decompose()
         
         # Get text and clean it up
-        text = soup.get_text()
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text
+        return normalize_page_text(soup.get_text())
     
-    def detect_available_tabs(self):
-        """Auto-detect available tabs from the main page"""
+    def detect_available_tabs(self, tab_names=None):
+        """Auto-detect available tabs from the main page
+
+        Args:
+            tab_names: Targeted mode - only detect and probe these tabs (default: all)
+        """
         print("Detecting available tabs...")
         
         soup = self.get_page_content(self.base_url)
@@ -151,94 +209,121 @@ class DevpostScraper:
                             detected_tabs[tab_key] = clean_href
                             break
         
+        if tab_names is not None:
+            detected_tabs = {name: path for name, path in detected_tabs.items() if name in tab_names}
+
         # Also look for common Devpost tab patterns in the URL structure
+        candidate_paths = {}
         for tab_name, tab_path in COMMON_TABS.items():
+            if tab_names is not None and tab_name not in tab_names:
+                continue
             if tab_name not in detected_tabs:  # Only test if not already detected
-                # Try primary path first
-                test_url = self.base_url + tab_path
-                test_soup = self.get_page_content(test_url)
-                if test_soup and self.is_valid_page(test_soup):
-                    detected_tabs[tab_name] = tab_path
-                else:
-                    # Try alternative paths if primary fails
-                    if tab_name in ALTERNATIVE_TABS:
-                        for alt_path in ALTERNATIVE_TABS[tab_name]:
-                            if alt_path != tab_path:  # Don't retry the same path
-                                test_url = self.base_url + alt_path
-                                test_soup = self.get_page_content(test_url)
-                                if test_soup and self.is_valid_page(test_soup):
-                                    detected_tabs[tab_name] = alt_path
-                                    break
-        
+                # Try primary path first, then alternatives (without retrying the same path)
+                alternatives = [p for p in ALTERNATIVE_TABS.get(tab_name, []) if p != tab_path]
+                candidate_paths[tab_name] = [tab_path] + alternatives
+
+        # Probe tabs concurrently; each tab stops at its first working path
+        with ThreadPoolExecutor(max_workers=SCRAPER_MAX_CONCURRENCY_PER_HOST) as executor:
+            futures = {
+                tab_name: executor.submit(self.probe_tab, paths)
+                for tab_name, paths in candidate_paths.items()
+            }
+            for tab_name, future in futures.items():
+                found_path = future.result()
+                if found_path is not None:
+                    detected_tabs[tab_name] = found_path
+
         self.tabs = detected_tabs
         print(f"Detected {len(detected_tabs)} tabs: {list(detected_tabs.keys())}")
         return detected_tabs
     
-    def extract_structured_data(self, soup, tab_name):
-        """Extract structured data based on tab type"""
-        data = {
-            'title': '',
-            'headings': [],
-            'links': [],
-            'text_content': '',
-            'images': [],
-            'tables': [],
-            'forms': []
+    def probe_tab(self, paths):
+        """Return the first path that exists and holds a valid page, or None"""
+        for path in paths:
+            url = self.base_url + path
+            # Lightweight existence check before committing to a full download and parse
+            if url not in self.page_store and not get_http_client().probe(url, headers=self.headers):
+                continue
+            soup = self.get_page_content(url)
+            if soup and self.is_valid_page(soup):
+                return path
+        return None
+
+    def extract_structured_data(self, soup, tab_name, fields=None):
+        """Extract structured data based on tab type
+
+        Only the requested fields (see STRUCTURED_FIELDS) are built; by
+        default all of them are.
+        """
+        fields = STRUCTURED_FIELDS if fields is None else fields
+        unknown = [field for field in fields if field not in STRUCTURED_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown structured fields: {unknown} (choose from {STRUCTURED_FIELDS})")
+
+        extractors = {
+            'title': self._extract_title,
+            'headings': self._extract_headings,
+            'links': self._extract_links,
+            'text_content': self.extract_text_content,
+            'images': self._extract_images,
+            'tables': self._extract_tables,
+            'forms': self._extract_forms
         }
-        
+
         if not soup:
-            return data
-        
-        # Extract title
+            return {field: '' if field in ('title', 'text_content') else [] for field in fields}
+
+        # text_content strips scripts from the tree, so it always runs last
+        data = {field: extractors[field](soup) for field in fields if field != 'text_content'}
+        if 'text_content' in fields:
+            data['text_content'] = self.extract_text_content(soup)
+
+        return {field: data[field] for field in fields}
+
+    def _extract_title(self, soup):
         title_tag = soup.find('title')
-        if title_tag:
-            data['title'] = title_tag.get_text().strip()
-        
-        # Extract headings
+        return title_tag.get_text().strip() if title_tag else ''
+
+    def _extract_headings(self, soup):
         headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        data['headings'] = [{'tag': h.name, 'text': h.get_text().strip()} for h in headings]
-        
-        # Extract links
+        return [{'tag': h.name, 'text': h.get_text().strip()} for h in headings]
+
+    def _extract_links(self, soup):
         links = soup.find_all('a', href=True)
-        data['links'] = [{'text': link.get_text().strip(), 'href': link['href']} for link in links]
-        
-        # Extract images
+        return [{'text': link.get_text().strip(), 'href': link['href']} for link in links]
+
+    def _extract_images(self, soup):
         images = soup.find_all('img')
-        data['images'] = [{'src': img.get('src', ''), 'alt': img.get('alt', '')} for img in images]
-        
-        # Extract tables
-        tables = soup.find_all('table')
-        for table in tables:
+        return [{'src': img.get('src', ''), 'alt': img.get('alt', '')} for img in images]
+
+    def _extract_tables(self, soup):
+        tables = []
+        for table in soup.find_all('table'):
             table_data = []
-            rows = table.find_all('tr')
-            for row in rows:
+            for row in table.find_all('tr'):
                 cells = row.find_all(['td', 'th'])
                 table_data.append([cell.get_text().strip() for cell in cells])
-            data['tables'].append(table_data)
-        
-        # Extract forms
-        forms = soup.find_all('form')
-        for form in forms:
+            tables.append(table_data)
+        return tables
+
+    def _extract_forms(self, soup):
+        forms = []
+        for form in soup.find_all('form'):
             form_data = {
                 'action': form.get('action', ''),
                 'method': form.get('method', ''),
                 'inputs': []
             }
-            inputs = form.find_all(['input', 'textarea', 'select'])
-            for inp in inputs:
+            for inp in form.find_all(['input', 'textarea', 'select']):
                 form_data['inputs'].append({
                     'type': inp.get('type', inp.name),
                     'name': inp.get('name', ''),
                     'placeholder': inp.get('placeholder', ''),
                     'value': inp.get('value', '')
                 })
-            data['forms'].append(form_data)
-        
-        # Extract main text content
-        data['text_content'] = self.extract_text_content(soup)
-        
-        return data
-    
+            forms.append(form_data)
+        return forms
+
     def extract_projects_data(self, soup):
         """Extract project information from projects page"""
         projects_data = {
@@ -323,6 +408,76 @@ class DevpostScraper:
         
         return projects_data
     
+    def extract_page_count(self, soup):
+        """Number of pages in a paginated gallery, read from its ?page=N links"""
+        page_count = 1
+        for link in soup.find_all('a', href=True):
+            match = re.search(r'[?&]page=(\d+)', link['href'])
+            if match:
+                page_count = max(page_count, int(match.group(1)))
+        return page_count
+
+    def crawl_gallery(self, gallery_path, winners_only=True, max_pages=GALLERY_MAX_PAGES):
+        """Collect projects from every page of a gallery, in the extract_projects_data shape
+
+        The first page gives the page count; the remaining pages are fetched
+        concurrently and parsed in the parse pool. winners_only asks Devpost
+        for winning submissions only, so non-winner pages are never fetched
+        (falling back to the full gallery if the filtered one is empty).
+        Returns None if the gallery's first page can't be loaded.
+        """
+        params = dict(GALLERY_WINNERS_PARAMS) if winners_only else {}
+        first_page = self._fetch_gallery_page(gallery_path, params, 1)
+        if first_page is None:
+            return None
+
+        projects_data = first_page['projects_data']
+        if winners_only and not (projects_data['all_projects'] or projects_data['project_links']):
+            return self.crawl_gallery(gallery_path, winners_only=False, max_pages=max_pages)
+
+        page_count = min(first_page['page_count'], max_pages)
+        pages = [first_page]
+        if page_count > 1:
+            print(f"  📚 Gallery has {page_count} pages{' of winners' if winners_only else ''}")
+            with ThreadPoolExecutor(max_workers=SCRAPER_MAX_CONCURRENCY_PER_HOST) as executor:
+                pages.extend(executor.map(
+                    lambda page: self._fetch_gallery_page(gallery_path, params, page),
+                    range(2, page_count + 1)
+                ))
+
+        # Merge in page order, each project URL once
+        merged = {'all_projects': [], 'winning_projects': [], 'project_links': []}
+        seen = {key: set() for key in merged}
+        for page in pages:
+            if page is None:
+                continue
+            for key in merged:
+                for project in page['projects_data'].get(key, []):
+                    if project['url'] not in seen[key]:
+                        seen[key].add(project['url'])
+                        merged[key].append(project)
+
+        return merged
+
+    def _fetch_gallery_page(self, gallery_path, params, page):
+        """Fetch one gallery page and parse it in the parse pool (None if unavailable)"""
+        query = dict(params, page=page) if page > 1 else dict(params)
+        url = self.base_url + gallery_path
+        if query:
+            url += '?' + urlencode(query)
+
+        markup = self.fetch_raw(url)
+        if markup is None:
+            return None
+
+        pool = get_parse_pool()
+        if pool is not None:
+            try:
+                return pool.submit(parse_gallery_page, markup, self.base_url, self.parser).result()
+            except BrokenProcessPool:
+                reset_parse_pool()
+        return parse_gallery_page(markup, self.base_url, self.parser)
+
     def is_winning_project(self, element):
         """Check if a project element indicates it's a winning project"""
         if not element:
@@ -341,144 +496,21 @@ class DevpostScraper:
         soup = self.get_page_content(project_url)
         if not soup:
             return None
-        
-        project_data = {
-            'title': project_title,
-            'url': project_url,
-            'tagline': '',
-            'description': '',
-            'technologies': [],
-            'team_members': [],
-            'awards': [],
-            'images': [],
-            'links': [],
-            'full_content': '',
-            'submission_date': None
-        }
 
-        # Extract tagline first (usually near the top)
-        tagline_selectors = [
-            '#app-tagline',
-            '.tagline',
-            '.app-tagline',
-            '.software-tagline',
-            'meta[name="description"]',
-            'meta[property="og:description"]'
-        ]
+        return self.extract_project_data(soup, project_url, project_title)
 
-        for selector in tagline_selectors:
-            if selector.startswith('meta'):
-                tagline_elem = soup.find('meta', attrs={'name': 'description'} if 'name=' in selector else {'property': 'og:description'})
-                if tagline_elem:
-                    tagline = tagline_elem.get('content', '').strip()
-                    if tagline and len(tagline) > 10:
-                        project_data['tagline'] = tagline
-                        print(f"  ✓ Found tagline: {tagline[:50]}...")
-                        break
-            else:
-                tagline_elem = soup.select_one(selector)
-                if tagline_elem and tagline_elem.get_text().strip():
-                    tagline = tagline_elem.get_text().strip()
-                    if len(tagline) > 10:
-                        project_data['tagline'] = tagline
-                        print(f"  ✓ Found tagline: {tagline[:50]}...")
-                        break
+    def refresh_individual_project(self, project_url, project_title, etag=None, last_modified=None):
+        """Re-scrape a project page only if the server reports it changed (None = 304)"""
+        soup = self.fetch_if_modified(project_url, etag, last_modified)
+        if soup is None:
+            return None
 
-        # Extract full description (look for Devpost-specific content areas)
-        desc_selectors = [
-            '#app-details-left',
-            '.app-details',
-            '#gallery-body',
-            '.project-description',
-            '.description',
-            '.app-content',
-            '#app-details',
-            'article.software-details',
-            '.submission-details'
-        ]
+        print(f"  Re-scraping project: {project_title}")
+        return self.extract_project_data(soup, project_url, project_title)
 
-        for selector in desc_selectors:
-            desc_elem = soup.select_one(selector)
-            if desc_elem and desc_elem.get_text().strip():
-                description = desc_elem.get_text().strip()
-
-                # Only use if it's substantial (more than just a title)
-                if len(description.split()) > 10:
-                    # Limit to 300 words
-                    words = description.split()
-                    if len(words) > 300:
-                        description = ' '.join(words[:300])
-                        print(f"  ⚠️ Description truncated from {len(words)} to 300 words")
-
-                    project_data['description'] = description
-                    print(f"  ✓ Found description ({len(description.split())} words)")
-                    break
-
-        # Extract submission date from <time> tag
-        time_elem = soup.find('time', class_='timeago')
-        if time_elem and time_elem.get('datetime'):
-            try:
-                from datetime import datetime
-                # Parse ISO 8601 datetime
-                date_str = time_elem.get('datetime')
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                # Format as "Jun 22, 2025"
-                project_data['submission_date'] = date_obj.strftime('%b %d, %Y')
-                print(f"  ✓ Found submission date: {project_data['submission_date']}")
-            except Exception as e:
-                print(f"  ⚠️ Error parsing date: {e}")
-
-        # Extract technologies used
-        tech_elements = soup.find_all(['span', 'div'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['tech', 'tag', 'skill', 'language']
-        ))
-        for tech in tech_elements:
-            tech_text = tech.get_text().strip()
-            if tech_text and len(tech_text) < 50:  # Reasonable tech name length
-                project_data['technologies'].append(tech_text)
-        
-        # Extract team members
-        team_elements = soup.find_all(['div', 'span'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['team', 'member', 'author', 'creator']
-        ))
-        for member in team_elements:
-            member_text = member.get_text().strip()
-            if member_text and '@' in member_text:  # Likely an email/username
-                project_data['team_members'].append(member_text)
-        
-        # Extract awards/prizes
-        award_elements = soup.find_all(['div', 'span'], class_=lambda x: x and any(
-            keyword in x.lower() for keyword in ['award', 'prize', 'winner', 'badge']
-        ))
-        for award in award_elements:
-            award_text = award.get_text().strip()
-            if award_text:
-                project_data['awards'].append(award_text)
-        
-        # Extract images
-        images = soup.find_all('img')
-        for img in images:
-            src = img.get('src', '')
-            if src and not src.startswith('data:'):  # Skip data URLs
-                project_data['images'].append({
-                    'src': src if src.startswith('http') else self.base_url + src,
-                    'alt': img.get('alt', '')
-                })
-        
-        # Extract external links
-        links = soup.find_all('a', href=True)
-        for link in links:
-            href = link.get('href', '')
-            if href.startswith('http') and 'devpost.com' not in href:
-                project_data['links'].append({
-                    'text': link.get_text().strip(),
-                    'url': href
-                })
-        
-        # Extract full content
-        project_data['full_content'] = self.extract_text_content(soup)
-        
-        return project_data
+    def extract_project_data(self, soup, project_url, project_title):
+        """Extract project details from a parsed project page (single tree walk)"""
+        return extract_project_data(soup, project_url, project_title, self.base_url)
     
     def scrape_tab(self, tab_name, tab_path):
         """Scrape a specific tab - returns data only, no file writing"""
@@ -506,12 +538,80 @@ class DevpostScraper:
             project_details = self.scrape_individual_project(project['url'], project['title'])
             if project_details:
                 detailed_projects.append(project_details)
-            # Add delay between project scrapes
-            time.sleep(2)
 
         return detailed_projects
-    
-    
+
+    async def scrape_winning_projects_async(self, winning_projects, max_concurrency=SCRAPER_MAX_CONCURRENCY_PER_HOST,
+                                            on_project=None):
+        """Scrape winning project pages concurrently, bounded per host - returns data only
+
+        Two stages: fetch threads download raw pages (at most max_concurrency
+        per host) and hand the bytes to the parse process pool, then move on
+        to the next page while the parse runs.
+
+        on_project(project, project_data) is called from a worker thread as
+        soon as each page has been scraped, e.g. to save it right away.
+        """
+        host_semaphores = {}
+        loop = asyncio.get_running_loop()
+
+        async def parse(project, markup):
+            args = (parse_project_page, markup, project['url'], project['title'], self.base_url, self.parser)
+            pool = get_parse_pool()
+            if pool is not None:
+                try:
+                    return await loop.run_in_executor(pool, *args)
+                except BrokenProcessPool:
+                    print("  ⚠️ Parse worker died, restarting the pool and parsing in-process")
+                    reset_parse_pool()
+            return await asyncio.to_thread(*args)
+
+        async def scrape_one(project):
+            host = urlparse(project['url']).hostname or ''
+            if host not in host_semaphores:
+                host_semaphores[host] = asyncio.Semaphore(max_concurrency)
+
+            # Stage 1: I/O - the host slot is released as soon as the bytes are in
+            async with host_semaphores[host]:
+                print(f"  Scraping project: {project['title']}")
+                markup = await asyncio.to_thread(self.fetch_raw, project['url'])
+            if markup is None:
+                return None
+
+            # Stage 2: CPU - parse and extract in a worker process
+            project_data = await parse(project, markup)
+            if project_data and on_project:
+                await asyncio.to_thread(on_project, project, project_data)
+            return project_data
+
+        results = await asyncio.gather(
+            *(scrape_one(project) for project in winning_projects),
+            return_exceptions=True
+        )
+
+        # Same shape and order as scrape_winning_projects: failed pages are dropped
+        detailed_projects = []
+        for project, result in zip(winning_projects, results):
+            if isinstance(result, Exception):
+                print(f"  ❌ Error scraping {project['url']}: {result}")
+            elif result:
+                detailed_projects.append(result)
+
+        return detailed_projects
+
+    def scrape_winning_projects_concurrently(self, winning_projects, max_concurrency=SCRAPER_MAX_CONCURRENCY_PER_HOST,
+                                             on_project=None):
+        """Blocking wrapper around scrape_winning_projects_async"""
+        coro = self.scrape_winning_projects_async(winning_projects, max_concurrency, on_project)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Called from inside an event loop (e.g. the API server) - run on a private loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
     def run_scraper(self):
         """Run the complete scraping process - returns data only"""
         # Detect available tabs
@@ -521,8 +621,7 @@ class DevpostScraper:
             return {}
 
         for tab_name, tab_path in self.tabs.items():
+            # Pacing is handled per host by the shared HTTP client's rate limiter
             self.scrape_tab(tab_name, tab_path)
-            # Add delay to be respectful to the server
-            time.sleep(1)
 
         return self.scraped_data
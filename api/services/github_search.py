@@ -0,0 +1,201 @@
+"""
+GitHub repository search backend
+
+- Uses GITHUB_TOKEN when set (30 search requests/min instead of 10)
+- REST searches go through the shared HTTP client, whose disk cache
+  revalidates with ETags; 304s don't count against the quota
+- With a token, several queries are batched into one GraphQL request
+- Tracks the remaining quota reported by GitHub
+"""
+
+import os
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+from api.config.constants import GITHUB_API_BASE, GITHUB_GRAPHQL_BATCH_SIZE
+from api.utils.http_client import HttpClient, get_http_client
+
+REPOSITORY_FIELDS = """
+    ... on Repository {
+        name
+        nameWithOwner
+        description
+        url
+        stargazerCount
+        primaryLanguage { name }
+        createdAt
+        updatedAt
+    }
+"""
+
+
+def _graphql_repo_to_item(node: Dict[str, Any]) -> Dict[str, Any]:
+    """GraphQL repository node -> REST search item shape"""
+    return {
+        'name': node.get('name', ''),
+        'full_name': node.get('nameWithOwner', ''),
+        'description': node.get('description'),
+        'html_url': node.get('url', ''),
+        'stargazers_count': node.get('stargazerCount', 0),
+        'language': (node.get('primaryLanguage') or {}).get('name'),
+        'created_at': node.get('createdAt', ''),
+        'updated_at': node.get('updatedAt', '')
+    }
+
+
+class GitHubSearch:
+    def __init__(self, token: str = None, api_base: str = GITHUB_API_BASE, client: HttpClient = None):
+        self.token = token if token is not None else os.getenv('GITHUB_TOKEN')
+        self.api_base = api_base.rstrip('/')
+        self.client = client
+        self._lock = threading.Lock()
+        self.quota = {}  # resource ('search', 'graphql') -> limit / remaining / reset
+        self.counters = {'rest_requests': 0, 'cache_hits': 0, 'graphql_requests': 0,
+                         'graphql_queries': 0, 'errors': 0}
+
+    def _client(self) -> HttpClient:
+        return self.client or get_http_client()
+
+    def _headers(self) -> Dict[str, str]:
+        headers = {
+            'Accept': 'application/vnd.github.v3+json',
+            'User-Agent': 'Mozilla/5.0'
+        }
+        if self.token:
+            headers['Authorization'] = f"Bearer {self.token}"
+        return headers
+
+    def _count(self, counter: str, amount: int = 1):
+        with self._lock:
+            self.counters[counter] += amount
+
+    def _record_quota(self, response, default_resource: str):
+        """Remember the X-RateLimit-* headers of a REST or GraphQL response"""
+        headers = response.headers
+        if headers.get('X-RateLimit-Remaining') is None:
+            return
+        resource = headers.get('X-RateLimit-Resource', default_resource)
+        try:
+            quota = {
+                'limit': int(headers.get('X-RateLimit-Limit', 0)),
+                'remaining': int(headers['X-RateLimit-Remaining']),
+                'reset': int(headers.get('X-RateLimit-Reset', 0))
+            }
+        except ValueError:
+            return
+        with self._lock:
+            self.quota[resource] = quota
+
+    def search_repositories(self, query: str, max_results: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """One REST search, sorted by stars - returns REST items, or None on error"""
+        params = {
+            'q': query,
+            'sort': 'stars',
+            'order': 'desc',
+            'per_page': max_results
+        }
+        response = self._client().get(
+            f"{self.api_base}/search/repositories", params=params, headers=self._headers(), timeout=10
+        )
+
+        if getattr(response, 'from_cache', False):
+            # Served from disk, either fresh or after a 304 revalidation (free either way)
+            self._count('cache_hits')
+        else:
+            self._count('rest_requests')
+            self._record_quota(response, 'search')
+
+        if response.status_code != 200:
+            self._count('errors')
+            print(f"  ⚠️ GitHub status: {response.status_code}")
+            return None
+        return response.json().get('items', [])[:max_results]
+
+    def search_many(self, queries: List[str], max_results: int = 10) -> List[Optional[List[Dict[str, Any]]]]:
+        """Search several queries - batched through GraphQL when a token is configured"""
+        if not self.token:
+            return [self.search_repositories(query, max_results) for query in queries]
+
+        results = []
+        for start in range(0, len(queries), GITHUB_GRAPHQL_BATCH_SIZE):
+            batch = queries[start:start + GITHUB_GRAPHQL_BATCH_SIZE]
+            batch_results = self._graphql_search(batch, max_results)
+            if batch_results is None:
+                # GraphQL unavailable - fall back to one REST call per query
+                batch_results = [self.search_repositories(query, max_results) for query in batch]
+            results.extend(batch_results)
+        return results
+
+    def _graphql_search(self, queries: List[str], max_results: int) -> Optional[List[List[Dict[str, Any]]]]:
+        """Run several repository searches in one GraphQL request"""
+        variables = {f"q{i}": f"{query} sort:stars" for i, query in enumerate(queries)}
+        declarations = ', '.join(f"$q{i}: String!" for i in range(len(queries)))
+        searches = '\n'.join(
+            f"q{i}: search(query: $q{i}, type: REPOSITORY, first: {max_results}) {{ nodes {{ {REPOSITORY_FIELDS} }} }}"
+            for i in range(len(queries))
+        )
+        document = f"query({declarations}) {{\n{searches}\nrateLimit {{ limit remaining resetAt cost }}\n}}"
+
+        try:
+            response = self._client().post(
+                f"{self.api_base}/graphql", json={'query': document, 'variables': variables},
+                headers=self._headers(), timeout=15
+            )
+            self._count('graphql_requests')
+            self._record_quota(response, 'graphql')
+            if response.status_code != 200:
+                print(f"  ⚠️ GitHub GraphQL status: {response.status_code}")
+                self._count('errors')
+                return None
+
+            payload = response.json()
+            if payload.get('errors') or not payload.get('data'):
+                print(f"  ⚠️ GitHub GraphQL errors: {payload.get('errors')}")
+                self._count('errors')
+                return None
+        except Exception as e:
+            print(f"  ⚠️ GitHub GraphQL error: {e}")
+            self._count('errors')
+            return None
+
+        data = payload['data']
+        rate_limit = data.get('rateLimit')
+        if rate_limit:
+            with self._lock:
+                self.quota['graphql'] = {
+                    'limit': rate_limit.get('limit'),
+                    'remaining': rate_limit.get('remaining'),
+                    'reset': rate_limit.get('resetAt'),
+                    'last_cost': rate_limit.get('cost')
+                }
+
+        self._count('graphql_queries', len(queries))
+        return [
+            [_graphql_repo_to_item(node) for node in (data.get(f"q{i}") or {}).get('nodes', []) if node]
+            for i in range(len(queries))
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Remaining quota per resource plus request counters"""
+        with self._lock:
+            stats = {'authenticated': bool(self.token), 'quota': {k: dict(v) for k, v in self.quota.items()}}
+            stats.update(self.counters)
+        for quota in stats['quota'].values():
+            if isinstance(quota.get('reset'), int) and quota['reset']:
+                quota['resets_in'] = max(int(quota['reset'] - time.time()), 0)
+        return stats
+
+
+_github = None
+_github_lock = threading.Lock()
+
+
+def get_github_search() -> GitHubSearch:
+    """Return the process-wide GitHub search backend"""
+    global _github
+    if _github is None:
+        with _github_lock:
+            if _github is None:
+                _github = GitHubSearch()
+    return _github
@@ -3,30 +3,47 @@ Intelligent Idea Generator
 Analyzes past hackathon winners and generates ideas for new hackathons
 """
 
+import gzip
 import json
 import os
 import shutil
+import threading
 from datetime import datetime
-from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
 from api.services.devpost_scraper import DevpostScraper
 from api.services.claude_analyzer import ClaudeAnalyzer
 from api.config.settings import CLAUDE_API_KEY
+from api.config.constants import (
+    IDEA_SAMPLE_SIZE, RULES_SAVE_STRUCTURED, RULES_STRUCTURED_FIELDS, RULES_STRUCTURED_FILE,
+    SCRAPER_MAX_CONCURRENCY_PER_HOST
+)
+from api.utils.corpus_store import get_corpus_store
+from api.utils.crawl_journal import get_crawl_journal
+from api.utils.event_manifest import EventManifest, content_hash
+from api.utils.load_cache import file_version, get_load_cache
+from api.utils.packed_corpus import get_packed_corpus
+from api.utils.project_record import ProjectRecord
+from api.utils.site_chrome import strip_site_chrome
+from api.utils.storage import read_json, read_text, resolve_codec, stored_path, write_json
 import anthropic
 
 
 class IdeaGenerator:
-    def __init__(self, new_hackathon_url: str, past_hackathon_urls: List[str] = None):
+    def __init__(self, new_hackathon_url: str, past_hackathon_urls: List[str] = None, refresh: bool = False):
         """
         Initialize the idea generator
         
         Args:
             new_hackathon_url: URL of the hackathon you want to participate in
             past_hackathon_urls: List of past hackathon URLs to learn from (optional)
+            refresh: Re-check cached past hackathons and re-fetch only new or changed winners
         """
         # Clean URLs - remove query parameters
         self.new_hackathon_url = new_hackathon_url.split('?')[0]
         self.past_hackathon_urls = [url.split('?')[0] for url in (past_hackathon_urls or [])]
         self.claude_client = None
+        self.refresh = refresh
 
         # Extract hackathon name for folder structure
         self.hackathon_name = self._extract_hackathon_name(new_hackathon_url)
@@ -37,10 +54,16 @@ class IdeaGenerator:
 
         self.output_dir = os.path.join(self.base_data_dir, self.hackathon_name)
 
+        # Progress of past-hackathon crawls, so an interrupted crawl resumes
+        self.journal = get_crawl_journal()
+
+        # Corpus-store events of the past hackathons ready for sampling
+        self.past_events = []
+
         # Check if rules data exists (NOT ideas.txt - that's always regenerated)
-        self.rules_cached = os.path.exists(self.output_dir) and os.path.exists(
+        self.rules_cached = os.path.exists(self.output_dir) and stored_path(
             os.path.join(self.output_dir, "rules.json")
-        )
+        ) is not None
         
     def _extract_hackathon_name(self, url: str) -> str:
         """Extract clean hackathon name from URL"""
@@ -70,15 +93,46 @@ class IdeaGenerator:
 
         try:
             rules_file = os.path.join(self.output_dir, "rules.json")
-            with open(rules_file, 'r', encoding='utf-8') as f:
-                rules_data = json.load(f)
+
+            def load():
+                raw = read_text(rules_file)
+                rules_data = json.loads(raw)
+                if any('structured' in tab for tab in rules_data.get('rules_data', {}).values()):
+                    rules_data = self._migrate_rules_file(rules_data)
+                return rules_data, len(raw)
+
+            # Decoded once per process until rules.json (in whichever codec) changes
+            version = file_version(stored_path(rules_file) or rules_file)
+            rules_data = get_load_cache().get(('rules', rules_file), version, load)
             print(f"✓ Rules loaded from cache\n")
             return rules_data
         except Exception as e:
             print(f"✗ Error loading cached rules: {e}\n")
             return None
 
-    def load_cached_hackathon_projects(self, hackathon_url: str) -> List[Dict[str, Any]]:
+    def _save_rules(self, full_rules_data: Dict[str, Any], structured: Dict[str, Any]):
+        """Write the text-only rules.json plus, if any, the compressed structured sidecar"""
+        if structured:
+            with gzip.open(os.path.join(self.output_dir, RULES_STRUCTURED_FILE), 'wt', encoding='utf-8') as f:
+                json.dump(structured, f, ensure_ascii=False, separators=(',', ':'))
+            full_rules_data['structured_file'] = RULES_STRUCTURED_FILE
+
+        write_json(os.path.join(self.output_dir, "rules.json"), full_rules_data, codec=resolve_codec())
+
+    def _migrate_rules_file(self, rules_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Split structured data out of a rules.json written by older versions"""
+        structured = {}
+        for tab_name, tab in rules_data.get('rules_data', {}).items():
+            tab_structured = tab.pop('structured', None)
+            if tab_structured:
+                tab_structured.pop('text_content', None)
+                structured[tab_name] = tab_structured
+
+        self._save_rules(rules_data, structured)
+        print(f"  ↻ Moved structured rules data to {RULES_STRUCTURED_FILE}")
+        return rules_data
+
+    def load_cached_hackathon_projects(self, hackathon_url: str) -> List[ProjectRecord]:
         """Load cached projects for a specific hackathon"""
         hackathon_name = self._extract_hackathon_name(hackathon_url)
         hackathon_dir = os.path.join(self.base_data_dir, hackathon_name)
@@ -86,16 +140,25 @@ class IdeaGenerator:
         if not os.path.exists(hackathon_dir):
             return None
 
+        # A folder whose crawl was interrupted is partial, not a cache
+        if self.journal.is_in_progress(hackathon_url):
+            return None
+
         print(f"📦 Loading cached projects: {hackathon_name}")
 
         try:
-            projects = []
-            for filename in os.listdir(hackathon_dir):
-                if filename.startswith('project_') and filename.endswith('.json'):
-                    filepath = os.path.join(hackathon_dir, filename)
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        projects.append(json.load(f))
-
+            # One indexed query; folders scraped before the store existed are imported once
+            store = get_corpus_store()
+            if not store.has_event(hackathon_name):
+                store.import_folder(hackathon_dir, hackathon_url)
+
+            def load():
+                records = store.load_event_records(hackathon_name)
+                return records or None, sum(record.approximate_size() for record in records)
+
+            # Warm requests reuse the decoded records until the store changes
+            projects = get_load_cache().get(('event', hackathon_dir), store.revision(), load)
+            projects = list(projects) if projects else None
             if projects:
                 print(f"✓ Loaded {len(projects)} cached projects\n")
                 return projects
@@ -107,6 +170,14 @@ class IdeaGenerator:
             print(f"✗ Error loading cached projects: {e}\n")
             return None
 
+    def _load_project_files(self, hackathon_dir: str, filenames: List[str]) -> List[ProjectRecord]:
+        projects = []
+        for filename in filenames:
+            project_data = read_json(os.path.join(hackathon_dir, filename))
+            if project_data is not None:
+                projects.append(ProjectRecord.from_dict(project_data))
+        return projects
+
     def setup_claude(self, api_key: str = None):
         """Setup Claude API"""
         api_key = api_key or CLAUDE_API_KEY
@@ -139,96 +210,120 @@ class IdeaGenerator:
 
         scraper = DevpostScraper(self.new_hackathon_url)
 
-        # Detect available tabs first
-        scraper.detect_available_tabs()
-
-        # Only scrape relevant tabs for rules
+        # Only scrape relevant tabs for rules - targeted detection probes just these
         tabs_to_scrape = ['overview', 'rules', 'prizes', 'schedule']
+        scraper.detect_available_tabs(tab_names=tabs_to_scrape)
         rules_data = {}
+        structured = {}
 
         for tab_name in tabs_to_scrape:
-            tab_path = scraper.tabs.get(tab_name, f'/{tab_name}')
-            tab_url = scraper.base_url + tab_path
+            if tab_name not in scraper.tabs:
+                print(f"  ✗ {tab_name}")
+                continue
+
+            # Served from the scraper's page store - detection already downloaded it
+            tab_url = scraper.base_url + scraper.tabs[tab_name]
             soup = scraper.get_page_content(tab_url)
 
             if soup and scraper.is_valid_page(soup):
-                rules_data[tab_name] = {
-                    'text': scraper.extract_text_content(soup),
-                    'structured': scraper.extract_structured_data(soup, tab_name)
-                }
+                rules_data[tab_name] = {'text': scraper.extract_text_content(soup)}
+                if RULES_SAVE_STRUCTURED:
+                    structured[tab_name] = scraper.extract_structured_data(soup, tab_name, fields=RULES_STRUCTURED_FIELDS)
                 print(f"  ✓ {tab_name}")
             else:
                 print(f"  ✗ {tab_name}")
 
-        # Save rules data to rules.json
-        rules_file = os.path.join(self.output_dir, "rules.json")
+        # Save rules text to rules.json (structured data goes to the sidecar)
         full_rules_data = {
             'url': self.new_hackathon_url,
             'event_name': scraper.event_name,
             'scraped_at': datetime.now().isoformat(),
             'rules_data': rules_data
         }
-        with open(rules_file, 'w', encoding='utf-8') as f:
-            json.dump(full_rules_data, f, indent=2, ensure_ascii=False)
+        self._save_rules(full_rules_data, structured)
 
         print(f"✓ Saved to: {self.output_dir}/\n")
         return full_rules_data
     
-    def scrape_past_hackathon_winners(self, hackathon_url: str) -> List[Dict[str, Any]]:
-        """Scrape winning projects from a past hackathon - saves each as individual JSON"""
-        # Check cache first
-        cached_projects = self.load_cached_hackathon_projects(hackathon_url)
-        if cached_projects:
-            return cached_projects
+    def scrape_past_hackathon_winners(self, hackathon_url: str, refresh: bool = None) -> List[ProjectRecord]:
+        """Scrape winning projects from a past hackathon - saves each as individual JSON
 
-        print(f"🔍 Scraping: {hackathon_url}")
+        Progress is journaled per project URL: after an interruption the next
+        call reuses the recorded winners list and fetches only unsaved projects.
+        """
+        # Another request (or the background pre-warmer) may be crawling this event
+        with self.journal.event_lock(hackathon_url):
+            return self._scrape_past_hackathon_winners(hackathon_url, refresh)
 
-        scraper = DevpostScraper(hackathon_url)
+    def _scrape_past_hackathon_winners(self, hackathon_url: str, refresh: bool = None) -> List[ProjectRecord]:
+        refresh = self.refresh if refresh is None else refresh
         past_hackathon_name = self._extract_hackathon_name(hackathon_url)
         hackathon_folder = os.path.join(self.base_data_dir, past_hackathon_name)
-        os.makedirs(hackathon_folder, exist_ok=True)
+        resuming = self.journal.is_in_progress(hackathon_url)
 
-        # Try project-gallery first, then submissions
-        urls_to_try = [
-            hackathon_url + '/project-gallery',
-            hackathon_url + '/submissions',
-            hackathon_url + '/projects'
-        ]
-        
-        projects_data = None
-        for url in urls_to_try:
-            soup = scraper.get_page_content(url)
-            if soup and scraper.is_valid_page(soup):
-                projects_data = scraper.extract_projects_data(soup)
-                if projects_data and (projects_data['all_projects'] or projects_data['project_links']):
-                    break
+        if not resuming:
+            if refresh and os.path.isdir(hackathon_folder):
+                return self.refresh_past_hackathon_winners(hackathon_url)
 
-        if not projects_data:
-            print(f"  ✗ No projects found")
-            # Delete empty folder
-            if os.path.exists(hackathon_folder) and not os.listdir(hackathon_folder):
-                shutil.rmtree(hackathon_folder)
-                print(f"  🗑️  Deleted empty folder: {past_hackathon_name}")
-            return []
+            # Check cache first
+            cached_projects = self.load_cached_hackathon_projects(hackathon_url)
+            if cached_projects:
+                return cached_projects
 
-        # Get winning projects
-        winning_projects = projects_data.get('winning_projects', [])
-
-        # Scrape and save each project individually (INCREASED TO 25)
-        detailed_winners = []
-        for i, project in enumerate(winning_projects[:25], 1):  # Limit to 25 winners
-            project_data = scraper.scrape_individual_project(project['url'], project['title'])
-            if project_data:
-                detailed_winners.append(project_data)
-
-                # Save each project as individual JSON file
-                safe_title = "".join(c for c in project['title'] if c.isalnum() or c in (' ', '-', '_')).strip()
-                safe_title = safe_title.replace(' ', '_').replace('__', '_')[:40]
-                project_filename = f"project_{i:03d}_{safe_title}.json"
-                project_file = os.path.join(hackathon_folder, project_filename)
+        scraper = DevpostScraper(hackathon_url)
+        os.makedirs(hackathon_folder, exist_ok=True)
 
-                with open(project_file, 'w', encoding='utf-8') as f:
-                    json.dump(project_data, f, indent=2, ensure_ascii=False)
+        if resuming:
+            event = self.journal.event(hackathon_url)
+            winning_projects = event['winners']
+            print(f"⏯️  Resuming: {hackathon_url} ({len(event['done'])}/{len(winning_projects)} winners already saved)")
+        else:
+            print(f"🔍 Scraping: {hackathon_url}")
+            winning_projects = self._find_winning_projects(scraper, hackathon_url)
+            if winning_projects is None:
+                print(f"  ✗ No projects found")
+                # Delete empty folder
+                if os.path.exists(hackathon_folder) and not os.listdir(hackathon_folder):
+                    shutil.rmtree(hackathon_folder)
+                    print(f"  🗑️  Deleted empty folder: {past_hackathon_name}")
+                return []
+            winning_projects = winning_projects[:25]  # Limit to 25 winners
+            self.journal.start_event(hackathon_url, hackathon_folder, winning_projects)
+            get_corpus_store().delete_event(past_hackathon_name)
+
+        # File numbers follow the winners list, so they are stable across resumes
+        file_index = {project['url']: i for i, project in enumerate(winning_projects, 1)}
+        manifest = EventManifest.load(hackathon_folder) or EventManifest(hackathon_folder, hackathon_url)
+        manifest_lock = threading.Lock()
+
+        def save_project(project, project_data):
+            # Atomic file write, then manifest, then journal: a crash never leaves a partial file
+            project_data = strip_site_chrome(project_data)
+            project_filename = self._save_project_file(hackathon_folder, file_index[project['url']], project_data)
+            with manifest_lock:
+                manifest.record(project['url'], project_filename, project_data, scraper.page_meta.get(project['url']))
+                manifest.save()
+            self.journal.mark_done(hackathon_url, project['url'], project_filename)
+
+        # Projects saved (and in the manifest) right before an interruption count as done
+        for project in self.journal.pending(hackathon_url):
+            entry = manifest.get(project['url'])
+            if entry and stored_path(os.path.join(hackathon_folder, entry['file'])):
+                self.journal.mark_done(hackathon_url, project['url'], entry['file'])
+
+        # Scrape winner pages concurrently (INCREASED TO 25), saving each as soon as it is scraped
+        pending = self.journal.pending(hackathon_url)
+        scraper.scrape_winning_projects_concurrently(pending, on_project=save_project)
+
+        still_pending = [project['url'] for project in self.journal.pending(hackathon_url)]
+        if still_pending:
+            self.journal.mark_failed(hackathon_url, still_pending)
+        self.journal.finish_event(hackathon_url)
+
+        saved = self.journal.event(hackathon_url)['done']
+        detailed_winners = self._load_project_files(
+            hackathon_folder, [saved[project['url']] for project in winning_projects if project['url'] in saved]
+        )
 
         # Delete folder if no winners were saved
         if not detailed_winners:
@@ -240,8 +335,127 @@ class IdeaGenerator:
             print(f"  ✓ {past_hackathon_name} - {len(detailed_winners)} winners saved\n")
 
         return detailed_winners
-    
-    def scrape_all_past_hackathons(self) -> List[Dict[str, Any]]:
+
+    def refresh_past_hackathon_winners(self, hackathon_url: str) -> List[ProjectRecord]:
+        """Bring a cached past hackathon up to date, re-fetching only new or changed winners
+
+        Known winners are revalidated with their stored ETag / Last-Modified; a
+        304 or an identical content hash leaves the saved file untouched. The
+        manifest is saved after every written file, so an interrupted refresh
+        never leaves files it doesn't know about.
+        """
+        past_hackathon_name = self._extract_hackathon_name(hackathon_url)
+        hackathon_folder = os.path.join(self.base_data_dir, past_hackathon_name)
+        print(f"↻ Refreshing: {hackathon_url}")
+
+        manifest = EventManifest.load(hackathon_folder) or EventManifest.from_folder(hackathon_folder, hackathon_url)
+        scraper = DevpostScraper(hackathon_url)
+
+        winning_projects = self._find_winning_projects(scraper, hackathon_url)
+        if winning_projects is None:
+            print(f"  ✗ Could not load the project gallery, keeping cached winners")
+            return self.load_cached_hackathon_projects(hackathon_url) or []
+        winning_projects = winning_projects[:25]
+
+        new_projects = [project for project in winning_projects if manifest.get(project['url']) is None]
+        known_projects = [project for project in winning_projects if manifest.get(project['url']) is not None]
+
+        manifest_lock = threading.Lock()
+
+        def save_new_project(project, project_data):
+            # File, then manifest; updated_at only moves once the whole refresh is done
+            project_data = strip_site_chrome(project_data)
+            with manifest_lock:
+                project_filename = self._save_project_file(hackathon_folder, manifest.next_index(), project_data)
+                manifest.record(project['url'], project_filename, project_data, scraper.page_meta.get(project['url']))
+                manifest.save(touch=False)
+
+        # New winners: full scrape, each saved as soon as it is scraped
+        scraper.scrape_winning_projects_concurrently(new_projects, on_project=save_new_project)
+
+        # Known winners: conditional re-fetch
+        def revalidate(project):
+            entry = manifest.get(project['url'])
+            try:
+                return scraper.refresh_individual_project(
+                    project['url'], project['title'], entry.get('etag'), entry.get('last_modified')
+                )
+            except Exception as e:
+                print(f"  ❌ Error refreshing {project['url']}: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=SCRAPER_MAX_CONCURRENCY_PER_HOST) as executor:
+            refreshed = list(executor.map(revalidate, known_projects))
+
+        changed = 0
+        for project, project_data in zip(known_projects, refreshed):
+            entry = manifest.get(project['url'])
+            if project_data is not None:
+                project_data = strip_site_chrome(project_data)
+            if project_data is None or content_hash(project_data) == entry['content_hash']:
+                manifest.mark_checked(project['url'], scraper.page_meta.get(project['url']))
+                continue
+            write_json(os.path.join(hackathon_folder, entry['file']), project_data, codec=resolve_codec())
+            get_corpus_store().put_project(past_hackathon_name, entry['file'], project_data, hackathon_url)
+            manifest.record(project['url'], entry['file'], project_data, scraper.page_meta.get(project['url']))
+            manifest.save(touch=False)
+            changed += 1
+
+        manifest.save()
+        unchanged = len(known_projects) - changed
+        print(f"  ✓ {past_hackathon_name} - {len(new_projects)} new, {changed} changed, {unchanged} unchanged\n")
+
+        return self.load_cached_hackathon_projects(hackathon_url) or []
+
+    def _find_winning_projects(self, scraper: DevpostScraper, hackathon_url: str) -> List[Dict[str, Any]]:
+        """Winning projects listed in the event's gallery (None if no gallery could be read)"""
+        # Try project-gallery first, then submissions - every page of the gallery, winners only
+        paths_to_try = ['/project-gallery', '/submissions', '/projects']
+
+        projects_data = None
+        for path in paths_to_try:
+            projects_data = scraper.crawl_gallery(path, winners_only=True)
+            if projects_data and (projects_data['all_projects'] or projects_data['project_links']):
+                break
+
+        if not projects_data:
+            return None
+        return projects_data.get('winning_projects', [])
+
+    def _save_project_file(self, hackathon_folder: str, index: int, project_data: Dict[str, Any]) -> str:
+        """Save a project as project_NNN_<title>.json (and in the corpus store); returns the file name"""
+        safe_title = "".join(c for c in project_data['title'] if c.isalnum() or c in (' ', '-', '_')).strip()
+        safe_title = safe_title.replace(' ', '_').replace('__', '_')[:40]
+        project_filename = f"project_{index:03d}_{safe_title}.json"
+        write_json(os.path.join(hackathon_folder, project_filename), project_data, codec=resolve_codec())
+        get_corpus_store().put_project(os.path.basename(os.path.normpath(hackathon_folder)), project_filename, project_data)
+        return project_filename
+
+    def ensure_past_hackathon(self, hackathon_url: str) -> Optional[str]:
+        """Make sure a past hackathon's winners are in the corpus store, without loading them
+
+        Cached events are only checked; missing, interrupted or (with refresh)
+        stale ones are scraped. Returns the event name, or None if it has no winners.
+        """
+        hackathon_name = self._extract_hackathon_name(hackathon_url)
+        hackathon_dir = os.path.join(self.base_data_dir, hackathon_name)
+        store = get_corpus_store()
+
+        cached = (os.path.isdir(hackathon_dir) and not self.refresh
+                  and not self.journal.is_in_progress(hackathon_url)
+                  and (store.has_event(hackathon_name) or store.import_folder(hackathon_dir, hackathon_url)))
+        if not cached and not self.scrape_past_hackathon_winners(hackathon_url):
+            return None
+
+        if hackathon_name not in self.past_events:
+            self.past_events.append(hackathon_name)
+        return hackathon_name
+
+    def sample_past_winners(self, k: int = IDEA_SAMPLE_SIZE) -> List[ProjectRecord]:
+        """Random winners from the ensured past hackathons, decoded from the packed corpus"""
+        return get_packed_corpus().sample(self.past_events, k)
+
+    def scrape_all_past_hackathons(self) -> List[ProjectRecord]:
         """Scrape winning projects from all past hackathons - returns flat list of projects"""
         print(f"\n{'='*60}")
         print(f"🏆 Scraping past hackathon winners")
@@ -249,6 +463,10 @@ class IdeaGenerator:
 
         all_winners = []
 
+        interrupted = [url for url in self.journal.in_progress_events() if url in self.past_hackathon_urls]
+        if interrupted:
+            print(f"⏯️  Resuming interrupted crawl of {len(interrupted)} hackathon(s)")
+
         for i, url in enumerate(self.past_hackathon_urls, 1):
             print(f"[{i}/{len(self.past_hackathon_urls)}] {url}")
             winners_list = self.scrape_past_hackathon_winners(url)
@@ -259,8 +477,12 @@ class IdeaGenerator:
 
         return all_winners
     
-    def generate_ideas_with_claude(self, rules_data: Dict[str, Any], winners_data: List[Dict[str, Any]]) -> str:
-        """Use Claude to generate ideas based on rules and past winners"""
+    def generate_ideas_with_claude(self, rules_data: Dict[str, Any], winners_data: List[ProjectRecord] = None) -> str:
+        """Use Claude to generate ideas based on rules and past winners
+
+        Without winners_data, winners are sampled from the packed corpus for
+        the hackathons passed to ensure_past_hackathon.
+        """
         import random
 
         print(f"\n{'='*60}")
@@ -271,20 +493,27 @@ class IdeaGenerator:
             print("✗ Claude not configured")
             return ""
 
-        # Flatten winners_data if nested (handle both old and new structure)
-        flat_winners = []
-        for item in winners_data:
-            if isinstance(item, dict):
-                flat_winners.append(item)
-            elif isinstance(item, list):
-                flat_winners.extend(item)
-
         # RANDOMLY SAMPLE 100 projects for diversity in each generation cycle
         # This ensures each idea generation is unique and inspired by different projects
-        sample_size = min(100, len(flat_winners))
-        sampled_winners = random.sample(flat_winners, sample_size) if len(flat_winners) > sample_size else flat_winners
+        if winners_data is None:
+            # Only the sampled records are decoded, however large the corpus is
+            total = get_packed_corpus().count(self.past_events)
+            sampled_winners = self.sample_past_winners(IDEA_SAMPLE_SIZE)
+            sample_size = len(sampled_winners)
+        else:
+            # Flatten winners_data if nested (handle both old and new structure)
+            flat_winners = []
+            for item in winners_data:
+                if isinstance(item, (dict, ProjectRecord)):
+                    flat_winners.append(item)
+                elif isinstance(item, list):
+                    flat_winners.extend(item)
+
+            total = len(flat_winners)
+            sample_size = min(IDEA_SAMPLE_SIZE, total)
+            sampled_winners = random.sample(flat_winners, sample_size) if total > sample_size else flat_winners
 
-        print(f"🎲 Randomly sampled {sample_size} projects from {len(flat_winners)} total projects")
+        print(f"🎲 Randomly sampled {sample_size} projects from {total} total projects")
 
         # Summarize winners data
         winners_summary = []
@@ -416,11 +645,12 @@ Generate 7 diverse, winning ideas now. Be specific, creative, and strategic. Mak
             print("⚠ Using default hackathons...")
             self.past_hackathon_urls = self.get_default_hackathons()
 
-        winners_data = self.scrape_all_past_hackathons()
+        for url in self.past_hackathon_urls:
+            self.ensure_past_hackathon(url)
 
         # Step 4: ALWAYS generate fresh ideas with Claude (not cached)
         print(f"💡 Generating fresh ideas (always unique)...\n")
-        ideas = self.generate_ideas_with_claude(rules_data, winners_data)
+        ideas = self.generate_ideas_with_claude(rules_data)
 
         print(f"{'='*60}")
         print(f"✓ Complete - Output: {self.output_dir}/")
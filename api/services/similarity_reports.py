@@ -1,11 +1,23 @@
-import requests
 import json
-from bs4 import BeautifulSoup
 import re
-import time
 from datetime import datetime
 import anthropic
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import SoupStrainer
+from api.config.constants import (
+    SCRAPER_MAX_CONCURRENCY_PER_HOST, HTTP_MAX_PAGE_BYTES, HTML_CONTENT_TYPES, DEVPOST_SEARCH_PAGE_SIZE
+)
+from api.services.github_search import get_github_search
+from api.utils.html_parser import parse_html
+from api.utils.http_client import get_http_client
+from api.utils.project_details_store import get_project_details_store
+from api.utils.project_record import ProjectRecord
+from api.utils.project_extractor import extract_submission_details
+
+# Search result pages: only the project cards are built into the tree.
+# While straining, class is still the raw attribute string, so match it as a token.
+SEARCH_RESULT_STRAINER = SoupStrainer('a', class_=re.compile(r'(^|\s)block-wrapper-link(\s|$)'))
 
 
 # ========================================
@@ -44,7 +56,6 @@ def generate_project_hash(description):
 
 class HackathonFraudDetector:
     def __init__(self, claude_api_key, exclude_url=None):
-        self.github_api = "https://api.github.com/search/repositories"
         self.devpost_base = "https://devpost.com"
         self.client = anthropic.Anthropic(api_key=claude_api_key)
         self.model_name = "claude-sonnet-4-20250514"
@@ -229,8 +240,34 @@ Generate queries now:"""
 
     def search_github(self, query_obj, max_results=10):
         """Search GitHub with strict word limits on descriptions"""
-        query = query_obj['query']
+        return self.search_github_many([query_obj], max_results)[0]
 
+    def search_github_many(self, query_objs, max_results=10):
+        """Search GitHub for several strategies, one result list per strategy
+
+        Uncached queries go to the GitHub backend together, so with a token
+        they share GraphQL requests; results are then deduplicated in
+        strategy order, exactly as if each had been searched in turn.
+        """
+        pending = []
+        for query_obj in query_objs:
+            query = query_obj['query']
+            if f"github:{query}" not in self.search_cache and query not in pending:
+                pending.append(query)
+
+        items_by_query = {}
+        if pending:
+            try:
+                fetched = get_github_search().search_many(pending, max_results)
+                items_by_query = dict(zip(pending, fetched))
+            except Exception as e:
+                print(f"  ⚠️ Error: {e}")
+
+        return [self._collect_github_results(query_obj['query'], items_by_query, max_results)
+                for query_obj in query_objs]
+
+    def _collect_github_results(self, query, items_by_query, max_results):
+        """Deduplicate and shape one query's repositories"""
         # Check cache to avoid duplicate searches
         cache_key = f"github:{query}"
         if cache_key in self.search_cache:
@@ -239,117 +276,170 @@ Generate queries now:"""
 
         print(f"\n🔍 GitHub: '{query}'")
 
-        try:
-            params = {
-                'q': query,
-                'sort': 'stars',
-                'order': 'desc',
-                'per_page': max_results
-            }
-            headers = {
-                'Accept': 'application/vnd.github.v3+json',
-                'User-Agent': 'Mozilla/5.0'
-            }
-
-            response = requests.get(self.github_api, params=params, headers=headers, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                results = []
-
-                print(f"  📦 GitHub returned {len(data.get('items', []))} items")
-
-                for repo in data.get('items', [])[:max_results]:
-                    # Check if this is the excluded URL (submitted project)
-                    repo_url = repo['html_url']
-                    normalized_repo_url = self._normalize_url(repo_url)
-
-                    if self.exclude_url and normalized_repo_url == self.exclude_url:
-                        print(f"  ⏭️ Skipping submitted project: {repo['name']} (URL: {normalized_repo_url})")
-                        continue
-
-                    # ENFORCE 300 WORD LIMIT ON DESCRIPTION
-                    raw_description = repo.get('description', 'No description')
-                    limited_description = truncate_to_word_limit(raw_description, 300)
-
-                    # Generate hash to detect exact duplicates
-                    proj_hash = generate_project_hash(limited_description)
-
-                    # Skip if we've seen this exact project before
-                    if proj_hash in self.processed_projects:
-                        print(f"  ⏭️ Skipping duplicate: {repo['name']}")
-                        continue
-
-                    self.processed_projects.add(proj_hash)
+        items = items_by_query.get(query)
+        if items is None:
+            return []
 
-                    results.append({
-                        'platform': 'GitHub',
-                        'name': repo['name'],
-                        'full_name': repo['full_name'],
-                        'description': limited_description,  # TRUNCATED
-                        'url': repo['html_url'],
-                        'stars': repo['stargazers_count'],
-                        'language': repo.get('language', 'Unknown'),
-                        'created_at': repo.get('created_at', ''),
-                        'updated_at': repo.get('updated_at', ''),
-                        'search_query': query,
-                        'hash': proj_hash
-                    })
+        results = []
 
-                print(f"  ✓ Found {len(results)} repositories (after deduplication and exclusion)")
-                if self.exclude_url:
-                    print(f"  🔒 Excluded URL: {self.exclude_url}")
+        print(f"  📦 GitHub returned {len(items)} items")
+
+        for repo in items[:max_results]:
+            # Check if this is the excluded URL (submitted project)
+            repo_url = repo['html_url']
+            normalized_repo_url = self._normalize_url(repo_url)
+
+            if self.exclude_url and normalized_repo_url == self.exclude_url:
+                print(f"  ⏭️ Skipping submitted project: {repo['name']} (URL: {normalized_repo_url})")
+                continue
+
+            # ENFORCE 300 WORD LIMIT ON DESCRIPTION
+            raw_description = repo.get('description', 'No description')
+            limited_description = truncate_to_word_limit(raw_description, 300)
+
+            # Generate hash to detect exact duplicates
+            proj_hash = generate_project_hash(limited_description)
+
+            # Skip if we've seen this exact project before
+            if proj_hash in self.processed_projects:
+                print(f"  ⏭️ Skipping duplicate: {repo['name']}")
+                continue
+
+            self.processed_projects.add(proj_hash)
+
+            results.append(ProjectRecord.from_dict({
+                'platform': 'GitHub',
+                'name': repo['name'],
+                'full_name': repo['full_name'],
+                'description': limited_description,  # TRUNCATED
+                'url': repo['html_url'],
+                'stars': repo['stargazers_count'],
+                'language': repo.get('language', 'Unknown'),
+                'created_at': repo.get('created_at', ''),
+                'updated_at': repo.get('updated_at', ''),
+                'search_query': query,
+                'hash': proj_hash
+            }))
+
+        print(f"  ✓ Found {len(results)} repositories (after deduplication and exclusion)")
+        if self.exclude_url:
+            print(f"  🔒 Excluded URL: {self.exclude_url}")
 
-                # Cache results
-                self.search_cache[cache_key] = results
-                return results
-            else:
-                print(f"  ⚠️ Status: {response.status_code}")
-                return []
+        # Cache results
+        self.search_cache[cache_key] = results
+        return results
 
-        except Exception as e:
-            print(f"  ⚠️ Error: {e}")
-            return []
+    def _fetch_project_details(self, project_urls):
+        """Submission date and full description for each Devpost project URL
 
-    def _fetch_project_date(self, project_url):
-        """Fetch submission date from individual Devpost project page"""
+        Dates never change once a project is submitted, so results with a
+        parsed date are kept in the permanent project details store. Unseen
+        URLs (and ones whose date couldn't be read before) are fetched,
+        concurrently, in one batch.
+        """
+        store = get_project_details_store()
+        details = {}
+        missing = []
+        for url in project_urls:
+            stored = store.get(url)
+            if stored is not None and stored.get('submission_date'):
+                details[url] = stored
+            elif url not in missing:
+                missing.append(url)
+
+        if missing:
+            print(f"  📅 Fetching details for {len(missing)} projects ({len(details)} already stored)")
+            with ThreadPoolExecutor(max_workers=SCRAPER_MAX_CONCURRENCY_PER_HOST) as executor:
+                fetched = dict(zip(missing, executor.map(self._fetch_one_project_details, missing)))
+            fetched = {url: info for url, info in fetched.items() if info is not None}
+            # Failed fetches, truncated bodies and unmatched date markup are retried next time
+            store.update({url: info for url, info in fetched.items() if info.get('submission_date')})
+            details.update(fetched)
+
+        return details
+
+    def _fetch_one_project_details(self, project_url):
+        """Fetch one project page; None if it couldn't be loaded"""
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             }
 
-            response = requests.get(project_url, headers=headers, timeout=10)
+            response = get_http_client().get(
+                project_url, headers=headers, timeout=10,
+                max_bytes=HTTP_MAX_PAGE_BYTES, content_types=HTML_CONTENT_TYPES
+            )
             if response.status_code != 200:
                 return None
 
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Find the time element
-            time_elem = soup.find('time', class_='timeago')
-            if time_elem and time_elem.get('datetime'):
-                from datetime import datetime
-                date_str = time_elem.get('datetime')
-                date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                return date_obj.strftime('%b %d, %Y')
+            info = extract_submission_details(parse_html(response.content))
+            info['full_description'] = truncate_to_word_limit(info['full_description'], 300)
+            return info
         except Exception as e:
             # Silently fail - dates are nice to have but not critical
-            pass
-        return None
+            return None
 
     def search_devpost(self, query_obj, max_pages=3):
         """Search Devpost with strict word limits on descriptions"""
-        query = query_obj['query']
+        return self.search_devpost_many([query_obj], max_pages)[0]
 
-        # Check cache
-        cache_key = f"devpost:{query}"
-        if cache_key in self.search_cache:
-            print(f"\n🔍 Devpost: '{query}' (CACHED)")
-            return self.search_cache[cache_key]
-
-        print(f"\n🔍 Devpost: '{query}'")
+    def search_devpost_many(self, query_objs, max_pages=3):
+        """Search Devpost for several strategies at once - returns one result list per strategy
 
+        Pages are fetched in waves under the shared devpost.com rate limit:
+        page 1 of every query concurrently, then page n+1 only for queries
+        whose page n was full. Pages are then processed in strategy and page
+        order, so URL and hash dedup behave as in a sequential search.
+        """
+        queries = [query_obj['query'] for query_obj in query_objs]
+        to_fetch = [query for query in dict.fromkeys(queries) if f"devpost:{query}" not in self.search_cache]
+
+        fetched_pages = {}
+        with ThreadPoolExecutor(max_workers=SCRAPER_MAX_CONCURRENCY_PER_HOST) as executor:
+            for page in range(1, max_pages + 1):
+                jobs = [(query, page) for query in to_fetch]
+                fetched_pages.update(zip(jobs, executor.map(lambda job: self._fetch_search_page(*job), jobs)))
+                to_fetch = [query for query in to_fetch
+                            if len(fetched_pages[(query, page)][0] or []) >= DEVPOST_SEARCH_PAGE_SIZE]
+
+        all_results = []
+        new_results = []
+        for query in queries:
+            # Check cache
+            cache_key = f"devpost:{query}"
+            if cache_key in self.search_cache:
+                print(f"\n🔍 Devpost: '{query}' (CACHED)")
+                all_results.append(self.search_cache[cache_key])
+                continue
+
+            print(f"\n🔍 Devpost: '{query}'")
+            results = self._collect_search_results(
+                query, [fetched_pages.get((query, page), ([], None)) for page in range(1, max_pages + 1)]
+            )
+            print(f"  ✓ Total: {len(results)} unique projects (after deduplication and exclusion)")
+            if self.exclude_url:
+                print(f"  🔒 Excluded URL: {self.exclude_url}")
+
+            # Cache results
+            self.search_cache[cache_key] = results
+            all_results.append(results)
+            new_results.extend(results)
+
+        # Submission dates and full descriptions for every new result, fetched in one concurrent batch
+        details = self._fetch_project_details([result['url'] for result in new_results])
+        for result in new_results:
+            info = details.get(result['url'])
+            if info:
+                result['submission_date'] = info.get('submission_date')
+                result['full_description'] = info.get('full_description', '')
+                if result['submission_date']:
+                    print(f"    📅 {result['name']}: {result['submission_date']}")
+
+        return all_results
+
+    def _fetch_search_page(self, query, page):
+        """Fetch one search result page - returns (project links, error message)"""
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -358,110 +448,103 @@ Generate queries now:"""
             'Upgrade-Insecure-Requests': '1'
         }
 
+        try:
+            search_url = f"{self.devpost_base}/software/search"
+            params = {'page': page, 'query': query}
+
+            response = get_http_client().get(search_url, params=params, headers=headers, timeout=15)
+
+            if response.status_code != 200:
+                return None, f"Page {page} status: {response.status_code}"
+
+            soup = parse_html(response.content, parse_only=SEARCH_RESULT_STRAINER)
+            return soup.find_all('a', class_='block-wrapper-link'), None
+
+        except Exception as e:
+            return None, f"Page {page} error: {e}"
+
+    def _collect_search_results(self, query, pages):
+        """Turn fetched search pages into results, stopping at the first failed or empty page"""
         results = []
         seen_urls = set()
 
-        for page in range(1, max_pages + 1):
-            try:
-                search_url = f"{self.devpost_base}/software/search"
-                params = {'page': page, 'query': query}
+        for page, (project_links, error) in enumerate(pages, 1):
+            if error:
+                print(f"  ⚠️ {error}")
+                break
 
-                response = requests.get(search_url, params=params, headers=headers, timeout=15)
+            if not project_links:
+                break
 
-                if response.status_code != 200:
-                    print(f"  ⚠️ Page {page} status: {response.status_code}")
-                    break
+            print(f"  📦 Devpost page {page} returned {len(project_links)} project links")
 
-                soup = BeautifulSoup(response.content, 'html.parser')
-                project_links = soup.find_all('a', class_='block-wrapper-link')
+            page_results = 0
+            for link in project_links:
+                try:
+                    project_url = link.get('href', '')
+                    if not project_url.startswith('http'):
+                        project_url = self.devpost_base + project_url
 
-                if not project_links:
-                    break
+                    # Check if this is the excluded URL (submitted project)
+                    normalized_project_url = self._normalize_url(project_url)
 
-                print(f"  📦 Devpost page {page} returned {len(project_links)} project links")
+                    if self.exclude_url and normalized_project_url == self.exclude_url:
+                        print(f"  ⏭️ Skipping submitted project (URL: {normalized_project_url})")
+                        continue
 
-                page_results = 0
-                for link in project_links:
-                    try:
-                        project_url = link.get('href', '')
-                        if not project_url.startswith('http'):
-                            project_url = self.devpost_base + project_url
-
-                        # Check if this is the excluded URL (submitted project)
-                        normalized_project_url = self._normalize_url(project_url)
-
-                        if self.exclude_url and normalized_project_url == self.exclude_url:
-                            print(f"  ⏭️ Skipping submitted project (URL: {normalized_project_url})")
-                            continue
-
-                        if project_url in seen_urls:
-                            continue
-                        seen_urls.add(project_url)
-
-                        entry = link.find('div', class_='software-entry')
-                        if not entry:
-                            continue
-
-                        name_elem = entry.find('h5')
-                        name = name_elem.get_text(strip=True) if name_elem else 'Unknown'
-
-                        tagline_elem = entry.find('p', class_='tagline')
-                        raw_description = tagline_elem.get_text(strip=True) if tagline_elem else 'No description'
-
-                        # ENFORCE 300 WORD LIMIT
-                        limited_description = truncate_to_word_limit(raw_description, 300)
-
-                        # Generate hash
-                        proj_hash = generate_project_hash(limited_description)
-
-                        # Skip duplicates
-                        if proj_hash in self.processed_projects:
-                            print(f"  ⏭️ Skipping duplicate: {name}")
-                            continue
-
-                        self.processed_projects.add(proj_hash)
-
-                        winner_badge = entry.find('aside', class_='entry-badge')
-                        is_winner = bool(winner_badge and 'winner' in winner_badge.get_text().lower())
-
-                        likes = self._extract_number(entry.find('span', class_='like-count'))
-                        comments = self._extract_number(entry.find('span', class_='comment-count'))
-
-                        # Fetch submission date from the individual project page for ALL projects
-                        submission_date = self._fetch_project_date(project_url)
-                        if submission_date:
-                            print(f"    📅 {submission_date}")
-
-                        results.append({
-                            'platform': 'Devpost',
-                            'name': name,
-                            'description': limited_description,  # TRUNCATED
-                            'url': project_url,
-                            'likes': likes,
-                            'comments': comments,
-                            'is_winner': is_winner,
-                            'search_query': query,
-                            'hash': proj_hash,
-                            'submission_date': submission_date
-                        })
-                        page_results += 1
-
-                    except Exception as e:
+                    if project_url in seen_urls:
                         continue
+                    seen_urls.add(project_url)
 
-                print(f"  Page {page}: {page_results} projects")
-                time.sleep(2)  # Rate limiting
+                    entry = link.find('div', class_='software-entry')
+                    if not entry:
+                        continue
 
-            except Exception as e:
-                print(f"  ⚠️ Page {page} error: {e}")
-                break
+                    name_elem = entry.find('h5')
+                    name = name_elem.get_text(strip=True) if name_elem else 'Unknown'
 
-        print(f"  ✓ Total: {len(results)} unique projects (after deduplication and exclusion)")
-        if self.exclude_url:
-            print(f"  🔒 Excluded URL: {self.exclude_url}")
+                    tagline_elem = entry.find('p', class_='tagline')
+                    raw_description = tagline_elem.get_text(strip=True) if tagline_elem else 'No description'
+
+                    # ENFORCE 300 WORD LIMIT
+                    limited_description = truncate_to_word_limit(raw_description, 300)
+
+                    # Generate hash
+                    proj_hash = generate_project_hash(limited_description)
+
+                    # Skip duplicates
+                    if proj_hash in self.processed_projects:
+                        print(f"  ⏭️ Skipping duplicate: {name}")
+                        continue
+
+                    self.processed_projects.add(proj_hash)
+
+                    winner_badge = entry.find('aside', class_='entry-badge')
+                    is_winner = bool(winner_badge and 'winner' in winner_badge.get_text().lower())
+
+                    likes = self._extract_number(entry.find('span', class_='like-count'))
+                    comments = self._extract_number(entry.find('span', class_='comment-count'))
+
+                    results.append(ProjectRecord.from_dict({
+                        'platform': 'Devpost',
+                        'name': name,
+                        'description': limited_description,  # TRUNCATED
+                        'url': project_url,
+                        'likes': likes,
+                        'comments': comments,
+                        'is_winner': is_winner,
+                        'search_query': query,
+                        'hash': proj_hash,
+                        'submission_date': None,
+                        'full_description': ''
+                    }))
+                    page_results += 1
+
+                except Exception as e:
+                    continue
+
+            print(f"  Page {page}: {page_results} projects")
 
-        # Cache results
-        self.search_cache[cache_key] = results
         return results
 
     def _extract_number(self, element):
@@ -707,6 +790,8 @@ JSON:
                     f.write(f"Winner: {'Yes' if proj.get('is_winner') else 'No'}\n")
 
                 f.write(f"\nDescription:\n{proj['description']}\n")
+                if proj.get('full_description'):
+                    f.write(f"\nFull Description:\n{proj['full_description']}\n")
 
     def analyze_fraud(self, project_info):
         """Main fraud detection analysis"""
@@ -733,18 +818,14 @@ JSON:
         print("\n" + "="*100)
         print("SEARCHING DEVPOST (PRIORITY)")
         print("="*100)
-        for strategy in search_strategies:
-            results = self.search_devpost(strategy, max_pages=2)
+        for results in self.search_devpost_many(search_strategies, max_pages=2):
             all_projects.extend(results)
-            time.sleep(1)
 
         print("\n" + "="*100)
         print("SEARCHING GITHUB (SUPPLEMENTARY)")
         print("="*100)
-        for strategy in search_strategies:
-            results = self.search_github(strategy, max_results=8)
+        for results in self.search_github_many(search_strategies, max_results=8):
             all_projects.extend(results)
-            time.sleep(1)
 
         print(f"\n📊 Total unique projects found: {len(all_projects)}")
         print(f"   Devpost: {sum(1 for p in all_projects if p['platform'] == 'Devpost')}")
@@ -788,7 +869,7 @@ JSON:
         return {
             'fraud_risk': ai_analysis.get('fraud_risk'),
             'originality_score': ai_analysis.get('originality_score'),
-            'similar_projects': all_projects,
+            'similar_projects': [proj.to_dict() for proj in all_projects],
             'ai_analysis': ai_analysis
         }
 
@@ -0,0 +1,164 @@
+"""Test the SQLite corpus store on a temporary event folder
+
+Run from the repo root:
+    python -m api.tests.test_corpus_store
+"""
+import json
+import os
+import random
+import tempfile
+
+from api.utils.corpus_store import CorpusStore
+from api.utils.packed_corpus import PackedCorpus
+
+
+def _project(title, technologies, submission_date=None):
+    return {
+        'title': title,
+        'url': f"https://devpost.com/software/{title.lower()}",
+        'technologies': technologies,
+        'submission_date': submission_date
+    }
+
+
+def make_event_folder(base_dir, name, projects):
+    folder = os.path.join(base_dir, name)
+    os.makedirs(folder)
+    for i, project in enumerate(projects, 1):
+        with open(os.path.join(folder, f"project_{i:03d}_{project['title']}.json"), 'w', encoding='utf-8') as f:
+            json.dump(project, f)
+    return folder
+
+
+def test_import_and_load_event():
+    base_dir = tempfile.mkdtemp()
+    projects = [_project('Alpha', ['Python']), _project('Beta', ['Rust']), _project('Gamma', [])]
+    folder = make_event_folder(base_dir, 'treehacks_2023', projects)
+    store = CorpusStore(os.path.join(base_dir, 'corpus.db'))
+
+    assert not store.has_event('treehacks_2023')
+    assert store.import_folder(folder) == 3
+    assert store.has_event('treehacks_2023')
+    assert store.load_event('treehacks_2023') == projects, "projects should load in file order"
+
+    # Re-importing replaces rows instead of duplicating them
+    store.import_folder(folder)
+    assert len(store.load_event('treehacks_2023')) == 3
+    print("✅ Event folders import and load in file order")
+
+
+def test_find_projects_by_technology_and_date():
+    base_dir = tempfile.mkdtemp()
+    store = CorpusStore(os.path.join(base_dir, 'corpus.db'))
+    store.put_project('ev_a', 'project_001_Old.json', _project('Old', ['Flutter'], 'Mar 02, 2022'))
+    store.put_project('ev_b', 'project_001_New.json', _project('New', ['flutter', 'Firebase'], 'Oct 20, 2024'))
+    store.put_project('ev_b', 'project_002_Other.json', _project('Other', ['React'], 'Oct 21, 2024'))
+    store.put_project('ev_b', 'project_003_Loser.json', _project('Loser', ['Flutter'], 'Oct 21, 2024'), is_winner=False)
+
+    titles = [p['title'] for p in store.find_projects(technology='Flutter', since='2023-01-01')]
+    assert titles == ['New'], titles
+    assert [p['title'] for p in store.find_projects(technology='flutter')] == ['New', 'Old']
+    assert len(store.find_projects(technology='flutter', winners_only=False)) == 3
+
+    store.delete_event('ev_b')
+    assert not store.has_event('ev_b') and store.has_event('ev_a')
+    print("✅ Cross-event queries use the technology, winner and date indexes")
+
+
+def test_duplicate_projects_are_stored_once():
+    base_dir = tempfile.mkdtemp()
+    store = CorpusStore(os.path.join(base_dir, 'corpus.db'))
+    shared = _project('Blog', ['Python'])
+    shared['images'] = [{'src': 'https://d2dmyh35ffsxbl.cloudfront.net/assets/reimagine2/devpost-logo.svg', 'alt': ''},
+                        {'src': 'https://example.com/screenshot.png', 'alt': 'demo'}]
+    shared['links'] = [{'text': 'Twitter', 'url': 'https://twitter.com/devpost'},
+                       {'text': 'GitHub', 'url': 'https://github.com/octo/blog'}]
+    for event in ('ev_a', 'ev_b', 'ev_c'):
+        store.put_project(event, 'project_001_Blog.json', shared)
+
+    stats = store.get_stats()
+    assert stats['project_references'] == 3 and stats['unique_projects'] == 1, stats
+    loaded = store.load_event('ev_b')[0]
+    assert [image['alt'] for image in loaded['images']] == ['demo'], "site chrome images should be stripped"
+    assert [link['text'] for link in loaded['links']] == ['GitHub'], "site chrome links should be stripped"
+    assert len(store.find_projects(technology='python')) == 1
+
+    # Contents no event references any more are dropped
+    store.put_project('ev_a', 'project_001_Blog.json', dict(shared, description='edited'))
+    store.delete_event('ev_b')
+    store.delete_event('ev_c')
+    assert store.get_stats()['unique_projects'] == 1
+    print("✅ Identical projects across events are stored once, without site chrome")
+
+
+def test_event_records_load_heavy_fields_lazily():
+    base_dir = tempfile.mkdtemp()
+    store = CorpusStore(os.path.join(base_dir, 'corpus.db'))
+    project = dict(_project('Alpha', ['Python', 'React']), full_content='long page text',
+                   images=[{'src': 'https://example.com/a.png', 'alt': ''}], links=[])
+    store.put_project('ev_a', 'project_001_Alpha.json', project)
+
+    record = store.load_event_records('ev_a')[0]
+    assert record['title'] == 'Alpha' and record.get('technologies')[:1] == ('Python',)
+    assert record.get('tagline', '') == '' and 'tagline' not in record
+    assert record._loader is not None, "heavy fields should not be decoded up front"
+    assert record['full_content'] == 'long page text'
+    assert record._loader is None
+    assert record.to_dict() == project
+
+    record['ai_similarity'] = 80
+    record['custom'] = 'kept'
+    assert record.to_dict()['ai_similarity'] == 80 and record['custom'] == 'kept'
+    print("✅ Event records are compact and load full_content, images and links on demand")
+
+
+def test_packed_corpus_samples_only_requested_events():
+    base_dir = tempfile.mkdtemp()
+    store = CorpusStore(os.path.join(base_dir, 'corpus.db'))
+    for event in ('ev_a', 'ev_b', 'ev_c'):
+        for i in range(5):
+            store.put_project(event, f"project_{i:03d}.json", _project(f"{event}_{i}", ['Python']))
+    corpus = PackedCorpus(os.path.join(base_dir, 'corpus.pack'), store)
+
+    assert corpus.count() == 15 and corpus.count(['ev_a', 'ev_c']) == 10
+    sample = corpus.sample(['ev_a', 'ev_c'], 6, random.Random(7))
+    titles = [record['title'] for record in sample]
+    assert len(set(titles)) == 6 and all(not title.startswith('ev_b') for title in titles), titles
+    assert len(corpus.sample(['ev_b'], 100)) == 5
+
+    # Writing to the store invalidates the pack
+    store.put_project('ev_b', 'project_005.json', _project('ev_b_5', ['Go']))
+    assert corpus.count(['ev_b']) == 6
+    assert sample[0].to_dict()['technologies'] == ['Python']
+    corpus.close()
+    print("✅ Packed corpus samples from the requested events and rebuilds after store writes")
+
+
+def test_packed_corpus_reopens_pack_rebuilt_by_another_instance():
+    base_dir = tempfile.mkdtemp()
+    store = CorpusStore(os.path.join(base_dir, 'corpus.db'))
+    for i in range(4):
+        store.put_project('ev_a', f"project_{i:03d}.json", _project(f"ev_a_{i}", ['Python']))
+    path = os.path.join(base_dir, 'corpus.pack')
+    first, second = PackedCorpus(path, store), PackedCorpus(path, store)
+    assert first.count() == second.count() == 4
+
+    # second rebuilds for the new revision; first finds the pack already current and remaps it
+    store.put_project('ev_a', 'project_004.json', _project('ev_a_4', ['Go']))
+    assert second.count() == 5
+    assert first.count() == 5 and len(first._files) == 2
+    titles = {record['title'] for record in first.sample(['ev_a'], 10, random.Random(1))}
+    assert titles == {f"ev_a_{i}" for i in range(5)}, titles
+    first.close()
+    second.close()
+    print("✅ A pack rebuilt by another instance is remapped, not read through stale maps")
+
+
+if __name__ == "__main__":
+    test_import_and_load_event()
+    test_find_projects_by_technology_and_date()
+    test_duplicate_projects_are_stored_once()
+    test_event_records_load_heavy_fields_lazily()
+    test_packed_corpus_samples_only_requested_events()
+    test_packed_corpus_reopens_pack_rebuilt_by_another_instance()
+    print("\nAll corpus store tests passed")
@@ -0,0 +1,104 @@
+"""Test crawl journal resumes and per-event manifests on temporary folders
+
+Run from the repo root:
+    python -m api.tests.test_crawl_journal
+"""
+import os
+import tempfile
+import time
+
+from api.utils.crawl_journal import COMPLETE, EMPTY, CrawlJournal
+from api.utils.event_manifest import EventManifest, content_hash
+from api.utils.site_chrome import strip_site_chrome
+from api.utils.storage import read_json, write_json
+
+EVENT_URL = 'https://treehacks-2023.devpost.com'
+
+
+def _winners(count):
+    return [{'title': f"P{i}", 'url': f"https://devpost.com/software/p{i}"} for i in range(1, count + 1)]
+
+
+def _project(i, **extra):
+    return dict({'title': f"P{i}", 'url': f"https://devpost.com/software/p{i}", 'technologies': ['Python']}, **extra)
+
+
+def test_interrupted_crawl_resumes_from_disk():
+    path = os.path.join(tempfile.mkdtemp(), 'crawl_journal.json')
+    journal = CrawlJournal(path)
+    winners = _winners(4)
+    journal.start_event(EVENT_URL, '/tmp/treehacks_2023', winners)
+    journal.mark_done(EVENT_URL, winners[0]['url'], 'project_001_P1.json')
+    journal.mark_failed(EVENT_URL, [winners[1]['url']])
+
+    # A new process reads the same journal: same winners, only unsaved ones pending
+    resumed = CrawlJournal(path)
+    assert resumed.is_in_progress(EVENT_URL) and resumed.in_progress_events() == [EVENT_URL]
+    assert resumed.event(EVENT_URL)['winners'] == winners
+    assert [w['title'] for w in resumed.pending(EVENT_URL)] == ['P2', 'P3', 'P4'], "failures are retried"
+
+    for i, winner in enumerate(winners[1:], 2):
+        resumed.mark_done(EVENT_URL, winner['url'], f"project_{i:03d}_P{i}.json")
+    resumed.finish_event(EVENT_URL)
+
+    event = CrawlJournal(path).event(EVENT_URL)
+    assert event['status'] == COMPLETE and not event['failed'] and len(event['done']) == 4
+    print("✅ An interrupted crawl resumes with the same winners and only the unsaved ones pending")
+
+
+def test_event_without_saved_winners_is_empty():
+    journal = CrawlJournal(os.path.join(tempfile.mkdtemp(), 'crawl_journal.json'))
+    journal.start_event(EVENT_URL, '/tmp/treehacks_2023', _winners(2))
+    journal.mark_failed(EVENT_URL, [w['url'] for w in _winners(2)])
+    journal.finish_event(EVENT_URL)
+    assert journal.event(EVENT_URL)['status'] == EMPTY and not journal.is_in_progress(EVENT_URL)
+    print("✅ An event whose winners all failed finishes as empty")
+
+
+def test_manifest_records_and_reloads():
+    folder = tempfile.mkdtemp()
+    manifest = EventManifest(folder, EVENT_URL)
+    manifest.record(_project(1)['url'], 'project_001_P1.json', _project(1), {'etag': '"v1"'})
+    manifest.record(_project(7)['url'], 'project_007_P7.json', _project(7))
+    manifest.save()
+
+    loaded = EventManifest.load(folder)
+    assert loaded.data['hackathon_url'] == EVENT_URL and loaded.updated_at is not None
+    assert loaded.files() == ['project_001_P1.json', 'project_007_P7.json']
+    assert loaded.next_index() == 8
+    entry = loaded.get(_project(1)['url'])
+    assert entry['etag'] == '"v1"' and entry['content_hash'] == content_hash(_project(1))
+
+    loaded.mark_checked(_project(1)['url'], {'etag': '"v2"'})
+    assert loaded.get(_project(1)['url'])['etag'] == '"v2"'
+    assert EventManifest.load(tempfile.mkdtemp()) is None
+    print("✅ Manifests record files, hashes and validators and reload from disk")
+
+
+def test_manifest_backfill_from_legacy_folder():
+    folder = tempfile.mkdtemp()
+    chrome_link = {'text': 'Devpost', 'url': 'https://twitter.com/devpost'}
+    legacy = _project(1, links=[chrome_link, {'text': 'Demo', 'url': 'https://example.com'}])
+    write_json(os.path.join(folder, 'project_001_P1.json'), legacy)
+    write_json(os.path.join(folder, 'project_002_P2.json'), _project(2), codec='gzip')
+    old = time.time() - 30 * 24 * 3600
+    for name in os.listdir(folder):
+        os.utime(os.path.join(folder, name), (old, old))
+
+    manifest = EventManifest.from_folder(folder, EVENT_URL)
+    assert manifest.files() == ['project_001_P1.json', 'project_002_P2.json']
+    assert manifest.get(legacy['url'])['content_hash'] == content_hash(strip_site_chrome(legacy)), \
+        "hashes should match what a refresh computes from stripped pages"
+    assert abs(manifest.updated_at.timestamp() - old) < 1, "updated_at comes from the files' mtimes"
+
+    manifest.save(touch=False)
+    assert read_json(manifest.path)['updated_at'] == manifest.data['updated_at']
+    print("✅ Legacy folders backfill a manifest dated by file mtimes, with chrome-stripped hashes")
+
+
+if __name__ == "__main__":
+    test_interrupted_crawl_resumes_from_disk()
+    test_event_without_saved_winners_is_empty()
+    test_manifest_records_and_reloads()
+    test_manifest_backfill_from_legacy_folder()
+    print("\nAll crawl journal and manifest tests passed")
@@ -0,0 +1,161 @@
+"""Test the GitHub search backend against a local mock GitHub server
+
+Run from the repo root:
+    python -m api.tests.test_github_search
+"""
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from api.services.github_search import GitHubSearch
+from api.utils.http_cache import HttpCache
+from api.utils.http_client import HttpClient, get_http_client
+
+SEARCH_ETAG = '"search-v1"'
+
+
+def _repo(name):
+    return {
+        'name': name,
+        'full_name': f"octo/{name}",
+        'description': f"{name} repository",
+        'html_url': f"https://github.com/octo/{name}",
+        'stargazers_count': 42,
+        'language': 'Python',
+        'created_at': '2024-01-01T00:00:00Z',
+        'updated_at': '2024-06-01T00:00:00Z'
+    }
+
+
+class MockGitHub(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, payload=None, headers=None, resource='search'):
+        body = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-RateLimit-Limit', '30')
+        self.send_header('X-RateLimit-Remaining', '29')
+        self.send_header('X-RateLimit-Reset', '4102444800')
+        self.send_header('X-RateLimit-Resource', resource)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        MockGitHub.requests_seen.append(('GET', url.path, dict(self.headers)))
+        if url.path != '/search/repositories':
+            return self._send(404, {'message': 'Not Found'})
+        if self.headers.get('If-None-Match') == SEARCH_ETAG:
+            return self._send(304, headers={'ETag': SEARCH_ETAG})
+        query = parse_qs(url.query)['q'][0]
+        self._send(200, {'items': [_repo(f"{query}-{i}") for i in range(3)]}, {'ETag': SEARCH_ETAG})
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        MockGitHub.requests_seen.append(('POST', self.path, dict(self.headers)))
+        if self.headers.get('Authorization') != 'Bearer test-token':
+            return self._send(401, {'message': 'Bad credentials'}, resource='graphql')
+
+        data = {
+            alias: {'nodes': [{
+                'name': f"{query.replace(' sort:stars', '')}-gql",
+                'nameWithOwner': f"octo/{alias}",
+                'description': None,
+                'url': f"https://github.com/octo/{alias}",
+                'stargazerCount': 7,
+                'primaryLanguage': {'name': 'Rust'},
+                'createdAt': '2024-01-01T00:00:00Z',
+                'updatedAt': '2024-06-01T00:00:00Z'
+            }]}
+            for alias, query in body['variables'].items()
+        }
+        data['rateLimit'] = {'limit': 5000, 'remaining': 4999, 'resetAt': '2100-01-01T00:00:00Z', 'cost': 1}
+        self._send(200, {'data': data}, resource='graphql')
+
+
+_server = None
+
+
+def mock_base_url():
+    """Start the mock server on first use and return its base URL"""
+    global _server
+    if _server is None:
+        _server = ThreadingHTTPServer(('127.0.0.1', 0), MockGitHub)
+        threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{_server.server_address[1]}"
+
+
+def fresh_client():
+    """Dedicated client (the shared one is left alone) with an empty cache that revalidates on every request"""
+    client = HttpClient()
+    client.cache = HttpCache(cache_dir=tempfile.mkdtemp(), ttls={'default': 0})
+    return client
+
+
+def test_rest_search_revalidates_with_etag():
+    base_url = mock_base_url()
+    shared = get_http_client()
+    MockGitHub.requests_seen.clear()
+    github = GitHubSearch(token='', api_base=base_url, client=fresh_client())
+
+    first = github.search_repositories('voice notes', max_results=2)
+    second = github.search_repositories('voice notes', max_results=2)
+
+    assert [repo['name'] for repo in first] == ['voice notes-0', 'voice notes-1']
+    assert second == first, "304 should serve the cached body"
+    assert MockGitHub.requests_seen[1][2].get('If-None-Match') == SEARCH_ETAG
+    assert 'Authorization' not in MockGitHub.requests_seen[0][2]
+
+    stats = github.get_stats()
+    assert stats['rest_requests'] == 1 and stats['cache_hits'] == 1, stats
+    assert stats['quota']['search']['remaining'] == 29, stats
+    assert get_http_client() is shared, "tests must not replace the process-wide client"
+    print("✅ REST search sends If-None-Match and serves 304s from cache")
+
+
+def test_graphql_batches_queries():
+    base_url = mock_base_url()
+    MockGitHub.requests_seen.clear()
+    github = GitHubSearch(token='test-token', api_base=base_url, client=fresh_client())
+
+    queries = [f"query {i}" for i in range(7)]
+    results = github.search_many(queries, max_results=3)
+
+    posts = [r for r in MockGitHub.requests_seen if r[0] == 'POST']
+    assert len(posts) == 2, f"7 queries should take 2 GraphQL requests, took {len(posts)}"
+    assert not [r for r in MockGitHub.requests_seen if r[0] == 'GET']
+    assert [items[0]['name'] for items in results] == [f"query {i}-gql" for i in range(7)]
+    assert results[0][0]['html_url'] and results[0][0]['language'] == 'Rust'
+
+    stats = github.get_stats()
+    assert stats['graphql_requests'] == 2 and stats['graphql_queries'] == 7, stats
+    assert stats['quota']['graphql']['remaining'] == 4999, stats
+    print("✅ GraphQL batches strategy queries and reports quota")
+
+
+def test_graphql_failure_falls_back_to_rest():
+    base_url = mock_base_url()
+    MockGitHub.requests_seen.clear()
+    github = GitHubSearch(token='wrong-token', api_base=base_url, client=fresh_client())
+
+    results = github.search_many(['a', 'b'], max_results=1)
+
+    assert [items[0]['name'] for items in results] == ['a-0', 'b-0']
+    assert github.get_stats()['errors'] == 1
+    print("✅ Failed GraphQL request falls back to REST search")
+
+
+if __name__ == "__main__":
+    test_rest_search_revalidates_with_etag()
+    test_graphql_batches_queries()
+    test_graphql_failure_falls_back_to_rest()
+    print("\nAll GitHub search tests passed")
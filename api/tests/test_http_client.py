@@ -0,0 +1,192 @@
+"""Test the shared HTTP client's rate limiter and disk cache against a local mock server
+
+Run from the repo root:
+    python -m api.tests.test_http_client
+"""
+import os
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import requests
+
+from api.utils.http_cache import HttpCache
+from api.utils.http_client import HttpClient
+from api.utils.rate_limiter import HostRateLimiter, parse_retry_after
+
+PAGE_ETAG = '"page-v1"'
+PAGE_BODY = b'<html><body><h1>Project</h1></body></html>'
+
+
+class MockSite(BaseHTTPRequestHandler):
+    requests_seen = []
+    throttle_next = 0  # Answer this many requests with 429 first
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        MockSite.requests_seen.append((self.path, dict(self.headers)))
+        if MockSite.throttle_next:
+            MockSite.throttle_next -= 1
+            return self._send(429, headers={'Retry-After': '0'})
+        if self.headers.get('If-None-Match') == PAGE_ETAG:
+            return self._send(304, headers={'ETag': PAGE_ETAG})
+        self._send(200, PAGE_BODY, {'ETag': PAGE_ETAG})
+
+
+_server = None
+
+
+def mock_base_url():
+    """Start the mock server on first use and return its base URL"""
+    global _server
+    if _server is None:
+        _server = ThreadingHTTPServer(('127.0.0.1', 0), MockSite)
+        threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{_server.server_address[1]}"
+
+
+def make_client(ttl):
+    """Dedicated client with a fast rate limit and an empty cache using one TTL for every URL"""
+    client = HttpClient()
+    client.limiter = HostRateLimiter({'default': (100.0, 10)})
+    client.cache = HttpCache(cache_dir=tempfile.mkdtemp(), ttls={'default': ttl})
+    return client
+
+
+def _response(status, headers=None):
+    return SimpleNamespace(status_code=status, headers=headers or {})
+
+
+def test_retry_after_parsing():
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after(None) is None and parse_retry_after('soon') is None
+    in_a_minute = parse_retry_after(formatdate(time.time() + 60, usegmt=True))
+    assert 55 <= in_a_minute <= 60, in_a_minute
+    assert parse_retry_after(formatdate(time.time() - 60, usegmt=True)) == 0.0
+    print("✅ Retry-After parses as delta-seconds or an HTTP date")
+
+
+def test_429_backs_off_and_honours_retry_after():
+    limiter = HostRateLimiter({'default': (10.0, 4)})
+    url = 'https://devpost.com/software/search'
+
+    limiter.update(url, _response(429, {'Retry-After': '30'}))
+    bucket = limiter.get_bucket(url)
+    assert bucket.rate == 5.0, bucket.rate
+    assert bucket.blocked_until - time.monotonic() > 25
+    assert not limiter.has_idle_budget(url)
+    assert limiter.get_stats()['default']['throttled_responses'] == 1
+
+    bucket.blocked_until = 0.0
+    for _ in range(10):
+        limiter.update(url, _response(200))
+    assert bucket.rate == 10.0, "successes should recover the pace up to the ceiling"
+    print("✅ 429 halves the pace and pauses for Retry-After; successes recover it")
+
+
+def test_github_quota_headers_set_the_pace():
+    limiter = HostRateLimiter({'api.github.com': (10.0, 4), 'default': (4.0, 8)})
+    url = 'https://api.github.com/search/repositories'
+    bucket = limiter.get_bucket(url)
+
+    reset = str(int(time.time()) + 100)
+    limiter.update(url, _response(200, {'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': reset}))
+    assert 0.45 <= bucket.rate <= 0.55, bucket.rate
+
+    limiter.update(url, _response(200, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset}))
+    assert bucket.blocked_until - time.monotonic() > 90, "an exhausted quota pauses until the reset"
+    assert limiter.get_bucket('https://devpost.com/').rate == 4.0, "other hosts are unaffected"
+    print("✅ X-RateLimit-Remaining / Reset spread the quota and pause when it runs out")
+
+
+def test_client_retries_429():
+    url = mock_base_url() + '/software/throttled'
+    client = make_client(ttl=0)
+    MockSite.requests_seen.clear()
+    MockSite.throttle_next = 1
+
+    response = client.get(url, use_cache=False)
+    assert response.status_code == 200 and response.content == PAGE_BODY
+    assert len(MockSite.requests_seen) == 2
+    assert client.get_rate_limit_stats()['default']['throttled_responses'] == 1
+    print("✅ The client retries a 429 after its Retry-After")
+
+
+def test_cache_revalidates_with_304():
+    url = mock_base_url() + '/software/cached'
+    client = make_client(ttl=0)
+    MockSite.requests_seen.clear()
+
+    first = client.get(url)
+    second = client.get(url)
+    assert first.content == second.content == PAGE_BODY
+    assert getattr(second, 'from_cache', False)
+    assert MockSite.requests_seen[1][1].get('If-None-Match') == PAGE_ETAG
+
+    stats = client.get_cache_stats()
+    assert (stats['misses'], stats['revalidated'], stats['stores']) == (1, 1, 1), stats
+    print("✅ Stale entries are revalidated with If-None-Match and a 304 serves the stored body")
+
+
+def test_fresh_entries_skip_the_network():
+    url = mock_base_url() + '/software/fresh'
+    client = make_client(ttl=3600)
+    MockSite.requests_seen.clear()
+
+    client.get(url)
+    assert client.get(url).content == PAGE_BODY
+    assert len(MockSite.requests_seen) == 1
+    assert client.get_cache_stats()['hits'] == 1
+    print("✅ Fresh entries are served from disk without a request")
+
+
+def _stored_response(url, body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers['Content-Type'] = 'text/html'
+    response.url = url
+    return response
+
+
+def test_cache_evicts_least_recently_used():
+    cache = HttpCache(cache_dir=tempfile.mkdtemp(), max_bytes=250, ttls={'default': 3600})
+    urls = [f"https://devpost.com/software/p{i}" for i in range(3)]
+
+    for age, url in zip((300, 200), urls[:2]):
+        cache.store(url, _stored_response(url, b'x' * 100))
+        body_path = cache._paths(url)[1]
+        os.utime(body_path, (time.time() - age, time.time() - age))
+    cache.lookup(urls[0])  # Touch p0, leaving p1 least recently used
+    cache.store(urls[2], _stored_response(urls[2], b'x' * 100))
+
+    assert cache.lookup(urls[1]) is None
+    assert cache.lookup(urls[0]) is not None and cache.lookup(urls[2]) is not None
+    stats = cache.get_stats()
+    assert stats['evictions'] == 1 and stats['bytes'] <= 250, stats
+    print("✅ Past its size limit the cache evicts the least recently used entry")
+
+
+if __name__ == "__main__":
+    test_retry_after_parsing()
+    test_429_backs_off_and_honours_retry_after()
+    test_github_quota_headers_set_the_pace()
+    test_client_retries_429()
+    test_cache_revalidates_with_304()
+    test_fresh_entries_skip_the_network()
+    test_cache_evicts_least_recently_used()
+    print("\nAll HTTP client tests passed")
@@ -0,0 +1,59 @@
+"""Test the process-wide load cache: hits, mtime invalidation and the memory bound
+
+Run from the repo root:
+    python -m api.tests.test_load_cache
+"""
+import json
+import os
+import tempfile
+
+from api.utils.load_cache import LoadCache, file_version
+
+
+def _json_loader(path, calls):
+    def load():
+        calls.append(path)
+        with open(path, 'r', encoding='utf-8') as f:
+            raw = f.read()
+        return json.loads(raw), len(raw)
+    return load
+
+
+def test_hits_until_file_changes():
+    path = os.path.join(tempfile.mkdtemp(), 'rules.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'event_name': 'A'}, f)
+    cache, calls = LoadCache(max_bytes=1024), []
+
+    for _ in range(3):
+        data = cache.get(('rules', path), file_version(path), _json_loader(path, calls))
+    assert data == {'event_name': 'A'} and len(calls) == 1
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'event_name': 'Changed'}, f)
+    os.utime(path, ns=(0, 10**18))  # Different mtime even on coarse-grained filesystems
+    data = cache.get(('rules', path), file_version(path), _json_loader(path, calls))
+    assert data == {'event_name': 'Changed'} and len(calls) == 2
+
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['invalidations']) == (2, 2, 1), stats
+    print("✅ Warm lookups skip the disk until the file's mtime changes")
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = LoadCache(max_bytes=100)
+    for key in ('a', 'b', 'c'):
+        cache.get(key, 1, lambda: (key.upper(), 40))
+    cache.get('a', 1, lambda: ('reloaded', 40))  # Evicted to make room for 'c'
+
+    stats = cache.get_stats()
+    assert stats['evictions'] == 2 and stats['bytes'] <= 100, stats
+    assert cache.get('c', 1, lambda: ('reloaded', 40)) == 'C'
+    assert cache.get('x', 1, lambda: (None, 0)) is None and cache.get_stats()['entries'] == 2
+    print("✅ Cache stays under its byte limit, evicting least recently used entries")
+
+
+if __name__ == "__main__":
+    test_hits_until_file_changes()
+    test_least_recently_used_entries_are_evicted()
+    print("\nAll load cache tests passed")
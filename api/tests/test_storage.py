@@ -0,0 +1,69 @@
+"""Test compressed JSON storage: round-trips per codec, stale variants and logical globbing
+
+Run from the repo root:
+    python -m api.tests.test_storage
+"""
+import os
+import tempfile
+
+from api.utils.storage import (
+    available_codecs, glob_logical, read_json, resolve_codec, stored_path, write_json
+)
+
+PROJECT = {'title': 'Café Finder', 'technologies': ['React', 'Flask'], 'awards': ['1st Place']}
+
+
+def test_every_codec_round_trips():
+    folder = tempfile.mkdtemp()
+    for codec in [None] + available_codecs():
+        path = os.path.join(folder, f"project_{codec}.json")
+        written = write_json(path, PROJECT, codec=codec)
+        assert written == stored_path(path), (written, stored_path(path))
+        assert read_json(path) == PROJECT, codec
+    assert read_json(os.path.join(folder, 'missing.json'), {}) == {}
+    print(f"✅ JSON round-trips through every codec ({', '.join(['plain'] + available_codecs())})")
+
+
+def test_switching_codec_removes_stale_copy():
+    path = os.path.join(tempfile.mkdtemp(), 'rules.json')
+    write_json(path, {'version': 1})
+    write_json(path, {'version': 2}, codec='gzip')
+    assert not os.path.exists(path) and stored_path(path) == path + '.gz'
+    assert read_json(path) == {'version': 2}
+
+    write_json(path, {'version': 3})
+    assert stored_path(path) == path and not os.path.exists(path + '.gz')
+    assert read_json(path) == {'version': 3}
+    print("✅ Only the latest variant of a file is kept on disk")
+
+
+def test_glob_returns_logical_paths():
+    folder = tempfile.mkdtemp()
+    write_json(os.path.join(folder, 'project_001_A.json'), PROJECT)
+    write_json(os.path.join(folder, 'project_002_B.json'), PROJECT, codec='gzip')
+    write_json(os.path.join(folder, 'manifest.json'), {})
+
+    names = [os.path.basename(path) for path in glob_logical(os.path.join(folder, 'project_*.json'))]
+    assert names == ['project_001_A.json', 'project_002_B.json'], names
+    print("✅ Globbing lists logical file names whatever codec they were stored with")
+
+
+def test_codec_resolution():
+    assert resolve_codec(None) is None  # STORAGE_CODEC defaults to plain JSON
+    assert resolve_codec('gzip') == 'gzip'
+    assert resolve_codec('zstd') in ('zstd', 'gzip')
+    try:
+        resolve_codec('brotli')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown codec was accepted")
+    print("✅ Codecs resolve, with zstd falling back to gzip when not installed")
+
+
+if __name__ == "__main__":
+    test_every_codec_round_trips()
+    test_switching_codec_removes_stale_copy()
+    test_glob_returns_logical_paths()
+    test_codec_resolution()
+    print("\nAll storage tests passed")
@@ -0,0 +1,310 @@
+"""
+Indexed SQLite store for scraped past-hackathon projects
+
+Projects are content-addressed: each unique project (site chrome stripped)
+is stored once under its content hash, and events reference it by
+(event, canonical URL). Indexes cover event, URL, winner flag, submission
+date and technology. Loading an event is a single indexed query, and
+cross-event questions ("winners using Flutter since 2023") no longer need
+a scan of every project file.
+
+Event folders (hackathon-data/<event>/project_*.json) are imported with
+import_folder, or all at once (from the repo root) with:
+    python -m api.utils.corpus_store [hackathon-data]
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from functools import partial
+from typing import Dict, List, Any, Optional
+
+from api.config.constants import CORPUS_DB_FILE
+from api.utils.event_manifest import EventManifest, content_hash
+from api.utils.project_record import ProjectRecord, light_fields
+from api.utils.site_chrome import strip_site_chrome
+from api.utils.storage import glob_logical, read_json
+
+# Bump when the layout changes; older databases are rebuilt from the event folders
+SCHEMA_VERSION = 3
+
+# Unique project contents are stored once, keyed by content hash; events reference them
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    name TEXT PRIMARY KEY,
+    hackathon_url TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS projects (
+    hash TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT,
+    submitted_on TEXT,
+    summary TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS event_projects (
+    event TEXT NOT NULL REFERENCES events(name),
+    url TEXT NOT NULL,
+    file TEXT NOT NULL,
+    project_hash TEXT NOT NULL REFERENCES projects(hash),
+    is_winner INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (event, url)
+);
+CREATE TABLE IF NOT EXISTS project_technologies (
+    project_hash TEXT NOT NULL REFERENCES projects(hash) ON DELETE CASCADE,
+    technology TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_event_projects_event ON event_projects(event, file);
+CREATE INDEX IF NOT EXISTS idx_event_projects_hash ON event_projects(project_hash);
+CREATE INDEX IF NOT EXISTS idx_event_projects_winner ON event_projects(is_winner);
+CREATE INDEX IF NOT EXISTS idx_projects_url ON projects(url);
+CREATE INDEX IF NOT EXISTS idx_projects_submitted ON projects(submitted_on);
+CREATE INDEX IF NOT EXISTS idx_technologies ON project_technologies(technology, project_hash);
+"""
+LEGACY_TABLES = ['project_technologies', 'event_projects', 'projects', 'events']
+
+
+def canonical_url(url: str) -> str:
+    """Project URL without scheme differences, query, fragment or trailing slash"""
+    url = url.strip().split('#')[0].split('?')[0].rstrip('/')
+    if url.startswith('http://'):
+        url = 'https://' + url[len('http://'):]
+    return url.replace('://www.', '://', 1)
+
+
+def submission_day(submission_date: Optional[str]) -> Optional[str]:
+    """'Jun 22, 2025' (as scraped) -> '2025-06-22', so dates sort and compare as text"""
+    if not submission_date:
+        return None
+    try:
+        return datetime.strptime(submission_date, '%b %d, %Y').date().isoformat()
+    except ValueError:
+        return None
+
+
+class CorpusStore:
+    def __init__(self, path=CORPUS_DB_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # One connection shared by every thread; the lock serializes access
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA foreign_keys=ON')
+        self._migrate()
+
+    def _migrate(self):
+        version = self._conn.execute('PRAGMA user_version').fetchone()[0]
+        if version < SCHEMA_VERSION:
+            # The store is an index over the event folders: drop and re-import lazily
+            with self._conn:
+                for table in LEGACY_TABLES:
+                    self._conn.execute(f'DROP TABLE IF EXISTS {table}')
+        self._conn.executescript(SCHEMA)
+        self._conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def has_event(self, event: str) -> bool:
+        with self._lock:
+            row = self._conn.execute('SELECT 1 FROM event_projects WHERE event = ? LIMIT 1', (event,)).fetchone()
+        return row is not None
+
+    def put_project(self, event: str, filename: str, project_data: Dict[str, Any],
+                    hackathon_url: str = None, is_winner: bool = True):
+        """Insert or replace one project of an event"""
+        with self._lock, self._conn:
+            self._put_project(event, filename, project_data, hackathon_url, is_winner)
+            self._collect_garbage()
+
+    def _put_project(self, event, filename, project_data, hackathon_url, is_winner):
+        project_data = strip_site_chrome(project_data)
+        project_hash = content_hash(project_data)
+        url = canonical_url(project_data.get('url') or filename)
+
+        self._conn.execute(
+            'INSERT INTO events (name, hackathon_url, updated_at) VALUES (?, ?, ?) '
+            'ON CONFLICT(name) DO UPDATE SET updated_at = excluded.updated_at, '
+            'hackathon_url = COALESCE(excluded.hackathon_url, events.hackathon_url)',
+            (event, hackathon_url, datetime.now().isoformat())
+        )
+
+        # Content seen before (in this or any other event) is only referenced
+        inserted = self._conn.execute(
+            'INSERT OR IGNORE INTO projects (hash, url, title, submitted_on, summary, data) VALUES (?, ?, ?, ?, ?, ?)',
+            (project_hash, url, project_data.get('title', ''), submission_day(project_data.get('submission_date')),
+             json.dumps(light_fields(project_data), ensure_ascii=False), json.dumps(project_data, ensure_ascii=False))
+        ).rowcount
+        if inserted:
+            technologies = {tech.strip().lower() for tech in project_data.get('technologies', []) if tech.strip()}
+            self._conn.executemany(
+                'INSERT INTO project_technologies (project_hash, technology) VALUES (?, ?)',
+                [(project_hash, tech) for tech in sorted(technologies)]
+            )
+
+        self._conn.execute(
+            'INSERT INTO event_projects (event, url, file, project_hash, is_winner) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT(event, url) DO UPDATE SET file = excluded.file, '
+            'project_hash = excluded.project_hash, is_winner = excluded.is_winner',
+            (event, url, filename, project_hash, int(is_winner))
+        )
+
+    def _collect_garbage(self):
+        """Drop project contents no event references any more"""
+        self._conn.execute(
+            'DELETE FROM projects WHERE hash NOT IN (SELECT project_hash FROM event_projects)'
+        )
+
+    def delete_event(self, event: str):
+        """Forget an event before it is scraped from scratch"""
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM event_projects WHERE event = ?', (event,))
+            self._conn.execute('DELETE FROM events WHERE name = ?', (event,))
+            self._collect_garbage()
+
+    def load_event(self, event: str) -> List[Dict[str, Any]]:
+        """Every project of an event, in file order"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT p.data FROM event_projects e JOIN projects p ON p.hash = e.project_hash '
+                'WHERE e.event = ? ORDER BY e.file',
+                (event,)
+            ).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def load_event_records(self, event: str) -> List[ProjectRecord]:
+        """An event's projects as compact records; full_content, images and links load on first access"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT p.hash, p.summary FROM event_projects e JOIN projects p ON p.hash = e.project_hash '
+                'WHERE e.event = ? ORDER BY e.file',
+                (event,)
+            ).fetchall()
+        return [ProjectRecord.from_dict(json.loads(summary), partial(self.project_data, project_hash))
+                for project_hash, summary in rows]
+
+    def iter_summaries(self):
+        """(event, content hash, summary JSON text) for every event project, by event and file"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT e.event, p.hash, p.summary FROM event_projects e JOIN projects p ON p.hash = e.project_hash '
+                'ORDER BY e.event, e.file'
+            ).fetchall()
+        return rows
+
+    def revision(self) -> str:
+        """Changes whenever an event's projects are written or deleted"""
+        with self._lock:
+            references, last_write = self._conn.execute(
+                'SELECT (SELECT COUNT(*) FROM event_projects), (SELECT MAX(updated_at) FROM events)'
+            ).fetchone()
+        return f"{references}:{last_write}"
+
+    def project_data(self, project_hash: str) -> Optional[Dict[str, Any]]:
+        """Full project dict by content hash"""
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM projects WHERE hash = ?', (project_hash,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def find_projects(self, technology: str = None, since: str = None, winners_only: bool = True,
+                      event: str = None, limit: int = None) -> List[Dict[str, Any]]:
+        """Unique projects across events, e.g. find_projects(technology='flutter', since='2023-01-01')
+
+        since is an ISO date compared against the submission date (projects
+        without one are left out); newest first.
+        """
+        # Each project is returned once, however many events reference it
+        sql = 'SELECT p.data FROM projects p WHERE EXISTS (SELECT 1 FROM event_projects e WHERE e.project_hash = p.hash'
+        params = []
+        if winners_only:
+            sql += ' AND e.is_winner = 1'
+        if event:
+            sql += ' AND e.event = ?'
+            params.append(event)
+        sql += ')'
+        if technology:
+            sql += ' AND p.hash IN (SELECT project_hash FROM project_technologies WHERE technology = ?)'
+            params.append(technology.strip().lower())
+        if since:
+            sql += ' AND p.submitted_on >= ?'
+            params.append(since)
+        sql += ' ORDER BY p.submitted_on DESC, p.url'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def import_folder(self, folder: str, hackathon_url: str = None) -> int:
+        """Import (or re-import) one event folder; returns the number of projects"""
+        event = os.path.basename(os.path.normpath(folder))
+        manifest = EventManifest.load(folder)
+        if manifest:
+            filenames = manifest.files()
+            hackathon_url = hackathon_url or manifest.data.get('hackathon_url')
+        else:
+            filenames = [os.path.basename(path) for path in glob_logical(os.path.join(folder, 'project_*.json'))]
+
+        projects = []
+        for filename in filenames:
+            project_data = read_json(os.path.join(folder, filename))
+            if project_data:
+                projects.append((filename, project_data))
+
+        with self._lock, self._conn:
+            for filename, project_data in projects:
+                self._put_project(event, filename, project_data, hackathon_url, True)
+            self._collect_garbage()
+        return len(projects)
+
+    def import_all(self, base_dir: str) -> Dict[str, int]:
+        """Import every event folder under base_dir"""
+        counts = {}
+        for folder in sorted(glob.glob(os.path.join(base_dir, '*', ''))):
+            if glob_logical(os.path.join(folder, 'project_*.json')):
+                counts[os.path.basename(os.path.normpath(folder))] = self.import_folder(folder)
+        return counts
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Event references vs unique projects stored"""
+        with self._lock:
+            events, references = self._conn.execute(
+                'SELECT COUNT(DISTINCT event), COUNT(*) FROM event_projects'
+            ).fetchone()
+            unique, data_bytes = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM projects').fetchone()
+        return {'events': events, 'project_references': references, 'unique_projects': unique, 'data_bytes': data_bytes}
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_corpus_store() -> CorpusStore:
+    """Return the process-wide corpus store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = CorpusStore()
+    return _store
+
+
+if __name__ == "__main__":
+    base_dir = sys.argv[1] if len(sys.argv) > 1 else 'hackathon-data'
+    counts = get_corpus_store().import_all(base_dir)
+    for event, count in counts.items():
+        print(f"✓ {event}: {count} projects")
+    stats = get_corpus_store().get_stats()
+    print(f"\n✓ Imported {sum(counts.values())} projects from {len(counts)} events into {CORPUS_DB_FILE}")
+    print(f"  {stats['unique_projects']} unique projects, {stats['data_bytes'] / 1024:,.0f} KB of project data")
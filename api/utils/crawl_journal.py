@@ -0,0 +1,103 @@
+"""
+Durable journal of past-hackathon crawl progress
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from api.config.constants import CRAWL_JOURNAL_FILE
+from api.utils.storage import read_json, write_json
+
+# Event states: in_progress until every winner was attempted, then complete (or empty)
+IN_PROGRESS = 'in_progress'
+COMPLETE = 'complete'
+EMPTY = 'empty'
+
+
+class CrawlJournal:
+    """hackathon URL -> status, the winners list found in its gallery, and per-URL progress
+
+    Every change is written to disk straight away, so a crawl that dies
+    mid-event can pick up with the same winners list and skip saved projects.
+    """
+
+    def __init__(self, path=CRAWL_JOURNAL_FILE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._event_locks = {}
+        self.data = read_json(path, {'events': {}})
+
+    def event_lock(self, hackathon_url: str) -> threading.RLock:
+        """Lock held while an event is crawled, so two crawls of it never overlap"""
+        with self._lock:
+            return self._event_locks.setdefault(hackathon_url, threading.RLock())
+
+    def event(self, hackathon_url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.data['events'].get(hackathon_url)
+
+    def is_in_progress(self, hackathon_url: str) -> bool:
+        event = self.event(hackathon_url)
+        return event is not None and event['status'] == IN_PROGRESS
+
+    def in_progress_events(self) -> List[str]:
+        with self._lock:
+            return [url for url, event in self.data['events'].items() if event['status'] == IN_PROGRESS]
+
+    def start_event(self, hackathon_url: str, folder: str, winners: List[Dict[str, Any]]):
+        with self._lock:
+            self.data['events'][hackathon_url] = {
+                'folder': folder,
+                'status': IN_PROGRESS,
+                'started_at': datetime.now().isoformat(),
+                'winners': [{'title': w['title'], 'url': w['url']} for w in winners],
+                'done': {},
+                'failed': []
+            }
+            self._save()
+
+    def pending(self, hackathon_url: str) -> List[Dict[str, Any]]:
+        """Winners not saved yet (previous failures are retried)"""
+        with self._lock:
+            event = self.data['events'][hackathon_url]
+            return [w for w in event['winners'] if w['url'] not in event['done']]
+
+    def mark_done(self, hackathon_url: str, project_url: str, filename: str):
+        with self._lock:
+            event = self.data['events'][hackathon_url]
+            event['done'][project_url] = filename
+            if project_url in event['failed']:
+                event['failed'].remove(project_url)
+            self._save()
+
+    def mark_failed(self, hackathon_url: str, project_urls: List[str]):
+        with self._lock:
+            event = self.data['events'][hackathon_url]
+            event['failed'] = sorted(set(event['failed']) | set(project_urls))
+            self._save()
+
+    def finish_event(self, hackathon_url: str):
+        with self._lock:
+            event = self.data['events'][hackathon_url]
+            event['status'] = COMPLETE if event['done'] else EMPTY
+            event['finished_at'] = datetime.now().isoformat()
+            self._save()
+
+    def _save(self):
+        self.data['updated_at'] = datetime.now().isoformat()
+        write_json(self.path, self.data)
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+
+def get_crawl_journal() -> CrawlJournal:
+    """Return the process-wide crawl journal (one writer for the journal file)"""
+    global _journal
+    if _journal is None:
+        with _journal_lock:
+            if _journal is None:
+                _journal = CrawlJournal()
+    return _journal
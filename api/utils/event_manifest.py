@@ -0,0 +1,114 @@
+"""
+Per-event manifest of scraped winner projects, used for incremental refreshes
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from api.config.constants import EVENT_MANIFEST_FILE
+from api.utils.site_chrome import strip_site_chrome
+from api.utils.storage import glob_logical, read_json, stored_path, write_json
+
+
+def content_hash(project_data: Dict[str, Any]) -> str:
+    """Stable hash of extracted project data (page markup churns; the extracted fields don't)"""
+    canonical = json.dumps(project_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class EventManifest:
+    """manifest.json in a past-hackathon folder: project URL -> file, hash, validators, timestamps"""
+
+    def __init__(self, folder: str, hackathon_url: str = None):
+        self.folder = folder
+        self.path = os.path.join(folder, EVENT_MANIFEST_FILE)
+        self.data = {'hackathon_url': hackathon_url, 'updated_at': None, 'projects': {}}
+
+    @classmethod
+    def load(cls, folder: str) -> Optional['EventManifest']:
+        manifest = cls(folder)
+        data = read_json(manifest.path)
+        if data is None:
+            return None
+        manifest.data = data
+        return manifest
+
+    @classmethod
+    def from_folder(cls, folder: str, hackathon_url: str = None) -> 'EventManifest':
+        """Build a manifest for a folder scraped before manifests existed
+
+        Hashes are taken over chrome-stripped data, as a refresh compares them
+        against stripped pages, and updated_at is the newest file's mtime.
+        """
+        manifest = cls(folder, hackathon_url)
+        for path in glob_logical(os.path.join(folder, 'project_*.json')):
+            project_data = read_json(path, {})
+            if project_data.get('url'):
+                scraped_at = datetime.fromtimestamp(os.path.getmtime(stored_path(path))).isoformat()
+                manifest.data['projects'][project_data['url']] = {
+                    'file': os.path.basename(path),
+                    'title': project_data.get('title', ''),
+                    'content_hash': content_hash(strip_site_chrome(project_data)),
+                    'etag': None,
+                    'last_modified': None,
+                    'scraped_at': scraped_at,
+                    'checked_at': scraped_at
+                }
+        manifest.data['updated_at'] = max((entry['scraped_at'] for entry in manifest.projects.values()), default=None)
+        return manifest
+
+    @property
+    def projects(self) -> Dict[str, Dict[str, Any]]:
+        return self.data['projects']
+
+    @property
+    def updated_at(self) -> Optional[datetime]:
+        """When the event was last scraped or refreshed"""
+        try:
+            return datetime.fromisoformat(self.data['updated_at'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        return self.projects.get(url)
+
+    def files(self):
+        """Project files in the order they were saved"""
+        return sorted(entry['file'] for entry in self.projects.values())
+
+    def next_index(self) -> int:
+        """Index for the next project_NNN_*.json file"""
+        indexes = [int(entry['file'].split('_')[1]) for entry in self.projects.values()
+                   if entry['file'].split('_')[1].isdigit()]
+        return max(indexes, default=0) + 1
+
+    def record(self, url: str, filename: str, project_data: Dict[str, Any], page_meta: Dict[str, Any] = None):
+        """Note a freshly scraped (new or changed) project"""
+        page_meta = page_meta or {}
+        now = datetime.now().isoformat()
+        self.projects[url] = {
+            'file': filename,
+            'title': project_data.get('title', ''),
+            'content_hash': content_hash(project_data),
+            'etag': page_meta.get('etag'),
+            'last_modified': page_meta.get('last_modified'),
+            'scraped_at': now,
+            'checked_at': now
+        }
+
+    def mark_checked(self, url: str, page_meta: Dict[str, Any] = None):
+        """Note that a project was revalidated and found unchanged"""
+        entry = self.projects[url]
+        entry['checked_at'] = datetime.now().isoformat()
+        for key in ('etag', 'last_modified'):
+            if page_meta and page_meta.get(key):
+                entry[key] = page_meta[key]
+
+    def save(self, touch: bool = True):
+        """Write manifest.json; touch=False keeps updated_at (e.g. for a backfilled manifest)"""
+        if touch:
+            self.data['updated_at'] = datetime.now().isoformat()
+        write_json(self.path, self.data)
@@ -0,0 +1,111 @@
+"""
+Pluggable HTML parser backends for BeautifulSoup
+
+Every backend produces a regular BeautifulSoup tree, so extraction code
+stays the same whichever parser builds it:
+
+- html.parser: pure Python, always available
+- lxml: libxml2 based, needs the lxml package
+- selectolax: the lexbor HTML5 engine builds the tree in C and hands it
+  to BeautifulSoup node by node; needs the selectolax package
+
+Call sites that need only a few elements can skip the full DOM: parse_html
+takes a SoupStrainer.
+"""
+
+from bs4 import BeautifulSoup
+from bs4.builder._htmlparser import HTMLParserTreeBuilder
+from bs4.element import Comment
+
+from api.config.constants import HTML_PARSER
+
+PARSER_BACKENDS = ['html.parser', 'lxml', 'selectolax']
+
+
+class SelectolaxTreeBuilder(HTMLParserTreeBuilder):
+    """BeautifulSoup tree builder driven by selectolax's lexbor parser"""
+
+    NAME = 'selectolax'
+    ALTERNATE_NAMES = []
+    features = [NAME]
+
+    def feed(self, markup):
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(markup)
+        soup = self.soup
+
+        # Iterative pre-order walk; a plain tag name on the stack closes that element
+        stack = [tree.root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                soup.handle_endtag(node)
+                continue
+
+            tag = node.tag
+            if tag == '-text':
+                soup.handle_data(node.text_content or '')
+            elif tag == '-comment':
+                soup.endData()
+                soup.handle_data(node.comment_content or '')
+                soup.endData(Comment)
+            elif not tag.startswith('-'):
+                attrs = {name: (value or '') for name, value in node.attributes.items()}
+                soup.handle_starttag(tag, None, None, attrs)
+                stack.append(tag)
+
+                children = []
+                child = node.child
+                while child is not None:
+                    children.append(child)
+                    child = child.next
+                stack.extend(reversed(children))
+
+    def close(self):
+        pass
+
+
+def available_backends():
+    """Parser backends whose libraries are installed"""
+    backends = ['html.parser']
+    try:
+        import lxml  # noqa: F401
+        backends.append('lxml')
+    except ImportError:
+        pass
+    try:
+        import selectolax.lexbor  # noqa: F401
+        backends.append('selectolax')
+    except ImportError:
+        pass
+    return backends
+
+
+_warned_backends = set()
+
+
+def resolve_backend(backend=None):
+    """Pick the requested backend, falling back to html.parser if it isn't installed"""
+    backend = backend or HTML_PARSER
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {backend} (choose from {PARSER_BACKENDS})")
+    if backend not in available_backends():
+        if backend not in _warned_backends:
+            print(f"⚠️ HTML parser '{backend}' is not installed, falling back to html.parser")
+            _warned_backends.add(backend)
+        return 'html.parser'
+    return backend
+
+
+def parse_html(markup, backend=None, parse_only=None):
+    """Parse markup into a BeautifulSoup tree using the configured backend
+
+    With a SoupStrainer as parse_only, only matching elements (and their
+    contents) are built into the tree.
+    """
+    backend = resolve_backend(backend)
+    if backend == 'selectolax':
+        return BeautifulSoup(markup, builder=SelectolaxTreeBuilder, parse_only=parse_only)
+    return BeautifulSoup(markup, backend, parse_only=parse_only)
+
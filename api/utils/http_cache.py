@@ -0,0 +1,208 @@
+"""
+Persistent on-disk HTTP response cache with conditional revalidation
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from api.config.constants import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES, HTTP_CACHE_TTLS
+
+# URL classes, checked in order; each maps onto a TTL in HTTP_CACHE_TTLS
+URL_CLASSES = [
+    ('devpost_search', re.compile(r'^https?://(www\.)?devpost\.com/software/search', re.I)),
+    ('devpost_project', re.compile(r'^https?://(www\.)?devpost\.com/software/', re.I)),
+    ('hackathon_page', re.compile(r'^https?://[^/]+\.devpost\.com(/|$)', re.I)),
+    ('github_api', re.compile(r'^https?://api\.github\.com/', re.I)),
+]
+
+# Response headers worth keeping with a cached body
+STORED_HEADERS = ['Content-Type', 'ETag', 'Last-Modified', 'Date']
+
+
+def classify_url(url: str) -> str:
+    for url_class, pattern in URL_CLASSES:
+        if pattern.match(url):
+            return url_class
+    return 'default'
+
+
+class CacheEntry:
+    def __init__(self, meta: Dict[str, Any], body: bytes):
+        self.meta = meta
+        self.body = body
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.meta['stored_at']
+
+    def is_fresh(self, ttl: float) -> bool:
+        return self.age < ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry"""
+        headers = {}
+        stored = self.meta.get('headers', {})
+        if stored.get('ETag'):
+            headers['If-None-Match'] = stored['ETag']
+        if stored.get('Last-Modified'):
+            headers['If-Modified-Since'] = stored['Last-Modified']
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a requests.Response so callers can't tell it came from disk"""
+        response = requests.Response()
+        response.status_code = self.meta['status']
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.meta.get('headers', {}))
+        response.url = self.meta['url']
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+
+class HttpCache:
+    def __init__(self, cache_dir=HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_BYTES, ttls=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttls = ttls or HTTP_CACHE_TTLS
+        self._lock = threading.Lock()
+        self._size = None  # Lazily computed on first write
+        self.counters = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(classify_url(url), self.ttls['default'])
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        folder = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(folder, key + '.json'), os.path.join(folder, key + '.body')
+
+    def _count(self, counter: str):
+        with self._lock:
+            self.counters[counter] += 1
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+
+        # Body mtime doubles as the last-access time used for LRU eviction
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+        return CacheEntry(meta, body)
+
+    def record_hit(self):
+        self._count('hits')
+
+    def record_miss(self):
+        self._count('misses')
+
+    def store(self, url: str, response: requests.Response):
+        """Persist a 200 response body plus its validators"""
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        meta = {
+            'url': url,
+            'status': response.status_code,
+            'stored_at': time.time(),
+            'headers': {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        }
+
+        old_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+        body = response.content
+        self._write_atomic(body_path, body)
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        self._count('stores')
+
+        self._ensure_size()
+        with self._lock:
+            self._size += len(body) - old_size
+            over_limit = self._size > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def refresh(self, url: str, entry: CacheEntry, response: requests.Response):
+        """A 304 confirmed the entry: restart its TTL and pick up new validators"""
+        meta = dict(entry.meta, stored_at=time.time())
+        for name in STORED_HEADERS:
+            if name in response.headers and name != 'Content-Type':
+                meta['headers'][name] = response.headers[name]
+        meta_path, _ = self._paths(url)
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        entry.meta = meta
+        self._count('revalidated')
+
+    def _write_atomic(self, path: str, data: bytes):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _body_files(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+        files = []
+        for folder in os.listdir(self.cache_dir):
+            folder_path = os.path.join(self.cache_dir, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            for filename in os.listdir(folder_path):
+                if filename.endswith('.body'):
+                    path = os.path.join(folder_path, filename)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _ensure_size(self):
+        if self._size is None:
+            total = sum(size for _, size, _ in self._body_files())
+            with self._lock:
+                if self._size is None:
+                    self._size = total
+
+    def evict(self):
+        """Drop least recently used entries until the cache is under 90% of its limit"""
+        files = sorted(self._body_files())
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * 0.9
+
+        for _, size, body_path in files:
+            if total <= target:
+                break
+            meta_path = body_path[:-len('.body')] + '.json'
+            for path in (body_path, meta_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            self._count('evictions')
+
+        with self._lock:
+            self._size = total
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.counters)
+            stats['bytes'] = self._size
+        lookups = stats['hits'] + stats['revalidated'] + stats['misses']
+        stats['served_locally_ratio'] = round((stats['hits'] + stats['revalidated']) / lookups, 3) if lookups else 0.0
+        return stats
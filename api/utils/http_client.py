@@ -0,0 +1,294 @@
+"""
+Shared, pooled HTTP client used by the scraper and similarity search
+"""
+
+import threading
+from typing import Dict, Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from api.config.constants import (
+    DEFAULT_HEADERS, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
+    HTTP_POOL_BLOCK, HTTP_TIMEOUT, HTTP_MAX_RETRIES, HTTP_CACHE_ENABLED,
+    HTTP_OVERFLOW_POLICY
+)
+from api.utils.http_cache import HttpCache
+from api.utils.rate_limiter import HostRateLimiter
+
+
+def _accept_encoding() -> str:
+    """Advertise brotli only when urllib3 is able to decode it"""
+    try:
+        import brotli  # noqa: F401
+        return 'gzip, deflate, br'
+    except ImportError:
+        pass
+    try:
+        import brotlicffi  # noqa: F401
+        return 'gzip, deflate, br'
+    except ImportError:
+        return 'gzip, deflate'
+
+
+class ConnectionStats:
+    """Thread-safe counters for requests vs. newly opened connections"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hosts = {}
+
+    def _host(self, host):
+        return self.hosts.setdefault(host, {'requests': 0, 'new_connections': 0})
+
+    def record_request(self, host):
+        with self._lock:
+            self._host(host)['requests'] += 1
+
+    def record_new_connection(self, host):
+        with self._lock:
+            self._host(host)['new_connections'] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            hosts = {}
+            for host, counts in self.hosts.items():
+                reused = max(counts['requests'] - counts['new_connections'], 0)
+                hosts[host] = dict(counts, reused_connections=reused)
+
+        total_requests = sum(h['requests'] for h in hosts.values())
+        total_new = sum(h['new_connections'] for h in hosts.values())
+        total_reused = sum(h['reused_connections'] for h in hosts.values())
+        return {
+            'requests': total_requests,
+            'new_connections': total_new,
+            'reused_connections': total_reused,
+            'reuse_ratio': round(total_reused / total_requests, 3) if total_requests else 0.0,
+            'hosts': hosts
+        }
+
+
+class BodyRejected(requests.RequestException):
+    """A streamed body was refused: wrong content type, or over the size cap with policy 'abort'"""
+
+
+def _counting_pool(pool_class, stats):
+    """Build a connection pool class that records every new TCP/TLS connection"""
+
+    class CountingPool(pool_class):
+        def _new_conn(self):
+            stats.record_new_connection(self.host)
+            return super()._new_conn()
+
+    CountingPool.__name__ = f"Counting{pool_class.__name__}"
+    return CountingPool
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose per-host pools report connection creation"""
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _counting_pool(HTTPConnectionPool, self.stats),
+            'https': _counting_pool(HTTPSConnectionPool, self.stats),
+        }
+
+
+class HttpClient:
+    def __init__(self, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 pool_block=HTTP_POOL_BLOCK, timeout=HTTP_TIMEOUT, cache_enabled=HTTP_CACHE_ENABLED):
+        self.timeout = timeout
+        self.stats = ConnectionStats()
+        self.limiter = HostRateLimiter()
+        self.cache = HttpCache() if cache_enabled else None
+        self._body_lock = threading.Lock()
+        self.body_counters = {'streamed': 0, 'truncated': 0, 'aborted': 0, 'rejected_content_type': 0}
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.headers['Accept-Encoding'] = _accept_encoding()
+
+        adapter = PooledAdapter(
+            self.stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url, params=None, headers=None, timeout=None, use_cache=True,
+            max_bytes=None, content_types=None, **kwargs) -> requests.Response:
+        """GET a URL, served from the disk cache when fresh and revalidated when stale
+
+        With max_bytes and/or content_types the body is streamed: a response
+        whose Content-Type doesn't start with one of content_types is rejected
+        unread, and a body over max_bytes is truncated or aborted according to
+        HTTP_OVERFLOW_POLICY. Rejections raise BodyRejected; truncated bodies
+        are never cached.
+        """
+        limited = max_bytes is not None or content_types is not None
+        if limited:
+            kwargs['stream'] = True
+
+        cache = self.cache if use_cache else None
+        if not cache:
+            response = self._fetch(url, params, headers, timeout, **kwargs)
+            return self._read_limited(response, max_bytes, content_types) if limited else response
+
+        full_url = requests.Request('GET', url, params=params).prepare().url
+        entry = cache.lookup(full_url)
+        if entry and entry.is_fresh(cache.ttl_for(full_url)):
+            cache.record_hit()
+            return entry.to_response()
+        if entry:
+            headers = dict(headers or {}, **entry.validators())
+
+        response = self._fetch(url, params, headers, timeout, **kwargs)
+
+        if response.status_code == 304 and entry:
+            response.close()
+            cache.refresh(full_url, entry, response)
+            return entry.to_response()
+        cache.record_miss()
+        if limited:
+            response = self._read_limited(response, max_bytes, content_types)
+        if response.status_code == 200 and not getattr(response, 'truncated', False):
+            cache.store(full_url, response)
+        return response
+
+    def post(self, url, json=None, headers=None, timeout=None, **kwargs) -> requests.Response:
+        """POST over the pooled, rate-limited session (never cached)"""
+        return self._fetch(url, headers=headers, timeout=timeout, method='POST', json=json, **kwargs)
+
+    def _read_limited(self, response, max_bytes, content_types) -> requests.Response:
+        """Read a streamed body under the content-type and size limits"""
+        self._count_body('streamed')
+
+        content_type = response.headers.get('Content-Type', '').lower()
+        if response.status_code == 200 and content_types and content_type and not any(content_type.startswith(t) for t in content_types):
+            response.close()
+            self._count_body('rejected_content_type')
+            raise BodyRejected(f"Unexpected content type {content_type!r} for {response.url}", response=response)
+
+        declared = response.headers.get('Content-Length', '')
+        if max_bytes is not None and HTTP_OVERFLOW_POLICY == 'abort' and declared.isdigit() and int(declared) > max_bytes:
+            response.close()
+            self._count_body('aborted')
+            raise BodyRejected(f"Body of {declared} bytes exceeds {max_bytes} for {response.url}", response=response)
+
+        chunks, size, truncated = [], 0, False
+        for chunk in response.iter_content(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if max_bytes is not None and size > max_bytes:
+                response.close()
+                if HTTP_OVERFLOW_POLICY == 'abort':
+                    self._count_body('aborted')
+                    raise BodyRejected(f"Body exceeds {max_bytes} bytes for {response.url}", response=response)
+                truncated = True
+                break
+        response.close()
+
+        body = b''.join(chunks)
+        if truncated:
+            body = body[:max_bytes]
+            self._count_body('truncated')
+            print(f"  ✂️ Truncated {response.url} to {max_bytes} bytes")
+        response._content = body
+        response._content_consumed = True
+        response.truncated = truncated
+        return response
+
+    def _count_body(self, counter: str):
+        with self._body_lock:
+            self.body_counters[counter] += 1
+
+    def probe(self, url, headers=None, timeout=None) -> bool:
+        """Cheap existence check: HEAD, or the first bytes of a streamed GET if HEAD is refused"""
+        if self.cache:
+            entry = self.cache.lookup(url)
+            if entry and entry.is_fresh(self.cache.ttl_for(url)):
+                return entry.meta['status'] == 200
+
+        try:
+            response = self._fetch(url, headers=headers, timeout=timeout, method='HEAD', allow_redirects=True)
+            if response.status_code in (405, 501):
+                response = self._fetch(url, headers=headers, timeout=timeout, stream=True)
+                next(response.iter_content(1024), b'')
+                response.close()
+            return response.status_code < 400
+        except requests.RequestException:
+            return False
+
+    def _fetch(self, url, params=None, headers=None, timeout=None, method='GET', **kwargs) -> requests.Response:
+        """Send a request over a pooled keep-alive connection, paced by the host's rate limit"""
+        host = urlparse(url).hostname or ''
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            self.limiter.acquire(url)
+            self.stats.record_request(host)
+            response = self.session.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                timeout=timeout or self.timeout,
+                **kwargs
+            )
+            self.limiter.update(url, response)
+
+            if response.status_code != 429 or attempt == HTTP_MAX_RETRIES:
+                return response
+            response.close()
+            print(f"  ⏳ Rate limited by {host}, retrying ({attempt + 1}/{HTTP_MAX_RETRIES})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Connection reuse statistics (handshakes saved = reused_connections)"""
+        return self.stats.snapshot()
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Current pace and back-off counters per host bucket"""
+        return self.limiter.get_stats()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Disk cache hits, 304 revalidations and misses"""
+        return self.cache.get_stats() if self.cache else {}
+
+    def get_body_limit_stats(self) -> Dict[str, Any]:
+        """Streamed bodies and how many were truncated, aborted or rejected by content type"""
+        with self._body_lock:
+            return dict(self.body_counters)
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide shared HTTP client"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
+
+
+def configure_http_client(**kwargs) -> HttpClient:
+    """Replace the shared client, e.g. to change pool sizes"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = HttpClient(**kwargs)
+    return _client
@@ -0,0 +1,100 @@
+"""
+Process-wide LRU of decoded corpus data, invalidated by file mtime or store revision
+
+Every /generate request builds a new IdeaGenerator, which used to re-read
+rules.json and every project of every past hackathon. Entries here are
+keyed by what was loaded (e.g. ('rules', path)) and carry a version: the
+file's mtime and size, or the corpus store revision. A lookup whose version
+still matches is served from memory, with no disk read or JSON decoding.
+A changed version reloads. Cached values are shared between requests and
+must be treated as read-only.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from api.config.constants import LOAD_CACHE_MAX_BYTES
+
+
+def file_version(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of a file, or None if it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class LoadCache:
+    def __init__(self, max_bytes=LOAD_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (version, value, cost), least recently used first
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'invalidations': 0, 'evictions': 0}
+
+    def get(self, key: Hashable, version: Any, loader: Callable[[], Tuple[Any, int]]) -> Any:
+        """Cached value for key if stored under the same version, else loader() -> (value, approximate bytes)
+
+        None values are not cached (they mean "nothing to load" to the callers).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.counters['hits'] += 1
+                return entry[1]
+            if entry is not None:
+                self._remove(key)
+                self.counters['invalidations'] += 1
+            self.counters['misses'] += 1
+
+        # Load outside the lock; two threads may load the same key, the last one wins
+        value, cost = loader()
+        if value is None or cost > self.max_bytes:
+            return value
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (version, value, cost)
+            self._bytes += cost
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.counters['evictions'] += 1
+        return value
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def _remove(self, key):
+        _, _, cost = self._entries.pop(key)
+        self._bytes -= cost
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.counters)
+            stats['entries'] = len(self._entries)
+            stats['bytes'] = self._bytes
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_load_cache() -> LoadCache:
+    """Return the process-wide load cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LoadCache()
+    return _cache
@@ -0,0 +1,163 @@
+"""
+Memory-mapped packed corpus for sampling past winners without loading them all
+
+corpus.pack holds every event project's summary (the light fields idea
+generation reads) as length-prefixed JSON: a little-endian uint32 byte count,
+then [content hash, summary]. Projects are grouped by event.
+corpus.pack.idx is a flat array of uint64 record offsets, and corpus.pack.json
+maps each event to its (first record, count) range, tagged with the corpus
+store revision it was built from.
+
+Both binary files are opened with mmap. Sampling k winners picks k record
+numbers, looks each offset up in the index and decodes only those records.
+Generation startup therefore doesn't grow with the corpus. Heavy fields
+still load lazily from the corpus store by content hash.
+"""
+
+import json
+import mmap
+import os
+import random
+import struct
+import threading
+from bisect import bisect_right
+from functools import partial
+from typing import List, Dict, Any
+
+from api.config.constants import CORPUS_PACK_FILE
+from api.utils.corpus_store import CorpusStore, get_corpus_store
+from api.utils.load_cache import get_load_cache
+from api.utils.project_record import ProjectRecord
+from api.utils.storage import read_json, write_json
+
+LENGTH = struct.Struct('<I')
+OFFSET = struct.Struct('<Q')
+
+
+class PackedCorpus:
+    def __init__(self, path=CORPUS_PACK_FILE, store: CorpusStore = None):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.meta_path = path + '.json'
+        self.store = store
+        self._lock = threading.Lock()
+        self.meta = None
+        self._files = []
+        self._pack = None
+        self._index = None
+
+    def _store(self) -> CorpusStore:
+        return self.store or get_corpus_store()
+
+    def _ensure_current(self):
+        """(Re)build the pack if the corpus store changed since it was written, then map it"""
+        revision = self._store().revision()
+        if self.meta is not None and self.meta['revision'] == revision:
+            return
+        # Stale maps point at the replaced files, whether we rebuild or another instance did
+        self._close()
+        meta = read_json(self.meta_path)
+        if meta is None or meta.get('revision') != revision or not os.path.exists(self.index_path):
+            meta = self.build(revision)
+        self._open(meta)
+
+    def build(self, revision: str = None) -> Dict[str, Any]:
+        """Write the pack, offset index and event ranges from the corpus store"""
+        revision = revision or self._store().revision()
+        rows = self._store().iter_summaries()
+
+        events, offsets, offset = {}, [], 0
+        tmp_pack, tmp_index = f"{self.path}.{os.getpid()}.tmp", f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_pack, 'wb') as pack, open(tmp_index, 'wb') as index:
+            for i, (event, project_hash, summary) in enumerate(rows):
+                payload = f'[{json.dumps(project_hash)},{summary}]'.encode('utf-8')
+                pack.write(LENGTH.pack(len(payload)))
+                pack.write(payload)
+                index.write(OFFSET.pack(offset))
+                offset += LENGTH.size + len(payload)
+                first, count = events.get(event, (i, 0))
+                events[event] = (first, count + 1)
+        os.replace(tmp_pack, self.path)
+        os.replace(tmp_index, self.index_path)
+
+        # Written last: the revision vouches for the two files above
+        meta = {'revision': revision, 'count': len(rows), 'events': events}
+        write_json(self.meta_path, meta)
+        return meta
+
+    def _open(self, meta: Dict[str, Any]):
+        self.meta = meta
+        if not meta['count']:
+            return
+        for path in (self.path, self.index_path):
+            f = open(path, 'rb')
+            self._files.append(f)
+        self._pack = mmap.mmap(self._files[0].fileno(), 0, access=mmap.ACCESS_READ)
+        self._index = mmap.mmap(self._files[1].fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _close(self):
+        # Maps must be released before the files are replaced (Windows refuses otherwise)
+        for mapped in (self._pack, self._index):
+            if mapped is not None:
+                mapped.close()
+        for f in self._files:
+            f.close()
+        self._pack = self._index = self.meta = None
+        self._files = []
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _record(self, i: int) -> ProjectRecord:
+        def load():
+            offset, = OFFSET.unpack_from(self._index, i * OFFSET.size)
+            length, = LENGTH.unpack_from(self._pack, offset)
+            start = offset + LENGTH.size
+            project_hash, summary = json.loads(self._pack[start:start + length])
+            return ProjectRecord.from_dict(summary, partial(self._store().project_data, project_hash)), length
+
+        # Records drawn by earlier requests are reused while the pack is unchanged
+        return get_load_cache().get(('pack', self.path, i), self.meta['revision'], load)
+
+    def count(self, events: List[str] = None) -> int:
+        with self._lock:
+            self._ensure_current()
+            ranges = self.meta['events']
+            if events is None:
+                return self.meta['count']
+            return sum(ranges[event][1] for event in set(events) if event in ranges)
+
+    def sample(self, events: List[str], k: int, rng: random.Random = None) -> List[ProjectRecord]:
+        """k projects drawn uniformly from the given events' winners, decoding only those k"""
+        rng = rng or random
+        with self._lock:
+            self._ensure_current()
+            ranges = [self.meta['events'][event] for event in dict.fromkeys(events) if event in self.meta['events']]
+
+            # Concatenate the event ranges into one virtual sequence of record numbers
+            starts, total = [], 0
+            for _, count in ranges:
+                starts.append(total)
+                total += count
+
+            picks = rng.sample(range(total), min(k, total))
+            records = []
+            for pick in picks:
+                r = bisect_right(starts, pick) - 1
+                records.append(self._record(ranges[r][0] + pick - starts[r]))
+            return records
+
+
+_corpus = None
+_corpus_lock = threading.Lock()
+
+
+def get_packed_corpus() -> PackedCorpus:
+    """Return the process-wide packed corpus"""
+    global _corpus
+    if _corpus is None:
+        with _corpus_lock:
+            if _corpus is None:
+                _corpus = PackedCorpus()
+    return _corpus
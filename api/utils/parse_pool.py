@@ -0,0 +1,69 @@
+"""
+Process pool for CPU-bound page parsing
+
+Fetch threads hand raw page bytes to worker processes, so parsing runs on
+every core instead of contending for the GIL with the network threads.
+Worker functions are module-level so they can be pickled.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Optional
+
+from api.config.constants import PARSE_PROCESSES
+from api.utils.html_parser import parse_html
+from api.utils.project_extractor import extract_project_data
+
+
+def parse_project_page(markup: bytes, project_url: str, project_title: str, base_url: str,
+                       backend: str = None) -> Dict[str, Any]:
+    """Parse a project page and extract its fields (runs in a worker process)"""
+    soup = parse_html(markup, backend)
+    return extract_project_data(soup, project_url, project_title, base_url)
+
+
+def parse_gallery_page(markup: bytes, base_url: str, backend: str = None) -> Dict[str, Any]:
+    """Parse one project-gallery page into its projects and the gallery's page count (runs in a worker process)"""
+    from api.services.devpost_scraper import DevpostScraper
+
+    scraper = DevpostScraper(base_url, parser=backend)
+    soup = parse_html(markup, backend)
+    if not scraper.is_valid_page(soup):
+        return None
+    return {'projects_data': scraper.extract_projects_data(soup), 'page_count': scraper.extract_page_count(soup)}
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared parse pool, or None to parse in threads
+
+    None is returned when PARSE_PROCESSES is 0, or when it is left at None
+    on a single-core machine where worker processes would only add IPC.
+    """
+    global _pool
+    workers = PARSE_PROCESSES if PARSE_PROCESSES is not None else (os.cpu_count() or 1)
+    if workers == 0 or (PARSE_PROCESSES is None and workers == 1):
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # spawn, not fork: the parent runs HTTP and event-loop threads whose locks must not be copied
+                _pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    return _pool
+
+
+def reset_parse_pool():
+    """Shut the pool down (e.g. after a worker died); the next call starts a fresh one"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,49 @@
+"""
+Permanent URL -> submission details store for Devpost projects
+"""
+
+import threading
+from typing import Dict, Any, Optional
+
+from api.config.constants import PROJECT_DETAILS_STORE
+from api.utils.storage import read_json, write_json
+
+
+class ProjectDetailsStore:
+    """JSON-backed map of project URL -> {'submission_date', 'full_description'}"""
+
+    def __init__(self, path=PROJECT_DETAILS_STORE):
+        self.path = path
+        self._lock = threading.Lock()
+        self._details = None  # Loaded on first use
+
+    def _load(self):
+        if self._details is None:
+            self._details = read_json(self.path, {})
+        return self._details
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._load().get(url)
+
+    def update(self, details: Dict[str, Dict[str, Any]]):
+        """Add a batch of entries and write the store once"""
+        if not details:
+            return
+        with self._lock:
+            self._load().update(details)
+            write_json(self.path, self._details)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_project_details_store() -> ProjectDetailsStore:
+    """Return the process-wide project details store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ProjectDetailsStore()
+    return _store
@@ -0,0 +1,238 @@
+"""
+Single-pass field extraction for Devpost project pages
+"""
+
+from datetime import datetime
+from typing import Dict, Any
+
+from bs4.element import Tag
+
+# Tagline sources in priority order: (kind, value)
+TAGLINE_SELECTORS = [
+    ('id', 'app-tagline'),
+    ('class', 'tagline'),
+    ('class', 'app-tagline'),
+    ('class', 'software-tagline'),
+    ('meta_name', 'description'),
+    ('meta_property', 'og:description'),
+]
+
+# Description containers in priority order: (kind, value)
+DESCRIPTION_SELECTORS = [
+    ('id', 'app-details-left'),
+    ('class', 'app-details'),
+    ('id', 'gallery-body'),
+    ('class', 'project-description'),
+    ('class', 'description'),
+    ('class', 'app-content'),
+    ('id', 'app-details'),
+    ('article_class', 'software-details'),
+    ('class', 'submission-details'),
+]
+
+# span/div elements whose class contains one of these keywords
+TECH_KEYWORDS = ['tech', 'tag', 'skill', 'language']
+TEAM_KEYWORDS = ['team', 'member', 'author', 'creator']
+AWARD_KEYWORDS = ['award', 'prize', 'winner', 'badge']
+
+
+def normalize_page_text(text: str) -> str:
+    """Collapse page text into single-spaced phrases (same rules as extract_text_content)"""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return ' '.join(chunk for chunk in chunks if chunk)
+
+
+def _matches(tag, classes, kind, value):
+    if kind == 'id':
+        return tag.get('id') == value
+    if kind == 'class':
+        return value in classes
+    if kind == 'article_class':
+        return tag.name == 'article' and value in classes
+    if kind == 'meta_name':
+        return tag.name == 'meta' and tag.get('name') == value
+    if kind == 'meta_property':
+        return tag.name == 'meta' and tag.get('property') == value
+    return False
+
+
+class ProjectPageVisitor:
+    """Walks a project page's parse tree once and collects every candidate element
+
+    Mirrors the original selector-by-selector lookups: the first element in
+    document order for each tagline/description selector, the first
+    <time class="timeago">, every matching tech/team/award span or div,
+    every <img>, every <a href>, and the page's visible strings.
+    """
+
+    def __init__(self):
+        self.tagline_candidates = [None] * len(TAGLINE_SELECTORS)
+        self.description_candidates = [None] * len(DESCRIPTION_SELECTORS)
+        self.time_elem = None
+        self.tech_elements = []
+        self.team_elements = []
+        self.award_elements = []
+        self.images = []
+        self.links = []
+        self.strings = []
+
+    def visit(self, soup):
+        # Same string types get_text() keeps: script/style/template contents are
+        # parsed into their own NavigableString subclasses and never match
+        text_types = soup.interesting_string_types
+        if isinstance(text_types, type):
+            text_types = (text_types,)
+
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                self._visit_tag(node)
+            elif type(node) in text_types:
+                self.strings.append(node)
+
+        return self
+
+    def _visit_tag(self, tag):
+        name = tag.name
+        classes = tag.get('class') or []
+        if isinstance(classes, str):
+            classes = classes.split()
+
+        for i, (kind, value) in enumerate(TAGLINE_SELECTORS):
+            if self.tagline_candidates[i] is None and _matches(tag, classes, kind, value):
+                self.tagline_candidates[i] = tag
+        for i, (kind, value) in enumerate(DESCRIPTION_SELECTORS):
+            if self.description_candidates[i] is None and _matches(tag, classes, kind, value):
+                self.description_candidates[i] = tag
+
+        if name == 'time' and self.time_elem is None and 'timeago' in classes:
+            self.time_elem = tag
+
+        if name in ('span', 'div') and classes:
+            class_text = ' '.join(classes).lower()
+            if any(keyword in class_text for keyword in TECH_KEYWORDS):
+                self.tech_elements.append(tag)
+            if any(keyword in class_text for keyword in TEAM_KEYWORDS):
+                self.team_elements.append(tag)
+            if any(keyword in class_text for keyword in AWARD_KEYWORDS):
+                self.award_elements.append(tag)
+        elif name == 'img':
+            self.images.append(tag)
+        elif name == 'a' and tag.get('href') is not None:
+            self.links.append(tag)
+
+
+def first_description(visitor: ProjectPageVisitor) -> str:
+    """Text of the first description container (in priority order) with more than 10 words"""
+    for desc_elem in visitor.description_candidates:
+        if desc_elem is None:
+            continue
+        description = desc_elem.get_text().strip()
+        if description and len(description.split()) > 10:
+            return description
+    return ''
+
+
+def format_submission_date(date_str: str) -> str:
+    """ISO 8601 timestamp -> e.g. Jun 22, 2025"""
+    date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    return date_obj.strftime('%b %d, %Y')
+
+
+def extract_submission_details(soup) -> Dict[str, Any]:
+    """Submission date and full description of a project page, without logging"""
+    visitor = ProjectPageVisitor().visit(soup)
+    submission_date = None
+    if visitor.time_elem is not None and visitor.time_elem.get('datetime'):
+        try:
+            submission_date = format_submission_date(visitor.time_elem.get('datetime'))
+        except ValueError:
+            pass
+    return {'submission_date': submission_date, 'full_description': first_description(visitor)}
+
+
+def extract_project_data(soup, project_url: str, project_title: str, base_url: str) -> Dict[str, Any]:
+    """Extract project details from a parsed project page in a single tree walk"""
+    visitor = ProjectPageVisitor().visit(soup)
+
+    project_data = {
+        'title': project_title,
+        'url': project_url,
+        'tagline': '',
+        'description': '',
+        'technologies': [],
+        'team_members': [],
+        'awards': [],
+        'images': [],
+        'links': [],
+        'full_content': '',
+        'submission_date': None
+    }
+
+    # Tagline: first selector (in priority order) whose element has more than 10 characters
+    for (kind, _), tagline_elem in zip(TAGLINE_SELECTORS, visitor.tagline_candidates):
+        if tagline_elem is None:
+            continue
+        if kind.startswith('meta'):
+            tagline = tagline_elem.get('content', '').strip()
+        else:
+            tagline = tagline_elem.get_text().strip()
+        if tagline and len(tagline) > 10:
+            project_data['tagline'] = tagline
+            print(f"  ✓ Found tagline: {tagline[:50]}...")
+            break
+
+    # Description: first substantial Devpost content area, limited to 300 words
+    description = first_description(visitor)
+    if description:
+        words = description.split()
+        if len(words) > 300:
+            description = ' '.join(words[:300])
+            print(f"  ⚠️ Description truncated from {len(words)} to 300 words")
+
+        project_data['description'] = description
+        print(f"  ✓ Found description ({len(description.split())} words)")
+
+    # Submission date from <time class="timeago" datetime="...">
+    time_elem = visitor.time_elem
+    if time_elem is not None and time_elem.get('datetime'):
+        try:
+            project_data['submission_date'] = format_submission_date(time_elem.get('datetime'))
+            print(f"  ✓ Found submission date: {project_data['submission_date']}")
+        except Exception as e:
+            print(f"  ⚠️ Error parsing date: {e}")
+
+    for tech in visitor.tech_elements:
+        tech_text = tech.get_text().strip()
+        if tech_text and len(tech_text) < 50:  # Reasonable tech name length
+            project_data['technologies'].append(tech_text)
+
+    for member in visitor.team_elements:
+        member_text = member.get_text().strip()
+        if member_text and '@' in member_text:  # Likely an email/username
+            project_data['team_members'].append(member_text)
+
+    for award in visitor.award_elements:
+        award_text = award.get_text().strip()
+        if award_text:
+            project_data['awards'].append(award_text)
+
+    for img in visitor.images:
+        src = img.get('src', '')
+        if src and not src.startswith('data:'):  # Skip data URLs
+            project_data['images'].append({
+                'src': src if src.startswith('http') else base_url + src,
+                'alt': img.get('alt', '')
+            })
+
+    for link in visitor.links:
+        href = link.get('href', '')
+        if href.startswith('http') and 'devpost.com' not in href:
+            project_data['links'].append({
+                'text': link.get_text().strip(),
+                'url': href
+            })
+
+    project_data['full_content'] = normalize_page_text(''.join(visitor.strings))
+
+    return project_data
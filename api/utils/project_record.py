@@ -0,0 +1,145 @@
+"""
+Compact project record shared by the idea generator, similarity checker and API
+
+Projects used to travel as free-form dicts. ProjectRecord keeps each known
+field in a __slots__ attribute: no per-instance __dict__. Tag-like lists
+(technologies, team members, awards) are stored as tuples of interned
+strings. The heavy fields most consumers never read (full_content, images,
+links) can be left out and loaded on first access. A field that was never
+set is simply absent, just like a missing dict key.
+
+Records answer the dict calls the services use (record['url'],
+record.get('tagline', ''), record['ai_similarity'] = 80, ...).
+to_dict() gives back a plain dict for JSON.
+"""
+
+import sys
+from typing import Dict, Any, Callable, Optional
+
+# Fields with a slot, covering scraped winners and similarity search results
+FIELDS = (
+    'title', 'name', 'url', 'platform', 'tagline', 'description', 'technologies', 'team_members',
+    'awards', 'submission_date', 'full_description', 'is_winner', 'likes', 'comments', 'stars',
+    'language', 'full_name', 'created_at', 'updated_at', 'search_query', 'hash',
+    'ai_similarity', 'ai_reasoning',
+)
+# Rarely read and large; loaded on first access when the record has a loader
+HEAVY_FIELDS = ('full_content', 'images', 'links')
+# Lists of short, often repeated strings
+TAG_FIELDS = ('technologies', 'team_members', 'awards')
+
+SLOTTED = frozenset(FIELDS + HEAVY_FIELDS)
+
+
+def _pack_tags(values):
+    return tuple(sys.intern(value) if isinstance(value, str) else value for value in values)
+
+
+class ProjectRecord:
+    __slots__ = FIELDS + HEAVY_FIELDS + ('_loader', '_extra')
+
+    def __init__(self, fields: Dict[str, Any] = None, loader: Callable[[], Dict[str, Any]] = None):
+        """loader returns the full project dict; it is called once, when a missing heavy field is read"""
+        self._loader = loader
+        self._extra = None
+        for key, value in (fields or {}).items():
+            self[key] = value
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], loader: Callable[[], Dict[str, Any]] = None) -> 'ProjectRecord':
+        return cls(data, loader)
+
+    def _load_heavy(self):
+        loader, self._loader = self._loader, None
+        data = loader() or {}
+        for key in HEAVY_FIELDS:
+            if key in data and not self._has(key):
+                setattr(self, key, data[key])
+
+    def _has(self, key: str) -> bool:
+        try:
+            getattr(self, key)
+            return True
+        except AttributeError:
+            return False
+
+    def __getitem__(self, key: str):
+        if key in SLOTTED:
+            if key in HEAVY_FIELDS and self._loader is not None and not self._has(key):
+                self._load_heavy()
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        if key in SLOTTED:
+            if key in TAG_FIELDS and isinstance(value, (list, tuple)):
+                value = _pack_tags(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+            return True
+        except KeyError:
+            return False
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self, include_heavy: bool = True) -> Dict[str, Any]:
+        """Plain dict (lists, not tuples) for JSON; heavy fields are loaded if needed"""
+        if include_heavy and self._loader is not None:
+            self._load_heavy()
+        data = {}
+        for key in FIELDS + (HEAVY_FIELDS if include_heavy else ()):
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
+            data[key] = list(value) if key in TAG_FIELDS else value
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def approximate_size(self) -> int:
+        """Rough in-memory footprint of the loaded fields, for cache accounting"""
+        size = 64 + 8 * len(self.__slots__)
+        for key in FIELDS + HEAVY_FIELDS:
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
+            if isinstance(value, str):
+                size += 49 + len(value)
+            elif isinstance(value, (tuple, list)):
+                size += 56 + 8 * len(value) + sum(len(item) for item in value if isinstance(item, str))
+            else:
+                size += 32
+        return size
+
+    def __repr__(self) -> str:
+        return f"ProjectRecord({self.get('title') or self.get('name')!r}, {self.get('url')!r})"
+
+
+def light_fields(project_data: Dict[str, Any]) -> Dict[str, Any]:
+    """A project dict without its heavy fields"""
+    return {key: value for key, value in project_data.items() if key not in HEAVY_FIELDS}
+
+
+def as_record(project) -> Optional[ProjectRecord]:
+    """Accept either a record or a plain project dict"""
+    if project is None or isinstance(project, ProjectRecord):
+        return project
+    return ProjectRecord.from_dict(project)
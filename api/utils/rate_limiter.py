@@ -0,0 +1,167 @@
+"""
+Adaptive per-host token-bucket rate limiter for outbound requests
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+from api.config.constants import RATE_LIMITS, RATE_LIMIT_MIN_RATE
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.waited = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = max(-self.tokens / self.rate, self.blocked_until - now, 0.0)
+            self.waited += wait
+            return wait
+
+    def is_idle(self) -> bool:
+        """Full burst available at the configured pace, i.e. nobody has used this host lately"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return self.tokens >= self.capacity and self.rate >= self.max_rate and now >= self.blocked_until
+
+    def pause(self, seconds: float):
+        """Block the bucket for a while (e.g. Retry-After)"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = min(self.tokens, 0.0)
+
+    def back_off(self):
+        """Multiplicative decrease after the upstream pushed back"""
+        with self._lock:
+            self.rate = max(self.rate / 2, RATE_LIMIT_MIN_RATE)
+
+    def recover(self):
+        """Additive increase back toward the configured ceiling"""
+        with self._lock:
+            self.rate = min(self.rate + self.max_rate * 0.1, self.max_rate)
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            self.rate = min(max(rate, RATE_LIMIT_MIN_RATE), self.max_rate)
+
+
+class HostRateLimiter:
+    def __init__(self, limits: Dict[str, tuple] = None):
+        self.limits = limits or RATE_LIMITS
+        self.buckets = {}
+        self.throttled = {}
+        self._lock = threading.Lock()
+
+    def bucket_key(self, host: str) -> str:
+        """Map a host onto its configured limit key (exact, then *.suffix, then default)"""
+        host = (host or '').lower()
+        if host.startswith('www.'):
+            host = host[4:]
+        if host in self.limits:
+            return host
+        for pattern in self.limits:
+            if pattern.startswith('*.') and host.endswith(pattern[1:]):
+                return pattern
+        return 'default'
+
+    def get_bucket(self, url: str) -> TokenBucket:
+        key = self.bucket_key(urlparse(url).hostname)
+        with self._lock:
+            if key not in self.buckets:
+                rate, burst = self.limits.get(key, self.limits['default'])
+                self.buckets[key] = TokenBucket(rate, burst)
+            return self.buckets[key]
+
+    def acquire(self, url: str):
+        """Block until a request to this URL's host is allowed"""
+        wait = self.get_bucket(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def has_idle_budget(self, url: str) -> bool:
+        """True when this URL's host has unused budget that background work may spend"""
+        return self.get_bucket(url).is_idle()
+
+    def update(self, url: str, response):
+        """Adapt the host's pace from the response status and rate-limit headers"""
+        bucket = self.get_bucket(url)
+        headers = response.headers
+
+        if response.status_code in (429, 503):
+            bucket.back_off()
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            if retry_after is not None:
+                bucket.pause(retry_after)
+            key = self.bucket_key(urlparse(url).hostname)
+            with self._lock:
+                self.throttled[key] = self.throttled.get(key, 0) + 1
+            return
+
+        # GitHub-style quota headers: spread the remaining budget until the reset
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is not None and reset is not None:
+            try:
+                remaining = int(remaining)
+                seconds_left = max(float(reset) - time.time(), 1.0)
+            except ValueError:
+                remaining = None
+            if remaining is not None:
+                if remaining <= 0:
+                    bucket.pause(seconds_left)
+                else:
+                    bucket.set_rate(remaining / seconds_left)
+                return
+
+        if response.status_code < 400:
+            bucket.recover()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = dict(self.buckets)
+            throttled = dict(self.throttled)
+        return {
+            key: {
+                'rate': round(bucket.rate, 3),
+                'max_rate': bucket.max_rate,
+                'seconds_waited': round(bucket.waited, 2),
+                'throttled_responses': throttled.get(key, 0)
+            }
+            for key, bucket in buckets.items()
+        }
@@ -0,0 +1,42 @@
+"""
+Strip Devpost site chrome (logos, social links, nav and footer text) from project data
+
+Every scraped project page carries the same header and footer: logo images,
+"Devpost for Teams" / social links, and a nav menu plus footer in
+full_content. None of it describes the project, so it is dropped before a
+project is saved, which shrinks the corpus and the prompts built from it.
+"""
+
+import re
+from typing import Dict, Any
+
+from api.config.constants import CHROME_IMAGE_PREFIXES, CHROME_LINK_URLS, CHROME_TEXT_PATTERNS
+
+CHROME_TEXT_RE = [re.compile(pattern, re.S) for pattern in CHROME_TEXT_PATTERNS]
+CHROME_LINKS = {url.rstrip('/') for url in CHROME_LINK_URLS}
+
+
+def is_chrome_image(image: Dict[str, Any]) -> bool:
+    return any(image.get('src', '').startswith(prefix) for prefix in CHROME_IMAGE_PREFIXES)
+
+
+def is_chrome_link(link: Dict[str, Any]) -> bool:
+    return link.get('url', '').rstrip('/') in CHROME_LINKS
+
+
+def strip_chrome_text(text: str) -> str:
+    for pattern in CHROME_TEXT_RE:
+        text = pattern.sub('', text)
+    return ' '.join(text.split())
+
+
+def strip_site_chrome(project_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a project without Devpost's logos, site links and nav/footer text"""
+    cleaned = dict(project_data)
+    if 'images' in cleaned:
+        cleaned['images'] = [image for image in cleaned['images'] if not is_chrome_image(image)]
+    if 'links' in cleaned:
+        cleaned['links'] = [link for link in cleaned['links'] if not is_chrome_link(link)]
+    if cleaned.get('full_content'):
+        cleaned['full_content'] = strip_chrome_text(cleaned['full_content'])
+    return cleaned
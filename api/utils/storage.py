@@ -0,0 +1,164 @@
+"""
+Atomic JSON reads and writes for files under hackathon-data
+
+Writes can be compressed with an opt-in codec (STORAGE_CODEC): 'gzip', or
+'zstd' if the zstandard package is installed. A compressed file keeps its
+logical name plus the codec suffix (rules.json -> rules.json.zst), and
+reads find and decompress whichever variant is on disk, so callers only
+ever deal with logical paths.
+"""
+
+import glob
+import gzip
+import json
+import os
+import threading
+from typing import Any, List, Optional
+
+from api.config.constants import STORAGE_CODEC, STORAGE_COMPRESSION_LEVELS
+
+STORAGE_CODECS = ['gzip', 'zstd']
+CODEC_SUFFIXES = {'zstd': '.zst', 'gzip': '.gz'}
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def available_codecs():
+    """Storage codecs whose libraries are installed"""
+    codecs = ['gzip']
+    try:
+        import zstandard  # noqa: F401
+        codecs.append('zstd')
+    except ImportError:
+        pass
+    return codecs
+
+
+_warned_codecs = set()
+
+
+def resolve_codec(codec=None) -> Optional[str]:
+    """Pick the requested codec (None = plain JSON), falling back to gzip if zstd isn't installed"""
+    codec = codec or STORAGE_CODEC
+    if not codec:
+        return None
+    if codec not in STORAGE_CODECS:
+        raise ValueError(f"Unknown storage codec: {codec} (choose from {STORAGE_CODECS})")
+    if codec not in available_codecs():
+        if codec not in _warned_codecs:
+            print(f"⚠️ Storage codec '{codec}' is not installed, falling back to gzip")
+            _warned_codecs.add(codec)
+        return 'gzip'
+    return codec
+
+
+def logical_path(path: str) -> str:
+    """A stored path without its codec suffix"""
+    for suffix in CODEC_SUFFIXES.values():
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def stored_path(path: str) -> Optional[str]:
+    """The file actually on disk for a logical path (plain or compressed), or None"""
+    for candidate in (path, *(path + suffix for suffix in CODEC_SUFFIXES.values())):
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def glob_logical(pattern: str) -> List[str]:
+    """Sorted logical paths of every file matching pattern in any codec"""
+    paths = set()
+    for candidate in (pattern, *(pattern + suffix for suffix in CODEC_SUFFIXES.values())):
+        paths.update(logical_path(path) for path in glob.glob(candidate))
+    return sorted(paths)
+
+
+def _decompress(raw: bytes) -> bytes:
+    if raw.startswith(GZIP_MAGIC):
+        return gzip.decompress(raw)
+    if raw.startswith(ZSTD_MAGIC):
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("zstd-compressed file, but the zstandard package is not installed")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+    return raw
+
+
+def _compress(raw: bytes, codec: str) -> bytes:
+    level = STORAGE_COMPRESSION_LEVELS[codec]
+    if codec == 'zstd':
+        import zstandard
+        return zstandard.ZstdCompressor(level=level).compress(raw)
+    return gzip.compress(raw, compresslevel=level, mtime=0)
+
+
+def read_text(path: str) -> str:
+    """Text of a logical path, decompressed if it was stored compressed (OSError if missing)"""
+    actual = stored_path(path) or path
+    with open(actual, 'rb') as f:
+        return _decompress(f.read()).decode('utf-8')
+
+
+def read_json(path: str, default: Any = None) -> Any:
+    """Load a JSON file, or return default if it is missing or unreadable"""
+    try:
+        return json.loads(read_text(path))
+    except (OSError, ValueError):
+        return default
+
+
+def _write_atomic(path: str, data: bytes):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_text(path: str, text: str, codec: str = None) -> str:
+    """Write text to a logical path with an optional codec; returns the path written
+
+    Any other variant of the same logical file (plain or another codec) is
+    removed afterwards, so reads never pick up a stale copy.
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    path = logical_path(path)
+    raw = text.encode('utf-8')
+    if codec:
+        actual = path + CODEC_SUFFIXES[codec]
+        raw = _compress(raw, codec)
+    else:
+        actual = path
+    _write_atomic(actual, raw)
+
+    for stale in (path, *(path + suffix for suffix in CODEC_SUFFIXES.values())):
+        if stale != actual and os.path.exists(stale):
+            os.remove(stale)
+    return actual
+
+
+def write_json(path: str, data: Any, indent: int = 2, codec: str = None) -> str:
+    """Write JSON via a temp file and rename, so readers never see a half-written file
+
+    Compressed files are written compactly: indentation only pays off for
+    files people open in an editor.
+    """
+    if codec:
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    else:
+        text = json.dumps(data, indent=indent, ensure_ascii=False)
+    return write_text(path, text, codec)
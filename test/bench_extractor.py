@@ -0,0 +1,221 @@
+"""Benchmark single-pass project-page extraction against the original multi-pass code
+
+Usage (from the repo root):
+    python test/bench_extractor.py [--html-dir DIR] [--limit N] [--repeat N]
+
+Times DevpostScraper's project-page extraction (tagline, description, date,
+technologies, team, awards, images, links, full text) per page in CPU time,
+and checks both implementations return identical results.
+"""
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+from datetime import datetime
+
+from bench_pages import load_pages
+from api.utils.html_parser import parse_html
+from api.utils.project_extractor import extract_project_data, normalize_page_text
+
+BASE_URL = "https://devpost.com"
+
+
+def legacy_extract_project_data(soup, project_url, project_title, base_url):
+    """The original multi-pass extraction: one tree search per selector / field"""
+    project_data = {
+        'title': project_title,
+        'url': project_url,
+        'tagline': '',
+        'description': '',
+        'technologies': [],
+        'team_members': [],
+        'awards': [],
+        'images': [],
+        'links': [],
+        'full_content': '',
+        'submission_date': None
+    }
+
+    # Extract tagline first (usually near the top)
+    tagline_selectors = [
+        '#app-tagline',
+        '.tagline',
+        '.app-tagline',
+        '.software-tagline',
+        'meta[name="description"]',
+        'meta[property="og:description"]'
+    ]
+
+    for selector in tagline_selectors:
+        if selector.startswith('meta'):
+            tagline_elem = soup.find('meta', attrs={'name': 'description'} if 'name=' in selector else {'property': 'og:description'})
+            if tagline_elem:
+                tagline = tagline_elem.get('content', '').strip()
+                if tagline and len(tagline) > 10:
+                    project_data['tagline'] = tagline
+                    print(f"  ✓ Found tagline: {tagline[:50]}...")
+                    break
+        else:
+            tagline_elem = soup.select_one(selector)
+            if tagline_elem and tagline_elem.get_text().strip():
+                tagline = tagline_elem.get_text().strip()
+                if len(tagline) > 10:
+                    project_data['tagline'] = tagline
+                    print(f"  ✓ Found tagline: {tagline[:50]}...")
+                    break
+
+    # Extract full description (look for Devpost-specific content areas)
+    desc_selectors = [
+        '#app-details-left',
+        '.app-details',
+        '#gallery-body',
+        '.project-description',
+        '.description',
+        '.app-content',
+        '#app-details',
+        'article.software-details',
+        '.submission-details'
+    ]
+
+    for selector in desc_selectors:
+        desc_elem = soup.select_one(selector)
+        if desc_elem and desc_elem.get_text().strip():
+            description = desc_elem.get_text().strip()
+
+            # Only use if it's substantial (more than just a title)
+            if len(description.split()) > 10:
+                # Limit to 300 words
+                words = description.split()
+                if len(words) > 300:
+                    description = ' '.join(words[:300])
+                    print(f"  ⚠️ Description truncated from {len(words)} to 300 words")
+
+                project_data['description'] = description
+                print(f"  ✓ Found description ({len(description.split())} words)")
+                break
+
+    # Extract submission date from <time> tag
+    time_elem = soup.find('time', class_='timeago')
+    if time_elem and time_elem.get('datetime'):
+        try:
+            # Parse ISO 8601 datetime
+            date_str = time_elem.get('datetime')
+            date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            # Format as "Jun 22, 2025"
+            project_data['submission_date'] = date_obj.strftime('%b %d, %Y')
+            print(f"  ✓ Found submission date: {project_data['submission_date']}")
+        except Exception as e:
+            print(f"  ⚠️ Error parsing date: {e}")
+
+    # Extract technologies used
+    tech_elements = soup.find_all(['span', 'div'], class_=lambda x: x and any(
+        keyword in x.lower() for keyword in ['tech', 'tag', 'skill', 'language']
+    ))
+    for tech in tech_elements:
+        tech_text = tech.get_text().strip()
+        if tech_text and len(tech_text) < 50:  # Reasonable tech name length
+            project_data['technologies'].append(tech_text)
+
+    # Extract team members
+    team_elements = soup.find_all(['div', 'span'], class_=lambda x: x and any(
+        keyword in x.lower() for keyword in ['team', 'member', 'author', 'creator']
+    ))
+    for member in team_elements:
+        member_text = member.get_text().strip()
+        if member_text and '@' in member_text:  # Likely an email/username
+            project_data['team_members'].append(member_text)
+
+    # Extract awards/prizes
+    award_elements = soup.find_all(['div', 'span'], class_=lambda x: x and any(
+        keyword in x.lower() for keyword in ['award', 'prize', 'winner', 'badge']
+    ))
+    for award in award_elements:
+        award_text = award.get_text().strip()
+        if award_text:
+            project_data['awards'].append(award_text)
+
+    # Extract images
+    images = soup.find_all('img')
+    for img in images:
+        src = img.get('src', '')
+        if src and not src.startswith('data:'):  # Skip data URLs
+            project_data['images'].append({
+                'src': src if src.startswith('http') else base_url + src,
+                'alt': img.get('alt', '')
+            })
+
+    # Extract external links
+    links = soup.find_all('a', href=True)
+    for link in links:
+        href = link.get('href', '')
+        if href.startswith('http') and 'devpost.com' not in href:
+            project_data['links'].append({
+                'text': link.get_text().strip(),
+                'url': href
+            })
+
+    # Extract full content
+    for script in soup(["script", "style"]):
+        script.decompose()
+    project_data['full_content'] = normalize_page_text(soup.get_text())
+
+    return project_data
+
+
+def time_extraction(extract, pages, repeat):
+    """Best CPU time per page in ms; every run gets a freshly parsed tree"""
+    times, results = [], []
+    for page in pages:
+        best = float('inf')
+        for _ in range(repeat):
+            soup = parse_html(page['html'])
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.process_time()
+                data = extract(soup, page['url'], page['title'], BASE_URL)
+                best = min(best, time.process_time() - start)
+        times.append(best * 1000)
+        results.append(data)
+    return times, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--html-dir', help='Directory of saved Devpost *.html pages')
+    parser.add_argument('--limit', type=int, help='Only use the first N pages')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per page (best time is kept)')
+    args = parser.parse_args()
+
+    pages, source = load_pages(args.html_dir, args.limit)
+    if not pages:
+        print("❌ No pages to benchmark")
+        return 1
+
+    print("=" * 70)
+    print(f"PROJECT EXTRACTION BENCHMARK - {len(pages)} pages from {source}")
+    print("=" * 70)
+
+    legacy_times, legacy_results = time_extraction(legacy_extract_project_data, pages, args.repeat)
+    single_times, single_results = time_extraction(extract_project_data, pages, args.repeat)
+
+    legacy_ms = statistics.mean(legacy_times)
+    single_ms = statistics.mean(single_times)
+    print(f"{'implementation':<16}{'mean ms/page':>14}{'median':>10}{'max':>10}")
+    print(f"{'multi-pass':<16}{legacy_ms:>14.2f}{statistics.median(legacy_times):>10.2f}{max(legacy_times):>10.2f}")
+    print(f"{'single-pass':<16}{single_ms:>14.2f}{statistics.median(single_times):>10.2f}{max(single_times):>10.2f}")
+    print(f"CPU time per page: {legacy_ms / single_ms:.1f}x faster" if single_ms else "")
+
+    mismatches = [p['url'] for p, a, b in zip(pages, legacy_results, single_results) if a != b]
+    print("-" * 70)
+    if mismatches:
+        for url in mismatches:
+            print(f"   ⚠️ Results differ on {url}")
+        print(f"❌ {len(mismatches)} page(s) extract differently")
+        return 1
+    print("✅ Single-pass results identical to multi-pass extraction")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
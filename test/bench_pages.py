@@ -0,0 +1,140 @@
+"""Load Devpost project pages for the benchmarks in this folder
+
+Pages come from, in order of preference:
+  1. a directory of saved *.html files (--html-dir)
+  2. Devpost project pages stored in the HTTP cache (hackathon-data/.http_cache)
+  3. pages rendered in Devpost's project-page markup from hackathon-data/*/project_*.json
+"""
+import glob
+import html
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from api.config.constants import HTTP_CACHE_DIR
+from api.utils.http_cache import classify_url
+from api.utils.storage import glob_logical, read_json
+
+
+def load_saved_pages(html_dir):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(html_dir, '*.html'))):
+        with open(path, 'rb') as f:
+            name = os.path.splitext(os.path.basename(path))[0]
+            pages.append({'url': f"https://devpost.com/software/{name}", 'title': name, 'html': f.read()})
+    return pages
+
+
+def load_cached_pages(cache_dir=None):
+    cache_dir = cache_dir or os.path.join(ROOT, HTTP_CACHE_DIR)
+    pages = []
+    for meta_path in sorted(glob.glob(os.path.join(cache_dir, '*', '*.json'))):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if classify_url(meta['url']) != 'devpost_project':
+                continue
+            if 'html' not in meta.get('headers', {}).get('Content-Type', ''):
+                continue
+            with open(meta_path[:-len('.json')] + '.body', 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            continue
+        pages.append({'url': meta['url'], 'title': meta['url'].rstrip('/').split('/')[-1], 'html': body})
+    return pages
+
+
+def render_project_page(project):
+    """Rebuild a project page in Devpost's markup from a scraped project JSON"""
+    e = html.escape
+    nav_links = ''.join(
+        f'<li><a href="{e(link["url"])}">{e(link["text"])}</a></li>'
+        for link in project.get('links', []) if 'devpost' in link.get('url', '')
+    )
+    nav_images = ''.join(
+        f'<img src="{e(img["src"])}" alt="{e(img["alt"])}">'
+        for img in project.get('images', [])[:4]
+    )
+    gallery = ''.join(
+        f'<li><a href="{e(img["src"])}"><img src="{e(img["src"])}" alt="{e(img["alt"])}"></a></li>'
+        for img in project.get('images', [])[4:]
+    )
+    paragraphs = ''.join(
+        f'<p>{e(sentence.strip())}.</p>'
+        for sentence in (project.get('description') or '').split('. ') if sentence.strip()
+    )
+    built_with = ''.join(
+        f'<li><span class="cp-tag">{e(tech)}</span></li>'
+        for tech in project.get('technologies', [])
+    )
+    awards = ''.join(
+        f'<li><span class="winner label radius small all-caps">{e(award)}</span></li>'
+        for award in project.get('awards', [])
+    )
+    external_links = ''.join(
+        f'<li><a href="{e(link["url"])}" rel="nofollow">{e(link["text"])}</a></li>'
+        for link in project.get('links', []) if 'devpost' not in link.get('url', '')
+    )
+    submitted = project.get('submission_date') or ''
+    filler = e(project.get('full_content', ''))
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{e(project.get('title', ''))} | Devpost</title>
+<meta name="description" content="{e(project.get('tagline', ''))}">
+<meta property="og:description" content="{e(project.get('tagline', ''))}">
+<link rel="stylesheet" href="/assets/application.css">
+<script>window.dataLayer = window.dataLayer || []; function gtag(){{dataLayer.push(arguments);}}</script>
+<style>.hidden {{ display: none; }}</style>
+</head>
+<body class="software-show">
+<header id="site-header"><nav class="nav"><div class="logo">{nav_images}</div><ul class="menu">{nav_links}</ul></nav></header>
+<div id="container">
+  <section id="app-title-section">
+    <h1 id="app-title">{e(project.get('title', ''))}</h1>
+    <p id="app-tagline" class="large">{e(project.get('tagline', ''))}</p>
+  </section>
+  <div id="gallery"><ul class="no-bullet">{gallery}</ul></div>
+  <div class="row">
+    <div id="app-details-left" class="large-9 columns">
+      <div id="gallery-body">{paragraphs}</div>
+      <div id="built-with"><h2>Built With</h2><ul class="no-bullet inline-list">{built_with}</ul></div>
+      <nav class="app-links section"><h2>Try it out</h2><ul data-role="software-urls" class="no-bullet">{external_links}</ul></nav>
+    </div>
+    <div id="app-details-right" class="large-3 columns">
+      <div class="software-list-content"><ul class="no-bullet">{awards}</ul></div>
+      <p class="submission-date">Submitted <time class="timeago" datetime="{e(submitted)}">{e(submitted)}</time></p>
+    </div>
+  </div>
+  <section class="comments hidden"><p>{filler}</p></section>
+</div>
+<footer id="site-footer"><p>Devpost &copy; 2025</p></footer>
+<script src="/assets/application.js"></script>
+</body>
+</html>""".encode('utf-8')
+
+
+def load_rendered_pages(data_dir=None):
+    data_dir = data_dir or os.path.join(ROOT, 'hackathon-data')
+    pages = []
+    for path in glob_logical(os.path.join(data_dir, '*', 'project_*.json')):
+        project = read_json(path, {})
+        pages.append({'url': project.get('url', path), 'title': project.get('title', ''), 'html': render_project_page(project)})
+    return pages
+
+
+def load_pages(html_dir=None, limit=None):
+    """Return (pages, source description) from the best available source"""
+    if html_dir:
+        pages, source = load_saved_pages(html_dir), f"saved HTML in {html_dir}"
+    else:
+        pages, source = load_cached_pages(), "HTTP cache"
+        if not pages:
+            pages, source = load_rendered_pages(), "pages rendered from hackathon-data JSON"
+    return (pages[:limit] if limit else pages), source
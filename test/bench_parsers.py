@@ -0,0 +1,98 @@
+"""Benchmark HTML parser backends on Devpost project pages
+
+Usage (from the repo root):
+    python test/bench_parsers.py [--html-dir DIR] [--limit N] [--repeat N]
+
+For every installed backend, reports parse and extraction time per page and
+checks that DevpostScraper.extract_project_data returns exactly the same
+result as with html.parser.
+"""
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import time
+
+from bench_pages import load_pages
+from api.services.devpost_scraper import DevpostScraper
+from api.utils.html_parser import available_backends, parse_html
+
+
+def run_backend(backend, pages, repeat):
+    scraper = DevpostScraper("https://devpost.com", parser=backend)
+    parse_times, extract_times, results = [], [], []
+
+    for page in pages:
+        best_parse, best_extract = float('inf'), float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            soup = parse_html(page['html'], backend)
+            parsed = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                data = scraper.extract_project_data(soup, page['url'], page['title'])
+            done = time.perf_counter()
+            best_parse = min(best_parse, parsed - start)
+            best_extract = min(best_extract, done - parsed)
+        parse_times.append(best_parse * 1000)
+        extract_times.append(best_extract * 1000)
+        results.append(data)
+
+    return parse_times, extract_times, results
+
+
+def first_difference(expected, actual):
+    for key in expected:
+        if expected[key] != actual.get(key):
+            return key
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--html-dir', help='Directory of saved Devpost *.html pages')
+    parser.add_argument('--limit', type=int, help='Only use the first N pages')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per page (best time is kept)')
+    args = parser.parse_args()
+
+    pages, source = load_pages(args.html_dir, args.limit)
+    if not pages:
+        print("❌ No pages to benchmark")
+        return 1
+
+    total_kb = sum(len(p['html']) for p in pages) / 1024
+    print("=" * 70)
+    print(f"HTML PARSER BENCHMARK - {len(pages)} pages ({total_kb:,.0f} KB) from {source}")
+    print("=" * 70)
+    print(f"{'backend':<14}{'parse ms/page':>15}{'extract ms/page':>18}{'total ms/page':>16}{'speedup':>10}")
+
+    baseline_total = None
+    baseline_results = None
+    mismatches = 0
+
+    for backend in available_backends():
+        parse_times, extract_times, results = run_backend(backend, pages, args.repeat)
+        parse_ms = statistics.mean(parse_times)
+        extract_ms = statistics.mean(extract_times)
+        total_ms = parse_ms + extract_ms
+
+        if baseline_total is None:
+            baseline_total, baseline_results = total_ms, results
+        speedup = baseline_total / total_ms if total_ms else 0
+        print(f"{backend:<14}{parse_ms:>15.2f}{extract_ms:>18.2f}{total_ms:>16.2f}{speedup:>9.2f}x")
+
+        for page, expected, actual in zip(pages, baseline_results, results):
+            if expected != actual:
+                mismatches += 1
+                print(f"   ⚠️ {backend}: extraction differs on {page['url']} (field: {first_difference(expected, actual)})")
+
+    print("-" * 70)
+    if mismatches:
+        print(f"❌ {mismatches} page(s) extract differently than with html.parser")
+        return 1
+    print("✅ Extraction results identical across backends")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
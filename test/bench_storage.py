@@ -0,0 +1,98 @@
+"""Benchmark storage codecs on the JSON artifacts under hackathon-data
+
+Usage (from the repo root):
+    python test/bench_storage.py [--data-dir DIR] [--repeat N]
+
+Rewrites every rules.json, project_*.json and ai_analysis/*.json file (in
+any codec) into a temporary folder once per codec, then reports the disk
+footprint, write time and load time of each, and checks that every file
+reads back identical to the original.
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from bench_pages import ROOT
+from api.utils.storage import available_codecs, glob_logical, read_json, stored_path, write_json
+
+ARTIFACT_PATTERNS = [
+    os.path.join('*', 'rules.json'),
+    os.path.join('*', 'project_*.json'),
+    os.path.join('*', 'ai_analysis', '*.json'),
+]
+
+
+def load_artifacts(data_dir):
+    artifacts = {}
+    for pattern in ARTIFACT_PATTERNS:
+        for path in glob_logical(os.path.join(data_dir, pattern)):
+            data = read_json(path)
+            if data is not None:
+                artifacts[os.path.relpath(path, data_dir)] = data
+    return artifacts
+
+
+def run_codec(codec, artifacts, repeat):
+    folder = tempfile.mkdtemp(prefix='bench_storage_')
+    try:
+        start = time.perf_counter()
+        written = [write_json(os.path.join(folder, name), data, codec=codec) for name, data in artifacts.items()]
+        write_s = time.perf_counter() - start
+        disk_bytes = sum(os.path.getsize(path) for path in written)
+
+        best_load, loaded = float('inf'), None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            loaded = {name: read_json(os.path.join(folder, name)) for name in artifacts}
+            best_load = min(best_load, time.perf_counter() - start)
+
+        mismatches = [name for name, data in artifacts.items() if loaded.get(name) != data]
+        return disk_bytes, write_s, best_load, mismatches
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--data-dir', default=os.path.join(ROOT, 'hackathon-data'), help='hackathon-data folder to read')
+    parser.add_argument('--repeat', type=int, default=5, help='Load runs per codec (best time is kept)')
+    args = parser.parse_args()
+
+    artifacts = load_artifacts(args.data_dir)
+    if not artifacts:
+        print(f"❌ No JSON artifacts found in {args.data_dir}")
+        return 1
+
+    on_disk = sum(os.path.getsize(stored_path(os.path.join(args.data_dir, name))) for name in artifacts)
+    print("=" * 70)
+    print(f"STORAGE CODEC BENCHMARK - {len(artifacts)} files ({on_disk / 1024:,.0f} KB on disk) from {args.data_dir}")
+    print("=" * 70)
+    print(f"{'codec':<8}{'disk KB':>12}{'ratio':>9}{'write ms':>12}{'load ms':>11}{'load ms/file':>15}")
+
+    baseline_bytes = None
+    mismatches = 0
+    for codec in [None] + available_codecs():
+        disk_bytes, write_s, load_s, differing = run_codec(codec, artifacts, args.repeat)
+        if baseline_bytes is None:
+            baseline_bytes = disk_bytes
+        ratio = baseline_bytes / disk_bytes if disk_bytes else 0
+        print(f"{codec or 'plain':<8}{disk_bytes / 1024:>12,.1f}{ratio:>8.2f}x{write_s * 1000:>12.1f}"
+              f"{load_s * 1000:>11.1f}{load_s * 1000 / len(artifacts):>15.3f}")
+
+        for name in differing:
+            mismatches += 1
+            print(f"   ⚠️ {codec}: {name} reads back differently")
+
+    print("-" * 70)
+    if mismatches:
+        print(f"❌ {mismatches} file(s) did not round-trip")
+        return 1
+    print("✅ Every file round-trips identically in every codec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())